@@ -0,0 +1,60 @@
+""" bench/emit.py
+Measures the ESI emitter (``node2esi``) on a deeply nested if/else script,
+where every ``else`` holds a block (and hence an ``<esi:otherwise>``) with
+further assignments and conditionals inside it.
+
+usage: python bench/emit.py [DEPTH [ROUNDS]]
+"""
+
+import hashlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from js2esi.token.adict import adict  # noqa
+from js2esi.tools import main as cli  # noqa
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def makeScript(depth):
+    lines = []
+    for idx in range(depth):
+        lines.append('if ( QUERY_STRING[\'a\'] == \'%d\' ) {' % (idx,))
+        lines.append('  v%d = \'some "quoted" value\' + HTTP_HOST;' % (idx,))
+        lines.append('} else {')
+        lines.append('  w%d = HTTP_COOKIE[\'c%d\'] + \'-suffix\';' % (idx, idx))
+    lines.append('  z = 1;')
+    lines.extend(['}'] * depth)
+    return '\n'.join(lines) + '\n'
+
+
+def main(depth=300, rounds=5):
+    # note: the emitter (and parser) recurse for every nesting level
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), depth * 50))
+    context = cli.Context()
+    context.filename = '<bench>'
+    context.options = adict.new(verbose=0, lex=False, warn=False)
+    context.errfp = sys.stderr
+    tree = cli.js2node(context, io.StringIO(makeScript(depth)))
+    best = None
+    for _ in range(rounds):
+        out = io.StringIO()
+        start = time.perf_counter()
+        cli.node2esi(context, tree, out)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    output = out.getvalue()
+    print('nesting depth:          %d' % (depth,))
+    print('output size:            %d bytes (sha1 %s)'
+          % (len(output), hashlib.sha1(output.encode('utf-8')).hexdigest()[:12]))
+    print('node2esi:               %8.2f ms' % (best * 1000,))
+
+
+if __name__ == '__main__':
+    main(*[int(e) for e in sys.argv[1:3]])
@@ -0,0 +1,107 @@
+""" bench/imports.py
+Measures the per-import overhead of ``require()`` resolution, comparing a
+lexer/parser that is rebuilt for every source (the historical behaviour)
+against the process-wide machinery cache.
+
+usage: python bench/imports.py [IMPORTS [ROUNDS]]
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from js2esi.token.adict import adict  # noqa
+from js2esi.tools import main as cli  # noqa
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+LIBRARY = '''
+function inline lib%(idx)d_double(v) { return v * 2; }
+
+function lib%(idx)d_trim(v)
+{
+  if ( v == '' )
+    return '';
+  return strip(v);
+}
+'''
+
+
+def makeScripts(dirname, count):
+    entry = []
+    for idx in range(count):
+        with io.open(os.path.join(dirname, 'lib%d.js' % (idx,)), 'w') as fp:
+            fp.write(LIBRARY % dict(idx=idx))
+        entry.append("require('./lib%d.js');" % (idx,))
+    entry.append("v = lib0_double(21);")
+    entry.append("printv(v);")
+    path = os.path.join(dirname, 'entry.js')
+    with io.open(path, 'w') as fp:
+        fp.write('\n'.join(entry) + '\n')
+    return path
+
+
+def compileOnce(path, rebuild):
+    context = cli.Context()
+    context.filename = path
+    context.options = adict.new(verbose=0, lex=False, warn=False)
+    context.errfp = sys.stderr
+    if rebuild:
+        # emulate building the lexer & parser for every source...
+        js2node = cli.js2node
+
+        def uncached(ctxt, src):
+            cli.clearMachinery()
+            return js2node(ctxt, src)
+        cli.js2node = uncached
+    try:
+        with io.open(path, 'r') as src:
+            tree = cli.js2node(context, src)
+        cli.resolveImports(context, tree)
+        tree.optimize(7)
+        cli.node2esi(context, tree, io.StringIO())
+    finally:
+        if rebuild:
+            cli.js2node = js2node
+
+
+def measure(path, rebuild, rounds):
+    best = None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        compileOnce(path, rebuild)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(imports=40, rounds=5):
+    dirname = tempfile.mkdtemp(prefix='js2esi-bench-')
+    try:
+        # warm up the cache so that only steady-state costs are measured
+        path = makeScripts(dirname, 0)
+        compileOnce(path, False)
+        bbase = measure(path, True, rounds)
+        abase = measure(path, False, rounds)
+        path = makeScripts(dirname, imports)
+        before = measure(path, True, rounds)
+        after = measure(path, False, rounds)
+    finally:
+        shutil.rmtree(dirname)
+    print('imports per script:     %d' % (imports,))
+    print('rebuild per source:     %8.2f ms total, %6.3f ms/import'
+          % (before * 1000, (before - bbase) * 1000 / imports))
+    print('cached machinery:       %8.2f ms total, %6.3f ms/import'
+          % (after * 1000, (after - abase) * 1000 / imports))
+    print('speedup:                %8.2fx' % (before / after,))
+
+
+if __name__ == '__main__':
+    main(*[int(e) for e in sys.argv[1:3]])
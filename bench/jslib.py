@@ -0,0 +1,96 @@
+""" bench/jslib.py
+Measures the cost of resolving ``require()`` paths against a long JSLIB
+path, comparing an ``open()`` attempt per lookup directory (the historical
+behaviour) against the JSLIB path index.
+
+usage: python bench/jslib.py [DIRECTORIES [IMPORTS]]
+"""
+
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from js2esi.token.adict import adict  # noqa
+from js2esi.tools import main as cli  # noqa
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def makeLibraries(dirname, count, imports):
+    '''
+    Creates ``count`` library directories, with the ``imports`` modules all
+    in the last one (i.e. the worst case: every lookup directory is tried).
+    '''
+    libs = []
+    for idx in range(count):
+        lib = os.path.join(dirname, 'lib%d' % (idx,))
+        os.makedirs(os.path.join(lib, 'sub'))
+        with io.open(os.path.join(lib, 'sub', 'other.js'), 'w') as fp:
+            fp.write('v = 1;\n')
+        libs.append(lib)
+    names = ['sub/mod%d.js' % (idx,) for idx in range(imports)]
+    for name in names:
+        with io.open(os.path.join(libs[-1], name), 'w') as fp:
+            fp.write('v = 1;\n')
+    return libs, names
+
+
+def probe(libs, src):
+    for lib in libs:
+        path = os.path.abspath(os.path.join(lib, src))
+        try:
+            io.open(path, 'r').close()
+        except Exception:
+            continue
+        return path
+    return None
+
+
+def main(count=50, imports=200):
+    dirname = tempfile.mkdtemp(prefix='js2esi-bench-')
+    try:
+        libs, names = makeLibraries(dirname, count, imports)
+        context = cli.Context()
+        context.options = adict.new(verbose=0)
+        context.lib = libs
+        frompath = os.path.join(dirname, 'entry.js')
+
+        start = time.perf_counter()
+        for name in names:
+            assert probe(libs, name) is not None
+        before = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for name in names:
+            cli.findImport(context, name, frompath)
+        scan = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for name in names:
+            assert cli.findImport(context, name, frompath) is not None
+        after = time.perf_counter() - start
+
+        start = time.perf_counter()
+        context.libindex.refresh()
+        refresh = time.perf_counter() - start
+    finally:
+        shutil.rmtree(dirname)
+    print('lookup directories:     %d' % (count,))
+    print('imports:                %d' % (imports,))
+    print('open() per directory:   %8.2f ms total, %6.3f ms/import'
+          % (before * 1000, before * 1000 / imports))
+    print('index (incl. scan):     %8.2f ms total' % (scan * 1000,))
+    print('index (warm):           %8.2f ms total, %6.3f ms/import'
+          % (after * 1000, after * 1000 / imports))
+    print('index refresh:          %8.2f ms' % (refresh * 1000,))
+
+
+if __name__ == '__main__':
+    main(*[int(e) for e in sys.argv[1:3]])
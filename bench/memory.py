@@ -0,0 +1,102 @@
+""" bench/memory.py
+Measures the memory used by the node tree of a large synthetic script: the
+peak RSS of parsing it (and of parsing and optimizing it), each measured in a
+fresh process, plus the memory retained by the parsed tree (as reported by
+``tracemalloc``).
+
+usage: python bench/memory.py [STATEMENTS]
+"""
+
+import io
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from js2esi.token.adict import adict  # noqa
+from js2esi.tools import main as cli  # noqa
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def makeScript(count):
+    # note: no inline function calls, since every inlining walks the whole tree
+    lines = ['function twice(x) { return x * 2; }']
+    for idx in range(count):
+        lines.append('v%d = {"k": [twice(%d), LIST[%d] + 3 * 4], "s": "a" + "b"};' % (idx, idx, idx))
+        lines.append('if ( HTTP_HOST == "h%d" && !(QUERY_STRING["q"] matches "x%d") ) {'
+                     ' w = v%d["k"]; } else { debug("no", v%d); }' % (idx, idx, idx, idx))
+        lines.append('for ( const e of LIST ) { print(e + "%d"); }' % (idx,))
+    return '\n'.join(lines) + '\n'
+
+
+def parse(script, optimize=False):
+    context = cli.Context()
+    context.filename = '<bench>'
+    context.options = adict.new(verbose=0, lex=False, warn=False)
+    context.errfp = sys.stderr
+    tree = cli.js2node(context, io.StringIO(script))
+    if optimize:
+        tree = tree.optimize(7)
+    return tree
+
+
+def peakRss():
+    # note: ru_maxrss is in kilobytes on linux, but in bytes on macos
+    ret = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return ret * 1024 if sys.platform != 'darwin' else ret
+
+
+def child(phase, count):
+    script = makeScript(count)
+    # load the lexers and parsers before taking the baseline
+    parse('v = 1;')
+    base = peakRss()
+    start = time.perf_counter()
+    if phase != 'none':
+        tree = parse(script, optimize=(phase == 'optimize'))  # noqa
+    elapsed = time.perf_counter() - start
+    print('%d %d %f' % (base, peakRss(), elapsed))
+
+
+def measure(phase, count):
+    out = subprocess.check_output([sys.executable, os.path.abspath(__file__), '--child', phase, str(count)])
+    base, peak, elapsed = out.split()
+    return int(base), int(peak), float(elapsed)
+
+
+def main(count=5000):
+    # note: the children are started first, since (on linux) the peak RSS of
+    #       a process is inherited by the processes that it forks
+    results = [(phase,) + measure(phase, count) for phase in ('parse', 'optimize')]
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+    script = makeScript(count)
+    parse('v = 1;')
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = parse(script)
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    from js2esi import node
+    nodes = 1 + sum(1 for _ in node.allchildren(tree))
+    print('statements:             %d (%d bytes of js)' % (count * 3, len(script)))
+    print('nodes:                  %d' % (nodes,))
+    print('retained by the tree:   %8.1f MiB (%d bytes/node)'
+          % (retained / 1048576.0, retained / nodes))
+    for phase, base, peak, elapsed in results:
+        print('peak RSS (%-8s):     %8.1f MiB (+%.1f MiB over start-up), %.2f s'
+              % (phase, peak / 1048576.0, (peak - base) / 1048576.0, elapsed))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+        child(sys.argv[2], int(sys.argv[3]))
+    else:
+        main(*[int(e) for e in sys.argv[1:2]])
@@ -0,0 +1,47 @@
+""" bench/optimize.py
+Measures the optimizer on a script with many calls to inline functions and
+many foldable literal expressions, at increasing sizes (the optimization
+time should grow linearly with the size of the script).
+
+usage: python bench/optimize.py [CALLS...]
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from js2esi.token.adict import adict  # noqa
+from js2esi.tools import main as cli  # noqa
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def makeScript(count):
+    lines = ['function inline twice(x) { return x * 2; }',
+             'function inline quad(x) { return twice(twice(x)); }']
+    for idx in range(count):
+        lines.append('v%d = quad(%d) + twice(w%d) + (1 + 2) * 3;' % (idx, idx, idx))
+    return '\n'.join(lines) + '\n'
+
+
+def main(*counts):
+    context = cli.Context()
+    context.filename = '<bench>'
+    context.options = adict.new(verbose=0, lex=False, warn=False)
+    context.errfp = sys.stderr
+    for count in counts or (250, 500, 1000, 2000):
+        tree = cli.js2node(context, io.StringIO(makeScript(count)))
+        start = time.perf_counter()
+        tree.optimize(7)
+        elapsed = time.perf_counter() - start
+        print('%6d inline calls:     %9.2f ms (%.3f ms/call)'
+              % (count * 2, elapsed * 1000, elapsed * 1000 / (count * 2)))
+
+
+if __name__ == '__main__':
+    main(*[int(e) for e in sys.argv[1:]])
@@ -0,0 +1,67 @@
+""" bench/startup.py
+Measures the cold-start wall-clock time of the ``js2esi`` command line for
+``--version`` and for a trivial compile, and checks them against a budget.
+Each measurement is a fresh interpreter, so this includes python start-up,
+module imports and the loading of the lexer/parser tables.
+
+usage: python bench/startup.py [ROUNDS]
+
+Exits with a non-zero status if the median of either measurement exceeds
+its budget.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# cold-start budgets, in milliseconds (median over all rounds)
+BUDGETS = {
+    'version': 150,
+    'compile': 200,
+}
+
+
+def run(args, rounds):
+    here = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    env = dict(os.environ, PYTHONPATH=here)
+    cmd = [sys.executable, '-m', 'js2esi.tools.main'] + args
+    # once to compile the bytecode...
+    subprocess.check_call(cmd, env=env, stdout=subprocess.DEVNULL)
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        subprocess.check_call(cmd, env=env, stdout=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main(rounds=10):
+    fd, path = tempfile.mkstemp(suffix='.js')
+    try:
+        with os.fdopen(fd, 'w') as fp:
+            fp.write('v = 1;\nprintv(v);\n')
+        results = {
+            'version': run(['--version'], rounds),
+            'compile': run(['-w', path], rounds),
+        }
+    finally:
+        os.unlink(path)
+    ret = 0
+    for name in sorted(results):
+        over = results[name] > BUDGETS[name]
+        print('%-8s %8.1f ms (budget: %d ms)%s'
+              % (name, results[name], BUDGETS[name], over and ' OVER BUDGET' or ''))
+        if over:
+            ret = 1
+    return ret
+
+
+if __name__ == '__main__':
+    sys.exit(main(*[int(e) for e in sys.argv[1:2]]))
@@ -0,0 +1,81 @@
+""" bench/walk.py
+Measures full-tree walks on a deep tree (a chain of nested operators) and a
+wide tree (a block with a great many statements), comparing a recursive
+generator (the historical ``node.util.allchildren``) against the iterative
+``allchildren`` and ``node.Visitor``.
+
+usage: python bench/walk.py [DEPTH [WIDTH]]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from js2esi import node  # noqa
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def recursive(item):
+    for sub in item.children:
+        yield sub
+        for i in recursive(sub):
+            yield i
+
+
+class Counter(node.Visitor):
+    def __init__(self):
+        self.count = 0
+
+    def visit_Item(self, item):
+        self.count += 1
+
+
+def makeDeep(depth):
+    ret = node.Variable('v')
+    for idx in range(depth):
+        ret = node.Not(ret)
+    return ret
+
+
+def makeWide(width):
+    return node.Block(*[node.Assign('v', node.Literal(idx)) for idx in range(width // 2)])
+
+
+def timed(func):
+    start = time.perf_counter()
+    count = func()
+    return count, time.perf_counter() - start
+
+
+def main(depth=10000, width=1000000):
+    for label, tree in (('deep (%d levels)' % (depth,), makeDeep(depth)),
+                        ('wide (%d nodes)' % (width,), makeWide(width))):
+        print('%s:' % (label,))
+        limit = sys.getrecursionlimit()
+        # note: each nesting level is a generator frame
+        sys.setrecursionlimit(max(limit, depth * 3))
+        try:
+            count, elapsed = timed(lambda: 1 + sum(1 for _ in recursive(tree)))
+            print('  recursive generator:  %9.1f ms (%d nodes)' % (elapsed * 1000, count))
+        except RecursionError:
+            print('  recursive generator:  recursion limit exceeded')
+        finally:
+            sys.setrecursionlimit(limit)
+        count, elapsed = timed(lambda: 1 + sum(1 for _ in node.allchildren(tree)))
+        print('  allchildren:          %9.1f ms (%d nodes)' % (elapsed * 1000, count))
+
+        def visit():
+            counter = Counter()
+            counter.walk(tree)
+            return counter.count
+        count, elapsed = timed(visit)
+        print('  Visitor.walk:         %9.1f ms (%d nodes)' % (elapsed * 1000, count))
+
+
+if __name__ == '__main__':
+    main(*[int(e) for e in sys.argv[1:3]])
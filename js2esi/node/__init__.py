@@ -12,4 +12,6 @@ from js2esi.node.tryexcept import *
 from js2esi.node.include import *
 from js2esi.node.package import *
 from js2esi.node.log import *
+from js2esi.node.visitor import *
+from js2esi.node.index import *
 from js2esi.node.util import *
@@ -11,76 +11,122 @@ __copyright__ = "Copyright 2017, Akamai Technologies"
 __license__ = "Apache2"
 
 
+# the version of the attribute layout of the node classes. since parsed trees
+# are pickled by the on-disk module cache, this must be incremented whenever
+# node attributes are added, removed or renamed.
+LAYOUT = 4
+
+
 class StructureError(Exception): pass
 
 
-def _getSubItems(item):
-    if item is None:
+def _getSubItems(value):
+    # the nodes in the value of a child field: a node, or a list/tuple of
+    # nodes (or of tuples of nodes, e.g. the Dictionary key/value pairs)
+    if isinstance(value, Item):
+        yield value
         return
-    if isinstance(item, Item):
-        yield item
+    if isinstance(value, (list, tuple)):
+        for v in value:
+            if isinstance(v, Item):
+                yield v
+            elif isinstance(v, (list, tuple)):
+                for i in _getSubItems(v):
+                    yield i
+
+
+def _getSubSlots(value, path=()):
+    # same as _getSubItems(), but yields ``(node, path)``, where the path is
+    # the index of the node in the value, with one index per nesting level.
+    if isinstance(value, Item):
+        yield value, path
         return
-    if isinstance(item, str):
+    if not isinstance(value, (list, tuple)):
         return
-    try:
-        # try it as a dict-like object...
-        for k, v in item.items():
-            for i in _getSubItems(k):
-                yield i
-            for i in _getSubItems(v):
+    for idx, v in enumerate(value):
+        if isinstance(v, Item):
+            yield v, path + (idx,)
+        elif isinstance(v, (list, tuple)):
+            for i in _getSubSlots(v, path + (idx,)):
                 yield i
-    except AttributeError:
-        pass
-    try:
-        # try it as a list-like object...
-        for v in item:
-            for i in _getSubItems(v):
-                yield i
-    except TypeError:
-        pass
-    return
-
-
-def _resolveProxies(item):
-    if item is None:
-        return item
-    if isinstance(item, Item):
-        if item._proxy is not None:
-            return _resolveProxies(item._proxy)
-        item.__dict__ = _resolveProxies(item.__dict__)
-        return item
-    if isinstance(item, str):
-        return item
-    try:
-        # try it as a dict-like object...
-        newdict = {}
-        for k, v in item.items():
-            newdict[_resolveProxies(k)] = _resolveProxies(v)
-        return newdict
-    except AttributeError:
-        pass
-    try:
-        # try it as a list-like object...
-        return [_resolveProxies(e) for e in item]
-    except TypeError:
-        pass
-    return item
+
+
+def _replaced(container, path, new):
+    # returns ``container`` with the element at ``path`` replaced by ``new``:
+    # lists are modified in place, tuples are copied.
+    idx = path[0]
+    value = new if len(path) == 1 else _replaced(container[idx], path[1:], new)
+    if isinstance(container, list):
+        container[idx] = value
+        return container
+    return container[:idx] + (value,) + container[idx + 1:]
+
+
+# the objects notified of every Item.replace() and Item.remove() (see
+# node.NodeIndex)
+_observers = []
+
+# class => the names of the slots that are pickled (and deep-copied)
+_statenames = dict()
+
+
+def _getStateNames(kls):
+    ret = _statenames.get(kls)
+    if ret is None:
+        ret = []
+        for k in reversed(kls.__mro__):
+            ret.extend(e for e in k.__dict__.get('__slots__', ()) if e not in ('_parent', '_slot'))
+        ret = _statenames[kls] = tuple(ret)
+    return ret
 
 
 class Item(object):
+    # note: all node classes declare ``__slots__`` (empty if they add no
+    #       attributes), which keeps instances free of a per-instance
+    #       ``__dict__``: large libraries parse into hundreds of thousands of
+    #       nodes.
+    # note: ``_parent`` and ``_slot`` locate this node in its parent (see
+    #       :meth:`link` and :meth:`replace`). the slot is ``(field, path)``,
+    #       where ``path`` is the index of the node in the field's list or
+    #       tuple (empty if the field holds the node itself).
+    __slots__ = ('_parent', '_slot')
+
+    # the names of the attributes that hold the child nodes (either a node, or
+    # a list/tuple of nodes), in order. subclasses that add children must
+    # extend this.
+    _fields = ()
+
     def __init__(self, *args, **kwargs):
-        self._proxy = None
+        self._parent = None
+        self._slot = None
+
+    def __getstate__(self):
+        # note: the parent is not part of the state, since deep-copying (or
+        #       pickling) a subtree must not copy the tree around it. copies
+        #       are unlinked until they are put in place with replace().
+        state = dict()
+        for k in _getStateNames(self.__class__):
+            try:
+                state[k] = getattr(self, k)
+            except AttributeError:
+                pass
+        return (None, state)
+
+    def __setstate__(self, state):
+        self._parent = None
+        self._slot = None
+        for k, v in state[1].items():
+            setattr(self, k, v)
 
     def __esi__(self, context):
         raise NotImplementedError('%s.__esi__' % self.__class__.__name__)
 
     def esi(self, context, isvars=False):
-        nodehier = getattr(context, 'nodehier', [])
         pisvars = context.isvars
         context.isvars = isvars
-        context.nodehier = nodehier + [self]
+        context.nodehier.append(self)
         self.__esi__(context)
-        context.nodehier = nodehier
+        context.nodehier.pop()
         context.isvars = pisvars
         return self
 
@@ -95,10 +141,9 @@ class Item(object):
         raise NotImplementedError('%s.__js__' % self.__class__.__name__)
 
     def js(self, context):
-        nodehier = getattr(context, 'nodehier', [])
-        context.nodehier = nodehier + [self]
+        context.nodehier.append(self)
         self.__js__(context)
-        context.nodehier = nodehier
+        context.nodehier.pop()
         return self
 
     def jsbuf(self, context=None):
@@ -124,146 +169,103 @@ class Item(object):
 
     @property
     def children(self):
-        for k, v in self.__dict__.items():
-            if k == '_proxy':
+        for field in self._fields:
+            value = getattr(self, field)
+            if value is None:
                 continue
-            for i in _getSubItems(v):
+            if isinstance(value, Item):
+                yield value
+                continue
+            for i in _getSubItems(value):
                 yield i
 
-    def optimize(self, level=7):
+    @property
+    def parent(self):
+        return self._parent
+
+    def link(self):
+        '''
+        Sets the parent and slot of all the nodes in this subtree, so that
+        they can be replaced with :meth:`replace`. Trees built (or modified)
+        by other means than :meth:`replace` must be re-linked before their
+        nodes are replaced.
+        '''
+        stack = [self]
+        while len(stack) > 0:
+            item = stack.pop()
+            for field in item._fields:
+                value = getattr(item, field)
+                if value is None:
+                    continue
+                for sub, path in _getSubSlots(value):
+                    sub._parent = item
+                    sub._slot = (field, path)
+                    stack.append(sub)
+        return self
+
+    def replace(self, new):
+        '''
+        Replaces this node by ``new`` in its parent, in O(1) (plus the
+        linking of ``new``'s subtree), and returns ``new``. This node is left
+        unlinked. Note that the root of a tree has no parent: if this node
+        may be the root, the caller must keep track of the returned node.
+        '''
+        parent = self._parent
+        if new is self:
+            return new
+        if parent is not None:
+            field, path = self._slot
+            if len(path) == 0:
+                setattr(parent, field, new)
+            else:
+                setattr(parent, field, _replaced(getattr(parent, field), path, new))
+        new._parent = parent
+        new._slot = self._slot
+        new.link()
+        self._parent = None
+        self._slot = None
+        for observer in _observers:
+            observer.replaced(self, new)
+        return new
+
+    def remove(self):
+        '''
+        Removes this node from the list that holds it in its parent (e.g. a
+        statement from its block), and returns it, unlinked. The nodes that
+        follow it in the list are re-linked.
+        '''
+        parent = self._parent
+        if parent is None:
+            raise StructureError('the root of a tree cannot be removed')
+        field, path = self._slot
+        container = getattr(parent, field)
+        for idx in path[:-1]:
+            container = container[idx]
+        if len(path) == 0 or not isinstance(container, list):
+            raise StructureError('%s is not held in a list, and cannot be removed' % (self.__label__,))
+        del container[path[-1]]
+        for idx in range(path[-1], len(container)):
+            for sub, subpath in _getSubSlots(container[idx], path[:-1] + (idx,)):
+                sub._slot = (field, subpath)
+        self._parent = None
+        self._slot = None
+        for observer in _observers:
+            observer.removed(self)
+        return self
+
+    def optimize(self, level=7, keep=(), renames=None):
         '''
         Optimize this node node (and all of it\'s children). The ``level``
         parameter indicates how aggressively to optimize the tree - with the
         trade-off being time-to-finish. Currently, the following levels exist:
           3+: collapse all literals, e.g. 3+4 becomes 7
           5+: resolve inline functions
-          6+: (TODO) inline hardcoded variable values (but keep declarations)
+          6+: inline hardcoded variable values (but keep declarations)
           7+: (TODO) examine all functions for inline-ability, but keep
               definitions around (in case this script gets included via "eval")
-          8:  (TODO) remove auto-inlined functions and unused variables
-          9:  (TODO) rename functions and variables to be shorter
+          8:  remove auto-inlined functions and unused variables
+          9:  rename functions and variables to be shorter (except those in
+              ``keep``), filling ``renames`` (if given) with the renames
         '''
-        from js2esi.node import util
-        from js2esi.node.function import FunctionDefinition
-        from js2esi.node.expression import FunctionCall, Operator, Not
-        from js2esi.node.literal import Literal
-
-        ret = self
-
-        if level < 5:
-            # un-inline all inline functions
-            for fdef in util.allchildren(ret, FunctionDefinition):
-                fdef.inline = False
-        else:
-            inlines = {}
-            for fdef in util.allchildren(ret, FunctionDefinition, lambda f: f.inline):
-                inlines[fdef.name] = fdef
-            # tbd: see below for comments on better ways of detecting recursively
-            #      inlined functions... instead of states, i could use a stack of
-            #      inlining functions.
-            # TODO: this process seems *much* more processor intensive that it needs to
-            #      be... need to review exactly why this is necessary...
-            # process:
-            #   - first iteratively resolve inlines within inlined function definitions
-            #     (this is to create completely self-contained inlined function defs)
-            #     note that this loop is so that at each step, inlining only happens
-            #     for function calls to function definitions that do not, in turn, also
-            #     inline. this is for two reasons: a) prevent recursive loops, and b)
-            #     keep the inlining process simple since i don't need to worry about
-            #     recursive inlining.
-            #   - then resolve inlines everywhere else
-            count = 0
-            changed = True
-            while changed:
-                count += 1
-                changed = False
-                if count > 1000:
-                    raise StructureError('resolving inlined functions appears to have entered an infinite loop')
-                for fdef in inlines.values():
-                    # print >>sys.stderr,'check-inline:',fdef
-                    for fcall in util.allchildren(fdef, FunctionCall, lambda fc: fc.name in inlines):
-                        ok2inline = True
-                        subfdef = inlines[fcall.name]
-                        for subfcall in util.allchildren(subfdef, FunctionCall, lambda fc: fc.name in inlines):
-                            ok2inline = False
-                            # print >>sys.stderr,'!ok2inline: %s => %s' % (fdef.name, subfdef.name)
-                            break
-                        if not ok2inline:
-                            continue
-                        subfdef.inlineInto(fcall)
-                        changed = True
-                if changed:
-                    ret = _resolveProxies(ret)
-                    # TODO: do i need to rebuild the inlines dictionary?...
-            # check that all inlined functions are self-contained...
-            for fdef in inlines.values():
-                for fcall in util.allchildren(fdef, FunctionCall, lambda fc: fc.name in inlines):
-                    raise StructureError('recursive inlined function %s() detected' % (fdef.name,))
-            while True:
-                # tbd: do i need an infinite loop check?
-                changed = False
-                for call in util.allchildren(ret, FunctionCall, lambda fc: fc.name in inlines):
-                    inlines[call.name].inlineInto(call)
-                    changed = True
-                    ret = _resolveProxies(ret)
-                    break
-                if not changed:
-                    break
-
-        if level >= 3:
-            # collapse literals
-            # tbd: instead of just limiting the loops to 1000, should
-            #      i detect thrashing?... ie.:
-            #        initial state A.
-            #        first loop: state A changes to state B.
-            #        second loop: state B changes to state A.
-            #        and we are now in an infinite loop...
-            #      instead of limiting this to 1000 loops, should i
-            #      detect equivalent states?...
-            count = 0
-            changed = True
-            while changed:
-                count += 1
-                if count > 1000:
-                    raise StructureError('collapsing literals appears to have entered an infinite loop')
-                changed = False
-                for op in util.allchildren(ret, Operator):
-                    if isinstance(op, Not):
-                        # TODO: !(Literal(boolean)) can be optimized...
-                        continue
-                    # TODO: handle other operators, such as bitwise?...
-                    # TODO: better strategy: do a "try" with python... if it succeeds,
-                    #      use that, otherwise just leave it as is... note that then
-                    #      i could combine types, for example ('-' * 6) ==> '------'
-                    handlers = {
-                        '+': lambda a, b: a + b,
-                        '-': lambda a, b: a - b,
-                        '*': lambda a, b: a * b,
-                        '/': lambda a, b: a / b,
-                        '%': lambda a, b: a % b,
-                    }
-                    if op.op not in handlers:
-                        continue
-                    lits = None
-                    for arg in op.args:
-                        if not isinstance(arg, Literal):
-                            lits = None
-                            break
-                        if lits is None:
-                            lits = arg.type
-                        else:
-                            if lits != arg.type:
-                                lits = None
-                                break
-                    if lits is None:
-                        continue
-                    # tbd: i should really use map/reduce here...
-                    val = op.args[0].value
-                    for arg in op.args[1:]:
-                        val = handlers[op.op](val, arg.value)
-                    op._proxy = Literal(str(val)[-2:] == '.0' and int(val) or val)
-                    changed = True
-
-                ret = _resolveProxies(ret)
-
-        return ret
+        from js2esi.node import optimize
+        return optimize.optimize(self, level, keep, renames)
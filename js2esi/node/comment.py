@@ -10,11 +10,15 @@ __license__ = "Apache2"
 
 
 class Comment(Statement):
+    __slots__ = ('message',)
+
     def __init__(self, message):
         super(Comment, self).__init__()
         self.message = message
 
     def __esi__(self, ctxt):
+        if ctxt.size:
+            return
         ctxt.write('<esi:comment text="%s"/>' % (self.message,))
 
     def __js__(self, ctxt):
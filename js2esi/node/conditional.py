@@ -2,8 +2,9 @@
 logical conditionals abstraction
 """
 from js2esi.node.statement import Statement, Block
-from js2esi.node.expression import Operator, Not
+from js2esi.node.expression import Operator
 from js2esi.node.log import Debug
+from js2esi.node.visitor import Visitor, SKIP, STOP
 
 __author__ = "Phil Grabner, Colin Bendell"
 __copyright__ = "Copyright 2017, Akamai Technologies"
@@ -13,25 +14,29 @@ __license__ = "Apache2"
 class DanglingMatchName(Exception): pass
 
 
+class _MatchFinder(Visitor):
+    # finds the first "matches" or "matches_i" operator, looking through
+    # operators (and their operands) only
+
+    def visit_Item(self, item):
+        return SKIP
+
+    def visit_Operator(self, op):
+        if op.op in [' matches ', ' matches_i ']:
+            return STOP
+
+
 def findMatchOperator(expr):
     # TODO: determine the "correct" way to find the "matches" or "matches_i"
     #      operator that applies to the matchname...
     #      this algorithm is doing a first-hit deep-first search...
-    # TODO: this needs to be refactored... use the Item.children property?...
-    if isinstance(expr, Not):
-        return findMatchOperator(expr.expr)
-    if not isinstance(expr, Operator):
-        return None
-    if expr.op in [' matches ', ' matches_i ']:
-        return expr
-    for op in expr.args:
-        ret = findMatchOperator(op)
-        if ret is not None:
-            return ret
-    return None
+    return _MatchFinder().walk(expr)
 
 
 class If(Statement):
+    __slots__ = ('test', 'match', 'nomatch', 'debug')
+    _fields = ('test', 'match', 'nomatch', 'debug')
+
     def __init__(self, testExpr, matchStatement, noMatchStatement=None, debug=None):
         super(If, self).__init__()
         if debug is not None:
@@ -75,16 +80,18 @@ class If(Statement):
             if isinstance(self.nomatch, If):
                 self.nomatch.esi(ctxt)
             else:
-                ctxt.push_buffered()
+                # an empty otherwise is omitted, which is only known once
+                # it has been written...
+                idx = ctxt.placeholder()
                 tl = ctxt.testlevel
                 ctxt.testlevel = 0
                 self.nomatch.esi(ctxt)
                 ctxt.testlevel = tl
-                val = ctxt.pop_buffered()
-                if len(val) > 0:
-                    ctxt.write('<esi:otherwise>')
-                    ctxt.write(val)
+                if ctxt.out.written(idx):
+                    ctxt.fill(idx, '<esi:otherwise>')
                     ctxt.write('</esi:otherwise>')
+                else:
+                    ctxt.fill(idx, '')
             return
         if self.debug is not None:
             self.debug.esi(ctxt)
@@ -0,0 +1,280 @@
+""" js2esi.node.cost
+a static model of the cost of executing an (optimized) tree at the edge: the
+includes and evals, function calls, regular expression matches and variable
+lookups that it takes, along its worst and typical paths.
+"""
+
+from js2esi.node.visitor import Visitor, SKIP
+from js2esi.node.index import NodeIndex
+from js2esi.node.structure import List, Dictionary
+from js2esi.node.expression import Range
+from js2esi.node.literal import Literal
+from js2esi.node.variable import Variable, Assign
+from js2esi.node.function import FunctionDefinition
+from js2esi.node.include import Eval
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# category => the cost of one operation (in arbitrary units; a variable
+# lookup is 1). the network fetches of includes and evals dominate, and an
+# eval also runs the fetched ESI (which is not known at compile time).
+WEIGHTS = {
+    'include': 100,
+    'eval': 150,
+    'call': 5,       # a call to a function of the script (plus its body)
+    'builtin': 2,    # a call to an ESI function
+    'regex': 10,     # a "matches" or "has" operator
+    'lookup': 1,     # a variable lookup
+    'iteration': 1,  # a loop iteration (plus its body)
+}
+
+# the number of iterations assumed for a loop over a collection of unknown
+# size: on the typical path, and on the worst path
+LOOP_TYPICAL = 10
+LOOP_WORST = 100
+
+
+class Cost(object):
+    '''
+    The operations (category => count) along the worst path and, on average
+    (i.e. taking each branch of a conditional to be equally likely), along
+    the typical path of some code.
+    '''
+    __slots__ = ('worst', 'typical')
+
+    def __init__(self, worst=None, typical=None):
+        self.worst = worst or dict()
+        self.typical = typical or dict()
+
+    @classmethod
+    def of(cls, category, count=1):
+        return cls({category: count}, {category: count})
+
+    @staticmethod
+    def total(counts):
+        return sum(WEIGHTS[k] * v for k, v in counts.items())
+
+    def add(self, other, worst=1, typical=1):
+        '''
+        Adds ``other``, repeated ``worst`` times on the worst path and
+        ``typical`` times on the typical path, and returns self.
+        '''
+        for mine, theirs, times in ((self.worst, other.worst, worst), (self.typical, other.typical, typical)):
+            for k, v in theirs.items():
+                mine[k] = mine.get(k, 0) + v * times
+        return self
+
+    def branch(self, branches):
+        '''
+        Adds the cost of taking one of ``branches`` (None standing for no
+        code), and returns self.
+        '''
+        branches = [e or Cost() for e in branches]
+        worst = max(branches, key=lambda e: Cost.total(e.worst))
+        for k, v in worst.worst.items():
+            self.worst[k] = self.worst.get(k, 0) + v
+        for branch in branches:
+            for k, v in branch.typical.items():
+                self.typical[k] = self.typical.get(k, 0) + float(v) / len(branches)
+        return self
+
+    def asDict(self):
+        return dict(worst=Cost.total(self.worst), typical=round(Cost.total(self.typical), 2),
+                    counts=dict(worst=dict(self.worst),
+                                typical=dict((k, round(v, 2)) for k, v in self.typical.items())))
+
+
+class _Estimator(Visitor):
+    # computes the cost of a tree bottom-up: the leave_ handlers replace the
+    # costs of a node's children (in self.costs) with the node's own
+
+    def __init__(self, model):
+        self.model = model
+        self.costs = dict()
+
+    def estimate(self, tree):
+        self.walk(tree)
+        return self.costs.pop(tree, None) or Cost()
+
+    def children(self, item):
+        ret = Cost()
+        for sub in item.children:
+            cost = self.costs.pop(sub, None)
+            if cost is not None:
+                ret.add(cost)
+        return ret
+
+    def leave_Item(self, item):
+        self.costs[item] = self.children(item)
+
+    def visit_FunctionDefinition(self, fdef):
+        # a function costs nothing until it is called
+        return SKIP
+
+    def leave_FunctionDefinition(self, fdef):
+        self.costs[fdef] = Cost()
+
+    def visit_Output(self, out):
+        # the text of a "printraw()" is not evaluated
+        if out.raw:
+            return SKIP
+
+    def leave_Variable(self, var):
+        self.costs[var] = self.children(var).add(Cost.of('lookup'))
+
+    def leave_FunctionParam(self, param):
+        # i.e. the lookup of ARGS{N}
+        self.costs[param] = self.children(param).add(Cost.of('lookup'))
+
+    def leave_FunctionCall(self, fcall):
+        ret = self.children(fcall)
+        body = self.model.function(fcall.name)
+        if body is None:
+            ret.add(Cost.of('builtin'))
+        else:
+            ret.add(Cost.of('call')).add(body)
+        self.costs[fcall] = ret
+
+    def leave_Matches(self, op):
+        self.costs[op] = self.children(op).add(Cost.of('regex'))
+
+    leave_Has = leave_Matches
+
+    def leave_Include(self, inc):
+        ret = self.children(inc)
+        category = isinstance(inc, Eval) and 'eval' or 'include'
+        # the alternative is only fetched when the source fails
+        ret.add(Cost.of(category), worst=inc.alt is None and 1 or 2)
+        self.costs[inc] = ret
+
+    def leave_If(self, item):
+        ret = Cost()
+        for sub in (item.test, item.debug):
+            if sub is not None:
+                ret.add(self.costs.pop(sub))
+        branches = [item.match, item.nomatch]
+        ret.branch([sub is not None and self.costs.pop(sub) or None for sub in branches])
+        self.costs[item] = ret
+
+    def leave_Try(self, item):
+        # the except block only runs if the attempt fails
+        ret = self.costs.pop(item.tryBlock)
+        if item.exceptBlock is not None:
+            ret.add(self.costs.pop(item.exceptBlock), typical=0)
+        self.costs[item] = ret
+
+    def leave_ForEach(self, loop):
+        ret = self.costs.pop(loop.collection)
+        size = self.model.size(loop.collection)
+        body = Cost.of('iteration').add(self.costs.pop(loop.statement))
+        if size is None:
+            ret.add(body, worst=LOOP_WORST, typical=LOOP_TYPICAL)
+        else:
+            ret.add(body, worst=size, typical=size)
+        self.costs[loop] = ret
+
+
+class CostModel(object):
+    '''
+    Estimates the cost of executing ``tree`` at the edge (see :class:`Cost`
+    and :data:`WEIGHTS`): :meth:`script` for the code at the top level, and
+    :meth:`function` for a function of the script (including the functions
+    that it calls).
+
+    The costs are those of the ESI as generated, so ``tree`` should be
+    optimized first. A loop over a collection of unknown size is assumed to
+    iterate :data:`LOOP_TYPICAL` times on the typical path, and
+    :data:`LOOP_WORST` times on the worst path (and loops are assumed to
+    run to completion, i.e. breaks are not accounted for); a recursive call
+    is counted without the cost of its body.
+    '''
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.index = NodeIndex(tree)
+        # name => definition (the last one, which is the one that is called)
+        self.definitions = dict()
+        for fdef in self.index.instances(FunctionDefinition):
+            if not fdef.inline:
+                self.definitions[fdef.name] = fdef
+        # name => Cost, or None while being estimated
+        self.functions = dict()
+
+    def size(self, collection):
+        '''
+        Returns the number of elements of the loop ``collection`` if it is
+        known, i.e. if it is a list (of elements, or of ranges with literal
+        bounds) or a dictionary, or a variable that is only assigned one.
+        '''
+        if isinstance(collection, Variable) and collection.key is None:
+            assigns = self.index.named(Assign, collection.name)
+            if len(assigns) != 1 or assigns[0].key is not None:
+                return None
+            collection = assigns[0].value
+        if isinstance(collection, Dictionary):
+            return len(collection.elements)
+        if not isinstance(collection, List):
+            return None
+        ret = 0
+        for element in collection.elements:
+            if not isinstance(element, Range):
+                ret += 1
+                continue
+            # i.e. [first..last], which is inclusive
+            first, last = element.args
+            if not isinstance(first, Literal) or not isinstance(last, Literal) \
+                    or first.type != 'number' or last.type != 'number':
+                return None
+            ret += max(0, int(last.value) - int(first.value) + 1)
+        return ret
+
+    def function(self, name):
+        '''
+        Returns the cost of the body of the function ``name``, or None if the
+        script does not define it (i.e. it is an ESI function).
+        '''
+        fdef = self.definitions.get(name)
+        if fdef is None:
+            return None
+        if name in self.functions:
+            # note: a recursive call costs the call itself only
+            return self.functions[name] or Cost()
+        self.functions[name] = None
+        ret = Cost()
+        for param in fdef.params:
+            ret.add(_Estimator(self).estimate(param))
+        ret.add(_Estimator(self).estimate(fdef.expr))
+        self.functions[name] = ret
+        return ret
+
+    def script(self):
+        '''
+        Returns the cost of the script's top level code.
+        '''
+        return _Estimator(self).estimate(self.tree)
+
+    def report(self):
+        '''
+        Returns the costs of the script and of each of its functions, as a
+        dict (see :func:`formatTable`).
+        '''
+        return dict(
+            weights=dict(WEIGHTS),
+            script=self.script().asDict(),
+            functions=dict((name, self.function(name).asDict()) for name in sorted(self.definitions)),
+        )
+
+
+def formatTable(report):
+    '''
+    Returns the cost ``report`` (see :meth:`CostModel.report`) as a text
+    table.
+    '''
+    rows = [('(top level)', report['script'])] + sorted(report['functions'].items())
+    width = max(len(name) for name, cost in rows)
+    lines = ['%-*s  %10s  %10s' % (width, 'cost', 'worst', 'typical')]
+    for name, cost in rows:
+        lines.append('%-*s  %10d  %10.1f' % (width, name, cost['worst'], cost['typical']))
+    return '\n'.join(lines) + '\n'
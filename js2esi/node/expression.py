@@ -24,13 +24,17 @@ class OperatorError(Exception): pass
 class UnknownOperator(Exception): pass
 
 
-class Expression(Item): pass
+class Expression(Item):
+    __slots__ = ()
 
 
 Expr = Expression
 
 
 class FunctionCall(Expression):
+    __slots__ = ('name', 'args', 'debug')
+    _fields = ('args',)
+
     def __init__(self, name, *argExprs, **kwargs):
         super(FunctionCall, self).__init__()
         util.assertOnlyKeywords(kwargs, 'debug')
@@ -76,8 +80,16 @@ Function = FunctionCall
 Func = FunctionCall
 
 
+def _hasCalls(expr):
+    for sub in util.allchildren(expr, FunctionCall):
+        return True
+    return False
+
+
 class Operator(Expression):
+    __slots__ = ('op', 'args')
     _registry = dict()
+    _fields = ('args',)
 
     @staticmethod
     def getClassForOperator(operator):
@@ -89,9 +101,9 @@ class Operator(Expression):
     def __init__(self, operator, *args):
         super(Operator, self).__init__()
         self.op = operator
-        self.args = []
-        for arg in args:
-            self.append(arg)
+        # note: a tuple, since most operators have exactly one or two
+        #       arguments (which is about half the size of a list)
+        self.args = tuple(arg for arg in args if arg is not None)
 
     @property
     def __label__(self):
@@ -100,7 +112,7 @@ class Operator(Expression):
     def append(self, expr):
         if expr is None:
             return
-        self.args.append(expr)
+        self.args += (expr,)
 
     def getArgs(self):
         return self.args
@@ -142,6 +154,8 @@ Op = Operator
 
 
 class UnaryOperator(Operator):
+    __slots__ = ()
+
     def __init__(self, operator, expr):
         Operator.__init__(self, operator, expr)
 
@@ -171,6 +185,8 @@ class UnaryOperator(Operator):
 
 
 class Not(UnaryOperator):
+    __slots__ = ()
+
     def __init__(self, expr):
         UnaryOperator.__init__(self, '!', expr)
 
@@ -179,6 +195,8 @@ Operator._registry['!'] = Not
 
 
 class And(Operator):
+    __slots__ = ()
+
     def __init__(self, *args):
         Operator.__init__(self, '&&', *args)
 
@@ -187,13 +205,11 @@ class And(Operator):
 
     def __esi__(self, ctxt):
         # do an optimization to determine if any operands resolve to false
-        for arg in self.args:
-            ctxt.push_buffered()
-            arg.esi(ctxt)
-            tmp = ctxt.out.getvalue()
-            ctxt.pop_buffered()
-            if tmp == '0':
-                return ctxt.write('0')
+        # (unless that drops a function call, e.g. for its side effects)
+        if not _hasCalls(self):
+            for arg in self.args:
+                if arg.esibuf(ctxt) == '0':
+                    return ctxt.write('0')
         return Operator.__esi__(self, ctxt)
 
 
@@ -201,6 +217,8 @@ Operator._registry['&&'] = And
 
 
 class Or(Operator):
+    __slots__ = ()
+
     def __init__(self, *args):
         Operator.__init__(self, '||', *args)
 
@@ -209,13 +227,11 @@ class Or(Operator):
 
     def __esi__(self, ctxt):
         # do an optimization to determine if any operands resolve to true
-        for arg in self.args:
-            ctxt.push_buffered()
-            arg.esi(ctxt)
-            tmp = ctxt.out.getvalue()
-            ctxt.pop_buffered()
-            if tmp == '1':
-                return ctxt.write('1')
+        # (unless that drops a function call)
+        if not _hasCalls(self):
+            for arg in self.args:
+                if arg.esibuf(ctxt) == '1':
+                    return ctxt.write('1')
         return Operator.__esi__(self, ctxt)
 
 
@@ -223,6 +239,8 @@ Operator._registry['||'] = Or
 
 
 class Equal(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '==', leftExpr, rightExpr)
 
@@ -233,6 +251,8 @@ Eq = Equal
 
 
 class NotEqual(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '!=', leftExpr, rightExpr)
 
@@ -243,6 +263,8 @@ Ne = NotEqual
 
 
 class LesserThan(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '<', leftExpr, rightExpr)
 
@@ -252,6 +274,8 @@ Lt = LesserThan
 
 
 class LesserEqual(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '<=', leftExpr, rightExpr)
 
@@ -261,6 +285,8 @@ Le = LesserEqual
 
 
 class GreaterThan(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '>', leftExpr, rightExpr)
 
@@ -270,6 +296,8 @@ Gt = GreaterThan
 
 
 class GreaterEqual(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '>=', leftExpr, rightExpr)
 
@@ -278,15 +306,43 @@ Operator._registry['>='] = GreaterEqual
 Ge = GreaterEqual
 
 
-# TODO: consecutive Literals of the same kind can be collapsed...
-#      => this is somewhat being handled by token/cparser.py.
+# note: consecutive string literals are collapsed by the size mode (see
+#       Add.mergeStrings()), and all-literal additions by the optimizer.
 class Add(Operator):
+    __slots__ = ()
+
     def __init__(self, *argExprs):
         Operator.__init__(self, '+', *argExprs)
 
+    def mergeStrings(self):
+        '''
+        Returns the arguments, with the consecutive string literals joined
+        where that cannot change the result, i.e. where the sum of the
+        arguments before them is known to be a string (or there are none):
+        e.g. ``$(n)+'1'+'2'`` may be a number, whereas ``'a'+$(n)+'1'+'2'``
+        is the same as ``'a'+$(n)+'12'``.
+        '''
+        from js2esi.node.literal import Literal
+
+        def isString(arg):
+            return isinstance(arg, Literal) and arg.type == 'string'
+        ret = []
+        for arg in self.args:
+            if isString(arg) and len(ret) > 0 and isString(ret[-1]) \
+                    and (len(ret) == 1 or any(isString(e) for e in ret[:-1])):
+                ret[-1] = Literal(ret[-1].value + arg.value)
+            else:
+                ret.append(arg)
+        return ret
+
     def __esi__(self, ctxt):
+        args = self.args
+        if ctxt.size:
+            args = self.mergeStrings()
         if ctxt.isvars:
-            return Operator('', *self.args).__esi__(ctxt)
+            return Operator('', *args).__esi__(ctxt)
+        if ctxt.size:
+            return Operator('+', *args).__esi__(ctxt)
         return Operator.__esi__(self, ctxt)
 
 
@@ -295,6 +351,8 @@ Plus = Add
 
 
 class Subtract(Operator):
+    __slots__ = ()
+
     def __init__(self, *argExprs):
         Operator.__init__(self, '-', *argExprs)
 
@@ -304,6 +362,8 @@ Minus = Subtract
 
 
 class Multiply(Operator):
+    __slots__ = ()
+
     def __init__(self, *argExprs):
         Operator.__init__(self, '*', *argExprs)
 
@@ -313,6 +373,8 @@ Times = Multiply
 
 
 class Modulus(Operator):
+    __slots__ = ()
+
     def __init__(self, *argExprs):
         Operator.__init__(self, '%', *argExprs)
 
@@ -322,6 +384,8 @@ Mod = Modulus
 
 
 class Divide(Operator):
+    __slots__ = ()
+
     def __init__(self, *argExprs):
         Operator.__init__(self, '/', *argExprs)
 
@@ -330,6 +394,8 @@ Operator._registry['/'] = Divide
 
 
 class Matches(Operator):
+    __slots__ = ('matchName',)
+
     def __init__(self, leftExpr, rightExpr, matchName=None, case=True):
         Operator.__init__(self, case and ' matches ' or ' matches_i ', leftExpr, rightExpr)
         self.matchName = matchName
@@ -365,6 +431,8 @@ Operator._registry['matches'] = Matches
 
 
 class MatchesNoCase(Matches):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr, matchName=None):
         Matches.__init__(self, leftExpr, rightExpr, matchName=matchName, case=False)
 
@@ -373,6 +441,8 @@ Operator._registry['matches_i'] = MatchesNoCase
 
 
 class Has(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr, case=True):
         Operator.__init__(self, case and ' has ' or ' has_i ', leftExpr, rightExpr)
 
@@ -392,6 +462,8 @@ Operator._registry['has'] = Has
 
 
 class HasNoCase(Has):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Has.__init__(self, leftExpr, rightExpr, case=False)
 
@@ -400,6 +472,8 @@ Operator._registry['has_i'] = HasNoCase
 
 
 class BitShiftLeft(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '<<', leftExpr, rightExpr)
 
@@ -408,6 +482,8 @@ Operator._registry['<<'] = BitShiftLeft
 
 
 class BitShiftRight(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '>>', leftExpr, rightExpr)
 
@@ -416,6 +492,8 @@ Operator._registry['>>'] = BitShiftRight
 
 
 class BitwiseNot(UnaryOperator):
+    __slots__ = ()
+
     def __init__(self, expr):
         UnaryOperator.__init__(self, '~', expr)
 
@@ -424,6 +502,8 @@ Operator._registry['~'] = BitwiseNot
 
 
 class BitwiseAnd(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '&', leftExpr, rightExpr)
 
@@ -432,6 +512,8 @@ Operator._registry['&'] = BitwiseAnd
 
 
 class BitwiseOr(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '|', leftExpr, rightExpr)
 
@@ -440,6 +522,8 @@ Operator._registry['|'] = BitwiseOr
 
 
 class BitwiseXor(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '^', leftExpr, rightExpr)
 
@@ -448,6 +532,8 @@ Operator._registry['^'] = BitwiseXor
 
 
 class Range(Operator):
+    __slots__ = ()
+
     def __init__(self, leftExpr, rightExpr):
         Operator.__init__(self, '..', leftExpr, rightExpr)
 
@@ -7,7 +7,7 @@ from js2esi.node.statement import Statement, Block
 from js2esi.node.variable import Variable, Assign
 from js2esi.node.expression import FunctionCall, Operator
 from js2esi.node.literal import Literal
-from js2esi.node import util
+from js2esi.node.visitor import Transformer
 
 __author__ = "Phil Grabner, Colin Bendell"
 __copyright__ = "Copyright 2017, Akamai Technologies"
@@ -15,6 +15,9 @@ __license__ = "Apache2"
 
 
 class FunctionDefinition(Statement):
+    __slots__ = ('name', 'params', 'expr', 'inline')
+    _fields = ('params', 'expr')
+
     def __init__(self, name, params, executionBlock, inline=False):
         super(FunctionDefinition, self).__init__()
         # tbd: validate function name?...
@@ -38,6 +41,11 @@ class FunctionDefinition(Statement):
         ctxt.write('</esi:function>')
 
     def inlineInto(self, caller):
+        '''
+        Returns the replacement for the FunctionCall ``caller``: a copy of
+        this function's return expression, with the parameters substituted by
+        the call's arguments.
+        '''
         # many restrictions...
         #   - inline function can comprise a single return statement only
         #   - arg and param count must match up, or params must have defaults
@@ -91,20 +99,7 @@ class FunctionDefinition(Statement):
             vartab[self.params[idx].name] = caller.args[idx]
         for idx in range(len(caller.args), len(self.params)):
             vartab[self.params[idx].name] = self.params[idx].default
-        proxies = []
-        for var in util.allchildren(expr):
-            if not isinstance(var, Variable):
-                continue
-            if var.name == 'ARGS':
-                raise StructureError('inline function %s() cannot use variable "ARGS"'
-                                     % (self.name,))
-            if var.name not in vartab:
-                continue
-            proxies.append(var)
-        for var in proxies:
-            var._proxy = copy.deepcopy(vartab[var.name])
-        caller._proxy = expr
-        return self
+        return _ParamSubstituter(self, vartab).transform(expr)
 
     def __js__(self, ctxt):
         ctxt.write(ctxt.indent + 'function %s(' % (self.name,))
@@ -128,14 +123,33 @@ FunctionDef = FunctionDefinition
 FuncDef = FunctionDefinition
 
 
+class _ParamSubstituter(Transformer):
+    # substitutes the parameters of the inline function ``fdef`` with copies
+    # of their values (which are not walked, since they come from the caller)
+
+    def __init__(self, fdef, vartab):
+        self.fdef = fdef
+        self.vartab = vartab
+
+    def leave_Variable(self, var):
+        if var.name == 'ARGS':
+            raise StructureError('inline function %s() cannot use variable "ARGS"'
+                                 % (self.fdef.name,))
+        if var.name in self.vartab:
+            return copy.deepcopy(self.vartab[var.name])
+
+
 class FunctionParam(Statement):
+    __slots__ = ('name', 'default')
+    _fields = ('default',)
+
     def __init__(self, name, default=None):
         super(FunctionParam, self).__init__()
         self.name = name
         self.default = default
 
     def __esi__(self, ctxt):
-        # TODO: now that i have Variable._proxy, i should inspect the function
+        # TODO: now that inlining substitutes the Variables, i should inspect the function
         #      body to see if i need to create a temporary variable, or use it
         #      directly. eg:
         #        def func(a, b)
@@ -153,6 +167,9 @@ class FunctionParam(Statement):
 
 
 class FunctionReturn(Statement):
+    __slots__ = ('expr',)
+    _fields = ('expr',)
+
     def __init__(self, expr):
         super(FunctionReturn, self).__init__()
         self.expr = expr
@@ -14,6 +14,11 @@ __license__ = "Apache2"
 
 
 class Include(Statement):
+    __slots__ = ('src', 'alt', 'dca', 'onError', 'maxWait', 'ttl', 'noStore', 'method',
+                 'entity', 'appendHeader', 'removeHeader', 'setHeader', 'eval')
+    _fields = ('src', 'alt', 'dca', 'onError', 'maxWait', 'ttl', 'noStore', 'method',
+               'entity', 'appendHeader', 'removeHeader', 'setHeader')
+
     def __init__(self, src, alt=None, dca=None, onError=None, maxWait=None,
                  ttl=None, noStore=None, method=None, entity=None,
                  appendHeader=[], removeHeader=[], setHeader=[], eval=False):
@@ -33,10 +38,10 @@ class Include(Statement):
         self.eval = eval
 
     def getInitParameterList():
-        aspec = inspect.getargspec(Include.__init__)
-        if 'self' in aspec.args:
-            aspec.args.remove('self')
-        return aspec.args
+        args = list(inspect.signature(Include.__init__).parameters)
+        if 'self' in args:
+            args.remove('self')
+        return args
 
     getInitParameterList = staticmethod(getInitParameterList)
 
@@ -55,16 +60,20 @@ class Include(Statement):
         ):
             if getattr(self, k, None) is not None:
                 # TODO: quote-escape values?!...
+                ctxt.write(' %s="' % (v,))
                 if isinstance(getattr(self, k), Expression):
-                    ctxt.push_buffered()
+                    idx = ctxt.placeholder()
                     getattr(self, k).esi(ctxt, isvars=True)
-                    value = ctxt.pop_buffered()
+                    # tbd: ugh. this is horrendous. the ghost ESI parser is significantly defective!...
+                    quote = k == 'dca' and ctxt.out.contains(idx, '>') and "'" or ''
+                    ctxt.fill(idx, quote)
+                    ctxt.write(quote)
                 else:
                     value = str(getattr(self, k))
-                # tbd: ugh. this is horrendous. the ghost ESI parser is significantly defective!...
-                if k == 'dca' and '>' in value:
-                    value = "'%s'" % (value,)
-                ctxt.write(' %s="%s"' % (v, value))
+                    if k == 'dca' and '>' in value:
+                        value = "'%s'" % (value,)
+                    ctxt.write(value)
+                ctxt.write('"')
         for k, v in (
                 ('appendHeader', 'appendheader'),
                 ('removeHeader', 'removeheader'),
@@ -107,5 +116,7 @@ class Include(Statement):
 
 
 class Eval(Include):
+    __slots__ = ()
+
     def __init__(self, src, **kwargs):
         super(Eval, self).__init__(src=src, eval=True, **kwargs)
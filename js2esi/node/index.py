@@ -0,0 +1,176 @@
+""" js2esi.node.index
+an index of the nodes of a tree, by class and by name, which is kept up to
+date as the tree is rewritten with :meth:`Item.replace`.
+"""
+
+from js2esi.node import base, util
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# class => whether its instances have a ``name`` attribute
+_named = dict()
+
+
+def _hasName(kls):
+    ret = _named.get(kls)
+    if ret is None:
+        ret = _named[kls] = any('name' in getattr(k, '__slots__', ()) or 'name' in vars(k)
+                                for k in kls.__mro__)
+    return ret
+
+
+class NodeIndex(object):
+    '''
+    Indexes the nodes of a tree by class and, for the nodes that have a
+    ``name`` (function calls and definitions, variables, assignments...), by
+    class and name, so that passes can find e.g. all the calls to a function
+    without walking the tree.
+
+    While attached (see :meth:`attach`, or use the index as a context
+    manager), the index follows the replacements done with
+    :meth:`Item.replace` (the replaced subtree is removed from the index, and
+    the replacement added) and the removals done with :meth:`Item.remove`.
+    Other modifications of the tree must be reported with :meth:`add` and
+    :meth:`remove`.
+
+    Lookups return the nodes in document order (as of when they were added
+    to the index: the nodes of a replacement come after all the others).
+    '''
+
+    def __init__(self, tree=None):
+        # node => serial number (i.e. the order in which nodes were added)
+        self.nodes = dict()
+        # exact class => {node: None}
+        self.classes = dict()
+        # name => {exact class: {node: None}}
+        self.names = dict()
+        self.serial = 0
+        if tree is not None:
+            self.add(tree)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, item):
+        return item in self.nodes
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, *args):
+        self.detach()
+
+    def attach(self):
+        base._observers.append(self)
+        return self
+
+    def detach(self):
+        if self in base._observers:
+            base._observers.remove(self)
+
+    def _subtree(self, tree):
+        yield tree
+        for item in util.allchildren(tree):
+            yield item
+
+    def add(self, tree):
+        '''
+        Adds all the nodes of the subtree ``tree`` to the index.
+        '''
+        nodes = self.nodes
+        classes = self.classes
+        names = self.names
+        serial = self.serial
+        for item in self._subtree(tree):
+            if item in nodes:
+                continue
+            serial += 1
+            nodes[item] = serial
+            kls = item.__class__
+            entries = classes.get(kls)
+            if entries is None:
+                entries = classes[kls] = dict()
+            entries[item] = None
+            if not _hasName(kls):
+                continue
+            name = getattr(item, 'name', None)
+            if isinstance(name, str):
+                bykls = names.get(name)
+                if bykls is None:
+                    bykls = names[name] = dict()
+                entries = bykls.get(kls)
+                if entries is None:
+                    entries = bykls[kls] = dict()
+                entries[item] = None
+        self.serial = serial
+        return self
+
+    def remove(self, tree):
+        '''
+        Removes all the nodes of the subtree ``tree`` from the index.
+        '''
+        for item in self._subtree(tree):
+            if self.nodes.pop(item, None) is None:
+                continue
+            kls = item.__class__
+            del self.classes[kls][item]
+            if not _hasName(kls):
+                continue
+            name = getattr(item, 'name', None)
+            if isinstance(name, str):
+                del self.names[name][kls][item]
+        return self
+
+    def rename(self, item, name):
+        '''
+        Sets the ``name`` of the node ``item``, updating the index.
+        '''
+        if item in self.nodes:
+            kls = item.__class__
+            del self.names[item.name][kls][item]
+            bykls = self.names.setdefault(name, dict())
+            bykls.setdefault(kls, dict())[item] = None
+        item.name = name
+
+    def replaced(self, old, new):
+        # called by Item.replace(): only replacements within the indexed
+        # tree are of interest
+        if old in self.nodes:
+            self.remove(old)
+            self.add(new)
+
+    def removed(self, old):
+        # called by Item.remove()
+        if old in self.nodes:
+            self.remove(old)
+
+    def _merge(self, groups):
+        groups = [e for e in groups if len(e) > 0]
+        if len(groups) == 1:
+            return list(groups[0])
+        ret = [item for entries in groups for item in entries]
+        ret.sort(key=self.nodes.__getitem__)
+        return ret
+
+    def instances(self, kls):
+        '''
+        Returns the nodes that are instances of ``kls`` (or of a subclass).
+        '''
+        return self._merge([entries for k, entries in self.classes.items() if issubclass(k, kls)])
+
+    def named(self, kls, name):
+        '''
+        Returns the nodes named ``name`` that are instances of ``kls`` (or of
+        a subclass).
+        '''
+        return self._merge([entries for k, entries in self.names.get(name, {}).items()
+                            if issubclass(k, kls)])
+
+    def calls(self, *names):
+        '''
+        Returns the calls to the functions ``names``.
+        '''
+        from js2esi.node.expression import FunctionCall
+        return self._merge([self.names.get(name, {}).get(FunctionCall, ()) for name in names])
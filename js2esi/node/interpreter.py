@@ -0,0 +1,726 @@
+""" js2esi.node.interpreter
+a local ESI interpreter: executes a node tree (as parsed from ESI by
+``esi2node``, or compiled from js) against a mock request, serving includes
+from a directory of stubs, and counts the operations that it takes (in the
+categories of :data:`node.cost.WEIGHTS`).
+
+This is an approximation of an edge ESI processor, for comparing the output
+and the cost of scripts offline: variables assigned in a function are local
+to the call, lists print as their comma-separated elements (dictionaries as
+their keys), booleans as "true" and "false", only include failures are
+caught by try/except, and the function calls in text outside of
+``<esi:vars>`` (which is how the compiler writes a call made as a statement)
+are executed.
+"""
+
+import base64
+import hashlib
+import html
+import operator
+import os
+import random
+import re
+import time
+import urllib.parse
+
+from js2esi.node.cost import Cost
+from js2esi.node.literal import Literal
+from js2esi.node.expression import Add, Range, Matches
+from js2esi.node.include import Eval
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# a function call, in text
+_call = re.compile(r'\$\w+\(')
+
+# the deepest nesting of function calls and of processed includes
+MAX_DEPTH = 50
+
+
+class InterpreterError(Exception): pass
+
+
+class IncludeError(InterpreterError): pass
+
+
+class _Break(Exception): pass
+
+
+class _Return(Exception):
+    def __init__(self, value):
+        super(_Return, self).__init__()
+        self.value = value
+
+
+class Keyed(object):
+    '''
+    The value of a request variable that is a string when used as is, and a
+    dictionary when used with a key, e.g. ``$(HTTP_COOKIE)`` and
+    ``$(HTTP_COOKIE{name})``.
+    '''
+
+    def __init__(self, text, entries):
+        self.text = text
+        self.entries = entries
+
+    def __str__(self):
+        return self.text
+
+
+class Request(object):
+    '''
+    A mock request: ``headers`` (name => value), ``cookies`` (name =>
+    value, which make up the Cookie header unless it is given), ``query``
+    (the query string), ``method``, ``path`` and ``remoteAddr``.
+    '''
+
+    def __init__(self, headers=None, cookies=None, query='', method='GET', path='/',
+                 remoteAddr='127.0.0.1'):
+        self.headers = dict((k.lower(), v) for k, v in (headers or {}).items())
+        self.cookies = dict(cookies or {})
+        if 'cookie' in self.headers and cookies is None:
+            for part in self.headers['cookie'].split(';'):
+                if '=' in part:
+                    k, v = part.split('=', 1)
+                    self.cookies[k.strip()] = v.strip()
+        self.query = query
+        self.method = method
+        self.path = path
+        self.remoteAddr = remoteAddr
+
+    def variables(self):
+        '''
+        Returns the ESI variables of this request.
+        '''
+        ret = dict()
+        for name, value in self.headers.items():
+            ret['HTTP_' + name.upper().replace('-', '_')] = value
+        cookie = self.headers.get('cookie', '; '.join('%s=%s' % e for e in self.cookies.items()))
+        ret['HTTP_COOKIE'] = Keyed(cookie, dict(self.cookies))
+        languages = self.headers.get('accept-language', '')
+        ret['HTTP_ACCEPT_LANGUAGE'] = Keyed(languages, dict(
+            (e.split(';')[0].strip(), True) for e in languages.split(',') if len(e.strip()) > 0))
+        ret['QUERY_STRING'] = Keyed(self.query, dict(urllib.parse.parse_qsl(self.query, keep_blank_values=True)))
+        ret['REQUEST_METHOD'] = self.method
+        ret['REQUEST_PATH'] = self.path
+        ret['REMOTE_ADDR'] = self.remoteAddr
+        return ret
+
+
+def text(value):
+    '''
+    Returns ``value`` as it is printed.
+    '''
+    if value is None:
+        return ''
+    if isinstance(value, bool):
+        return value and 'true' or 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (list, tuple, dict)):
+        return ','.join(text(e) for e in value)
+    return str(value)
+
+
+def truth(value):
+    if isinstance(value, Keyed):
+        return len(value.text) > 0
+    return bool(value)
+
+
+def _isNumber(value):
+    return isinstance(value, (int, float))
+
+
+def number(value):
+    '''
+    Returns ``value`` as a number (0 if it is not one).
+    '''
+    if _isNumber(value):
+        return int(value) if isinstance(value, bool) else value
+    try:
+        return int(text(value).strip())
+    except ValueError:
+        try:
+            return float(text(value).strip())
+        except ValueError:
+            return 0
+
+
+def _compare(left, right):
+    # numbers compare as numbers, anything else as text
+    if _isNumber(left) and _isNumber(right):
+        return number(left), number(right)
+    return text(left), text(right)
+
+
+def _divide(left, right):
+    left, right = number(left), number(right)
+    if right == 0:
+        raise InterpreterError('division by zero')
+    if isinstance(left, int) and isinstance(right, int):
+        # i.e. truncated towards zero
+        return abs(left) // abs(right) * (1 if (left < 0) == (right < 0) else -1)
+    return left / right
+
+
+def _modulus(left, right):
+    left, right = number(left), number(right)
+    if right == 0:
+        raise InterpreterError('division by zero')
+    return left - right * int(float(left) / right)
+
+
+def _add(left, right):
+    if _isNumber(left) and _isNumber(right):
+        return number(left) + number(right)
+    return text(left) + text(right)
+
+
+# operator => the python equivalent (of two evaluated arguments)
+_operators = {
+    '==': lambda a, b: operator.eq(*_compare(a, b)),
+    '!=': lambda a, b: operator.ne(*_compare(a, b)),
+    '<': lambda a, b: operator.lt(*_compare(a, b)),
+    '<=': lambda a, b: operator.le(*_compare(a, b)),
+    '>': lambda a, b: operator.gt(*_compare(a, b)),
+    '>=': lambda a, b: operator.ge(*_compare(a, b)),
+    '+': _add,
+    '-': lambda a, b: number(a) - number(b),
+    '*': lambda a, b: number(a) * number(b),
+    '/': _divide,
+    '%': _modulus,
+    '&': lambda a, b: int(number(a)) & int(number(b)),
+    '|': lambda a, b: int(number(a)) | int(number(b)),
+    '^': lambda a, b: int(number(a)) ^ int(number(b)),
+    '<<': lambda a, b: int(number(a)) << int(number(b)),
+    '>>': lambda a, b: int(number(a)) >> int(number(b)),
+}
+
+
+def _substr(value, start, length=None):
+    value = text(value)
+    start = int(number(start))
+    if length is None:
+        return value[start:]
+    length = int(number(length))
+    return value[start:start + length] if length >= 0 else value[start:length]
+
+
+def _split(value, sep=' ', limit=None):
+    value = text(value)
+    if limit is None:
+        return value.split(text(sep))
+    return value.split(text(sep), int(number(limit)) - 1)
+
+
+def _digest(value):
+    return hashlib.md5(text(value).encode('utf-8')).digest()
+
+
+class Interpreter(object):
+    '''
+    Executes node trees (see :meth:`run`) for the mock ``request`` (a
+    :class:`Request`), serving the includes and evals from the files of the
+    ``includes`` directory (the path of the URL, e.g. "/a/b.html" is served
+    from "a/b.html", or from "HOST/a/b.html" if that exists). ``parse``
+    turns the fetched ESI of evals and ``dca="esi"`` includes into a tree.
+
+    The interpreter's state (the variables, functions, operation counts and
+    output) carries over from one :meth:`run` to the next.
+    '''
+
+    def __init__(self, request=None, includes=None, parse=None):
+        self.request = request or Request()
+        self.includes = includes
+        self.parse = parse
+        # category => count (see node.cost.WEIGHTS)
+        self.counts = dict()
+        self.functions = dict()
+        self.scopes = [self.request.variables()]
+        # the output, and the outputs of the try blocks being executed
+        self.buffers = [[]]
+        # the response headers and status code set by the script
+        self.headers = []
+        self.status = None
+        self.depth = 0
+        self.rand = random.Random(0)
+        self.lastRand = None
+        self.handlers = dict()
+
+    def count(self, category):
+        self.counts[category] = self.counts.get(category, 0) + 1
+
+    def write(self, value):
+        self.buffers[-1].append(value)
+
+    @property
+    def output(self):
+        return ''.join(self.buffers[0])
+
+    def run(self, tree):
+        '''
+        Executes ``tree``, and returns the output (of all runs so far).
+        '''
+        self.execute(tree)
+        return self.output
+
+    def report(self):
+        '''
+        Returns the result of the runs so far, as a dict: the output, its
+        size, the operation counts and their cost (see :class:`node.cost.Cost`),
+        and the response headers and status code set by the script.
+        '''
+        output = self.output
+        return dict(output=output, bytes=len(output.encode('utf-8')), counts=dict(self.counts),
+                    cost=Cost.total(self.counts), headers=list(self.headers), status=self.status)
+
+    def _handler(self, prefix, item):
+        # the method named prefix + the class name of ``item`` (or of its
+        # nearest base class that has one)
+        key = (prefix, item.__class__)
+        ret = self.handlers.get(key)
+        if ret is None:
+            for kls in item.__class__.__mro__:
+                ret = getattr(self, prefix + kls.__name__, None)
+                if ret is not None:
+                    break
+            self.handlers[key] = ret
+        return ret
+
+    def execute(self, item):
+        if item is None:
+            return
+        handler = self._handler('exec_', item)
+        if handler is None:
+            raise InterpreterError('cannot execute %s' % (item.__label__,))
+        handler(item)
+
+    def evaluate(self, expr):
+        if expr is None:
+            return None
+        handler = self._handler('eval_', expr)
+        if handler is None:
+            raise InterpreterError('cannot evaluate %s' % (expr.__label__,))
+        return handler(expr)
+
+    # variables
+
+    def lookup(self, name):
+        for scope in (self.scopes[-1], self.scopes[0]):
+            if name in scope:
+                return scope[name]
+        return None
+
+    def assign(self, name, value, key=None):
+        scope = self.scopes[-1]
+        if key is None:
+            scope[name] = value
+            return
+        container = scope.get(name, self.lookup(name))
+        if isinstance(container, list):
+            idx = int(number(key))
+            if not 0 <= idx < len(container):
+                raise InterpreterError('index %d out of range of "%s"' % (idx, name))
+            container[idx] = value
+        elif isinstance(container, dict):
+            container[text(key)] = value
+        else:
+            scope[name] = {text(key): value}
+
+    # statements
+
+    def exec_BlockFragment(self, block):
+        for st in block.statements:
+            self.execute(st)
+
+    def exec_Output(self, out):
+        for st in out.statements:
+            if out.raw:
+                self.write(str(st.value))
+            elif not out.vars and isinstance(st, Literal) and self.parse is not None \
+                    and _call.search(text(st.value)):
+                # i.e. a function called as a statement, which the compiler
+                # writes as is (e.g. "$add_header(...)")
+                self.execute(self.parse('<esi:vars>%s</esi:vars>' % (st.value,)))
+            else:
+                self.write(self.outputText(st))
+
+    def outputText(self, expr):
+        # in <esi:vars>, "+" joins the text and the variables
+        if isinstance(expr, Add):
+            return ''.join(self.outputText(e) for e in expr.args)
+        return text(self.evaluate(expr))
+
+    def exec_Comment(self, comment):
+        pass
+
+    def exec_Debug(self, debug):
+        pass
+
+    def exec_Assign(self, assign):
+        self.assign(assign.name, self.evaluate(assign.value), self.evaluate(assign.key))
+
+    def exec_If(self, item):
+        if truth(self.evaluate(item.test)):
+            self.execute(item.match)
+        else:
+            self.execute(item.nomatch)
+
+    def exec_ForEach(self, loop):
+        collection = self.evaluate(loop.collection)
+        if isinstance(collection, dict):
+            collection = [[k, v] for k, v in collection.items()]
+        elif isinstance(collection, Keyed):
+            collection = [[k, v] for k, v in collection.entries.items()]
+        elif not isinstance(collection, list):
+            collection = collection is not None and [collection] or []
+        name = loop.key or 'item'
+        try:
+            for element in collection:
+                self.count('iteration')
+                self.assign(name, element)
+                self.execute(loop.statement)
+        except _Break:
+            pass
+
+    def exec_Break(self, item):
+        raise _Break()
+
+    def exec_FunctionDefinition(self, fdef):
+        self.functions[fdef.name] = fdef
+
+    def exec_FunctionReturn(self, ret):
+        raise _Return(self.evaluate(ret.expr))
+
+    def exec_Try(self, item):
+        self.buffers.append([])
+        try:
+            self.execute(item.tryBlock)
+        except IncludeError:
+            # the output of the attempt is discarded
+            self.buffers.pop()
+            self.execute(item.exceptBlock)
+            return
+        out = self.buffers.pop()
+        self.buffers[-1].extend(out)
+
+    def exec_Import(self, imp):
+        self.execute(imp.inline)
+
+    def exec_Include(self, inc):
+        category = isinstance(inc, Eval) and 'eval' or 'include'
+        self.count(category)
+        try:
+            try:
+                fetched = self.fetch(text(self.evaluate(inc.src)))
+            except IncludeError:
+                if inc.alt is None:
+                    raise
+                self.count(category)
+                fetched = self.fetch(text(self.evaluate(inc.alt)))
+        except IncludeError:
+            if text(self.evaluate(inc.onError)) == 'continue':
+                return
+            raise
+        if category == 'eval':
+            # i.e. processed with the variables and functions of the script
+            return self.process(fetched, self)
+        if text(self.evaluate(inc.dca)) == 'esi':
+            sub = Interpreter(self.request, self.includes, self.parse)
+            sub.counts = self.counts
+            sub.depth = self.depth
+            return self.process(fetched, sub)
+        self.write(fetched)
+
+    def process(self, source, interpreter):
+        if self.parse is None:
+            raise InterpreterError('cannot process fetched ESI (no parser)')
+        if self.depth >= MAX_DEPTH:
+            raise InterpreterError('includes nested too deep')
+        interpreter.depth += 1
+        try:
+            if interpreter is self:
+                self.execute(self.parse(source))
+            else:
+                self.write(interpreter.run(self.parse(source)))
+        finally:
+            interpreter.depth -= 1
+
+    def fetch(self, src):
+        '''
+        Returns the stub of the URL ``src``, or raises an IncludeError.
+        '''
+        if self.includes is None:
+            raise IncludeError('no includes directory (for "%s")' % (src,))
+        url = urllib.parse.urlsplit(src)
+        path = url.path.lstrip('/')
+        root = os.path.abspath(self.includes)
+        for candidate in (os.path.join(url.netloc, path), path):
+            filename = os.path.abspath(os.path.join(root, candidate))
+            if not filename.startswith(root + os.sep):
+                continue
+            if os.path.isfile(filename):
+                with open(filename, encoding='utf-8') as fp:
+                    return fp.read()
+        raise IncludeError('no stub for "%s"' % (src,))
+
+    def exec_Expression(self, expr):
+        # e.g. a function called for its side effects
+        self.evaluate(expr)
+
+    # expressions
+
+    def eval_Literal(self, lit):
+        return lit.value
+
+    def eval_Variable(self, var):
+        self.count('lookup')
+        value = self.lookup(var.name)
+        if var.key is not None:
+            key = self.evaluate(var.key)
+            if isinstance(value, Keyed):
+                value = value.entries.get(text(key))
+            elif isinstance(value, dict):
+                value = value.get(text(key))
+            elif isinstance(value, list):
+                idx = int(number(key))
+                value = value[idx] if 0 <= idx < len(value) else None
+            else:
+                value = None
+        if var.default is not None and (value is None or value == ''):
+            value = self.evaluate(var.default)
+        return value
+
+    def eval_List(self, lst):
+        ret = []
+        for element in lst.elements:
+            if isinstance(element, Range):
+                ret.extend(self.evaluate(element))
+            else:
+                ret.append(self.evaluate(element))
+        return ret
+
+    def eval_Dictionary(self, dct):
+        return dict((text(self.evaluate(k)), self.evaluate(v)) for k, v in dct.elements)
+
+    def eval_Range(self, op):
+        first, last = [int(number(self.evaluate(e))) for e in op.args]
+        return list(range(first, last + 1))
+
+    def eval_Operator(self, op):
+        handler = _operators.get(op.op.strip())
+        if handler is None:
+            raise InterpreterError('unsupported operator "%s"' % (op.op.strip(),))
+        args = [self.evaluate(e) for e in op.args]
+        ret = args[0]
+        for arg in args[1:]:
+            ret = handler(ret, arg)
+        return ret
+
+    def eval_Not(self, op):
+        return not truth(self.evaluate(op.args[0]))
+
+    def eval_BitwiseNot(self, op):
+        return ~int(number(self.evaluate(op.args[0])))
+
+    def eval_And(self, op):
+        for arg in op.args:
+            if not truth(self.evaluate(arg)):
+                return False
+        return True
+
+    def eval_Or(self, op):
+        for arg in op.args:
+            if truth(self.evaluate(arg)):
+                return True
+        return False
+
+    def eval_Matches(self, op):
+        self.count('regex')
+        subject, pattern = [text(self.evaluate(e)) for e in op.args]
+        flags = op.op.strip().endswith('_i') and re.IGNORECASE or 0
+        try:
+            match = re.search(pattern, subject, flags)
+        except re.error as e:
+            raise InterpreterError('invalid regular expression "%s": %s' % (pattern, e))
+        name = isinstance(op, Matches) and op.matchName or 'MATCHES'
+        self.assign(name, match is not None and [match.group(0)] + list(match.groups()) or None)
+        return match is not None
+
+    def eval_Has(self, op):
+        self.count('regex')
+        subject, part = [text(self.evaluate(e)) for e in op.args]
+        if op.op.strip().endswith('_i'):
+            subject, part = subject.lower(), part.lower()
+        return part in subject
+
+    def eval_FunctionCall(self, fcall):
+        args = [self.evaluate(e) for e in fcall.args]
+        fdef = self.functions.get(fcall.name)
+        if fdef is None:
+            self.count('builtin')
+            return self.builtin(fcall.name, args)
+        self.count('call')
+        if self.depth >= MAX_DEPTH:
+            raise InterpreterError('function calls nested too deep (in %s())' % (fcall.name,))
+        scope = dict(ARGS=args)
+        self.scopes.append(scope)
+        self.depth += 1
+        try:
+            for idx, param in enumerate(fdef.params):
+                scope[param.name] = args[idx] if idx < len(args) else self.evaluate(param.default)
+            self.execute(fdef.expr)
+        except _Return as e:
+            return e.value
+        finally:
+            self.depth -= 1
+            self.scopes.pop()
+        return None
+
+    # ESI functions
+
+    def builtin(self, name, args):
+        handler = getattr(self, 'fn_' + name, None)
+        if handler is None:
+            raise InterpreterError('unknown function %s()' % (name,))
+        try:
+            return handler(*args)
+        except TypeError:
+            raise InterpreterError('bad arguments to %s(): %r' % (name, args))
+        except (ValueError, OverflowError, OSError) as e:
+            # e.g. $bin_int('x'), or a time out of range: an ESI evaluation error
+            raise InterpreterError('error in %s(): %s (arguments: %r)' % (name, e, args))
+
+    def fn_len(self, value):
+        if isinstance(value, (list, dict)):
+            return len(value)
+        return len(text(value))
+
+    def fn_exists(self, value):
+        return value is not None
+
+    def fn_is_empty(self, value):
+        return value is None or len(value if isinstance(value, (list, dict)) else text(value)) == 0
+
+    def fn_str(self, value):
+        return text(value)
+
+    def fn_int(self, value):
+        return int(number(value))
+
+    def fn_lower(self, value):
+        return text(value).lower()
+
+    def fn_upper(self, value):
+        return text(value).upper()
+
+    def fn_strip(self, value):
+        return text(value).strip()
+
+    def fn_lstrip(self, value):
+        return text(value).lstrip()
+
+    def fn_rstrip(self, value):
+        return text(value).rstrip()
+
+    def fn_substr(self, value, start, length=None):
+        return _substr(value, start, length)
+
+    def fn_index(self, value, part):
+        return text(value).find(text(part))
+
+    def fn_rindex(self, value, part):
+        return text(value).rfind(text(part))
+
+    def fn_replace(self, value, old, new, count=None):
+        return text(value).replace(text(old), text(new), -1 if count is None else int(number(count)))
+
+    def fn_string_split(self, value, sep=' ', limit=None):
+        return _split(value, sep, limit)
+
+    def fn_join(self, values, sep=''):
+        return text(sep).join(text(e) for e in values or [])
+
+    def fn_list_delitem(self, values, idx):
+        idx = int(number(idx))
+        if isinstance(values, list) and 0 <= idx < len(values):
+            del values[idx]
+        return values
+
+    def fn_dollar(self):
+        return '$'
+
+    def fn_dquote(self):
+        return '"'
+
+    def fn_squote(self):
+        return '\''
+
+    def fn_url_encode(self, value):
+        return urllib.parse.quote(text(value), safe='')
+
+    def fn_url_decode(self, value):
+        return urllib.parse.unquote_plus(text(value))
+
+    def fn_html_encode(self, value):
+        return html.escape(text(value))
+
+    def fn_html_decode(self, value):
+        return html.unescape(text(value))
+
+    def fn_base64_encode(self, value):
+        return base64.b64encode(text(value).encode('utf-8')).decode('ascii')
+
+    def fn_base64_decode(self, value):
+        try:
+            return base64.b64decode(text(value)).decode('utf-8', 'replace')
+        except ValueError:
+            return ''
+
+    def fn_digest_md5(self, value):
+        digest = _digest(value)
+        return [int.from_bytes(digest[idx:idx + 4], 'little', signed=True) for idx in range(0, 16, 4)]
+
+    def fn_digest_md5_hex(self, value):
+        return _digest(value).hex()
+
+    def fn_convert_to_unicode(self, value):
+        return text(value)
+
+    def fn_convert_from_unicode(self, value):
+        return text(value)
+
+    def fn_bin_int(self, value):
+        return int(text(value), 2)
+
+    def fn_time(self):
+        return int(time.time())
+
+    def fn_http_time(self, value):
+        return time.strftime('%a, %d %b %Y %H:%M:%S GMT', time.gmtime(number(value)))
+
+    def fn_strftime(self, value, fmt):
+        return time.strftime(text(fmt), time.gmtime(number(value)))
+
+    def fn_rand(self, limit=100000000):
+        self.lastRand = self.rand.randrange(max(1, int(number(limit))))
+        return self.lastRand
+
+    def fn_last_rand(self):
+        return self.lastRand
+
+    def fn_add_header(self, name, value):
+        self.headers.append((text(name), text(value)))
+
+    def fn_add_cachebusting_header(self):
+        self.headers.append(('Cache-Control', 'private, max-age=0'))
+
+    def fn_set_response_code(self, code, body=None):
+        self.status = int(number(code))
+
+    def fn_set_redirect(self, location):
+        self.status = 302
+        self.headers.append(('Location', text(location)))
@@ -14,6 +14,8 @@ class InvalidNegation(Exception): pass
 
 
 class Literal(Expression):
+    __slots__ = ('value',)
+
     def __init__(self, value=None):
         super(Literal, self).__init__()
         self.value = value
@@ -55,6 +57,13 @@ class Literal(Expression):
             return ctxt.write(str(self.value))
         if ctxt.isvars:
             return ctxt.write(re.sub(r'([$\\]|<esi:)', r'\\\1', str(self.value)))
+        value = str(self.value)
+        quoted = value.replace('\\', '\\\\').replace('\'', '\\\'')
+        # a triple-quoted string has no escapes, but cannot contain three
+        # quotes, nor end with one
+        if ctxt.size and len(quoted) > len(value) + 4 \
+                and '\'\'\'' not in value and not value.endswith('\''):
+            return ctxt.write('\'\'\'%s\'\'\'' % (value,))
         ctxt.write('\'')
-        ctxt.write(str(self.value).replace('\\', '\\\\').replace('\'', '\\\''))
+        ctxt.write(quoted)
         ctxt.write('\'')
@@ -13,6 +13,9 @@ __license__ = "Apache2"
 
 
 class Debug(Statement):
+    __slots__ = ('expr',)
+    _fields = ('expr',)
+
     def __init__(self, *expressions, **kwargs):
         super(Debug, self).__init__()
         self.expr = Plus()
@@ -32,6 +35,9 @@ class Debug(Statement):
 
 
 class DebugBlock(Block):
+    __slots__ = ('init', 'term')
+    _fields = Block._fields + ('init', 'term')
+
     def __init__(self):
         super(DebugBlock, self).__init__()
         self.init = Block(Assign('node_debug', ''), Assign('node_indent', ''))
@@ -46,6 +52,8 @@ class DebugBlock(Block):
 
 
 class IfDebug(Block):
+    __slots__ = ()
+
     def __esi__(self, ctxt):
         if ctxt.debug:
             Block.__esi__(self, ctxt)
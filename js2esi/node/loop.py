@@ -9,6 +9,9 @@ __license__ = "Apache2"
 
 
 class ForEach(Statement):
+    __slots__ = ('key', 'collection', 'statement')
+    _fields = ('collection', 'statement')
+
     # TODO: currently requiring key to be a string...
     def __init__(self, collection, statement, key=None):
         super(ForEach, self).__init__()
@@ -40,6 +43,8 @@ class ForEach(Statement):
 
 
 class Break(Statement):
+    __slots__ = ()
+
     def __esi__(self, ctxt):
         ctxt.write('<esi:break/>')
 
@@ -0,0 +1,692 @@
+""" js2esi.node.optimize
+the optimization passes run by :meth:`Item.optimize`.
+"""
+
+import math
+import operator
+import re
+from collections import deque
+
+from js2esi.node.base import StructureError
+from js2esi.node.visitor import Visitor, STOP
+from js2esi.node.index import NodeIndex
+import string
+
+from js2esi.node import util
+from js2esi.node.statement import Block, BlockFragment, Output
+from js2esi.node.function import FunctionDefinition, FunctionParam
+from js2esi.node.expression import FunctionCall, Operator, Not, And, Or, BitwiseNot, Matches, Has, Add
+from js2esi.node.literal import Literal
+from js2esi.node.variable import Variable, Assign
+from js2esi.node.loop import ForEach
+from js2esi.node.include import Eval
+from js2esi.node.conditional import If
+from js2esi.node.package import Import
+
+__author__ = "Phil Grabner, Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+class InlineCallFinder(Visitor):
+    '''
+    Collects the calls to the functions named in ``inlines`` (or, with
+    ``first``, just the first one).
+    '''
+
+    def __init__(self, inlines, first=False):
+        self.inlines = inlines
+        self.first = first
+        self.calls = []
+
+    def visit_FunctionCall(self, fcall):
+        if fcall.name in self.inlines:
+            self.calls.append(fcall)
+            if self.first:
+                return STOP
+
+
+def findInlineCalls(tree, inlines):
+    finder = InlineCallFinder(inlines)
+    finder.walk(tree)
+    return finder.calls
+
+
+def hasInlineCalls(tree, inlines):
+    return InlineCallFinder(inlines, first=True).walk(tree) is not None
+
+
+def _stronglyConnected(graph):
+    '''
+    Returns the strongly connected components of ``graph`` (a dict of node
+    => successors), in reverse topological order, i.e. each component comes
+    after the components that it leads to. This is Tarjan's algorithm, with
+    an explicit stack.
+    '''
+    ret = []
+    index = dict()
+    lowlink = dict()
+    stack = []
+    onstack = set()
+    for root in graph:
+        if root in index:
+            continue
+        work = [(root, iter(graph[root]))]
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        onstack.add(root)
+        while len(work) > 0:
+            cur, succs = work[-1]
+            for succ in succs:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = len(index)
+                    stack.append(succ)
+                    onstack.add(succ)
+                    work.append((succ, iter(graph[succ])))
+                    break
+                if succ in onstack:
+                    lowlink[cur] = min(lowlink[cur], index[succ])
+            else:
+                work.pop()
+                if len(work) > 0:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[cur])
+                if lowlink[cur] == index[cur]:
+                    scc = []
+                    while True:
+                        item = stack.pop()
+                        onstack.discard(item)
+                        scc.append(item)
+                        if item is cur:
+                            break
+                    scc.reverse()
+                    ret.append(scc)
+    return ret
+
+
+def _expandCalls(tree, calls, inlines, index):
+    # replaces the calls ``calls`` (in document order) to the functions
+    # ``inlines``, and the calls that the inlined expressions contain (i.e.
+    # copied from the arguments) right after, and returns ``tree`` (or its
+    # replacement). the originals of copied calls are no longer in the tree
+    # (nor in ``index``), and are skipped.
+    pending = deque(calls)
+    while len(pending) > 0:
+        fcall = pending.popleft()
+        if fcall not in index:
+            continue
+        new = fcall.replace(inlines[fcall.name].inlineInto(fcall))
+        if fcall is tree:
+            tree = new
+        pending.extendleft(reversed(findInlineCalls(new, inlines)))
+    return tree
+
+
+def resolveInlines(tree, index):
+    '''
+    Replaces the calls to inline functions with their inlined expressions,
+    and returns ``tree`` (or its replacement). ``index`` is the (attached)
+    :class:`NodeIndex` of ``tree``.
+    '''
+    inlines = dict()
+    for fdef in index.instances(FunctionDefinition):
+        if fdef.inline:
+            inlines[fdef.name] = fdef
+    if len(inlines) == 0:
+        return tree
+    # first make the inline function definitions self-contained, by inlining
+    # the functions that they call: along the call graph, callees first, so
+    # that each definition only ever inlines definitions that are already
+    # self-contained. the functions that are (or call into) recursive
+    # functions cannot be inlined.
+    calls = dict()
+    for name, fdef in inlines.items():
+        calls[name] = findInlineCalls(fdef, inlines)
+    graph = dict()
+    for name, fcalls in calls.items():
+        graph[name] = list(dict.fromkeys(fcall.name for fcall in fcalls))
+    resolved = dict()
+    recursive = set()
+    for scc in _stronglyConnected(graph):
+        if len(scc) > 1 or scc[0] in graph[scc[0]]:
+            recursive.update(scc)
+        for name in scc:
+            if name not in recursive and len(recursive.intersection(graph[name])) > 0:
+                recursive.add(name)
+        for name in scc:
+            fdef = inlines[name]
+            _expandCalls(fdef, [fcall for fcall in calls[name] if fcall.name in resolved], resolved, index)
+            if name not in recursive:
+                resolved[name] = fdef
+    for name in inlines:
+        if name in recursive:
+            raise StructureError('recursive inlined function %s() detected' % (name,))
+    # ...then resolve inlines everywhere else
+    return _expandCalls(tree, index.calls(*inlines), inlines, index)
+
+
+def _divide(left, right):
+    # as ESI divides: integers are truncated towards zero (e.g. -7/2 is -3)
+    if isinstance(left, int) and isinstance(right, int):
+        ret = abs(left) // abs(right)
+        return (left < 0) == (right < 0) and ret or -ret
+    return left / right
+
+
+def _modulus(left, right):
+    # i.e. with the sign of the dividend (e.g. -7%3 is -1)
+    if isinstance(left, int) and isinstance(right, int):
+        return left - right * _divide(left, right)
+    return math.fmod(left, right)
+
+
+# operator => (the literal types that it folds, the python equivalent); note
+# that booleans are not folded as numbers (only compared to one another), and
+# that the arguments must all be of the same type (mixing numbers and strings
+# is left to the ESI processor).
+_folders = {
+    '+': (('number', 'string'), operator.add),
+    '-': (('number',), operator.sub),
+    '*': (('number',), operator.mul),
+    '/': (('number',), _divide),
+    '%': (('number',), _modulus),
+    '<<': (('integer',), operator.lshift),
+    '>>': (('integer',), operator.rshift),
+    '&': (('integer',), operator.and_),
+    '|': (('integer',), operator.or_),
+    '^': (('integer',), operator.xor),
+    '==': (('number', 'string', 'boolean'), operator.eq),
+    '!=': (('number', 'string', 'boolean'), operator.ne),
+    '<': (('number', 'string'), operator.lt),
+    '<=': (('number', 'string'), operator.le),
+    '>': (('number', 'string'), operator.gt),
+    '>=': (('number', 'string'), operator.ge),
+}
+
+# the width of the ESI integers: the results of the bitwise operators wrap
+# around (e.g. (200<<24)>>24 is -56), and integer arithmetic that overflows
+# is left to the ESI processor
+INTEGER_BITS = 32
+
+_bitwise = frozenset(('<<', '>>', '&', '|', '^'))
+
+
+def _wrapInteger(value):
+    # i.e. as a signed INTEGER_BITS integer
+    value &= (1 << INTEGER_BITS) - 1
+    if value >= 1 << (INTEGER_BITS - 1):
+        value -= 1 << INTEGER_BITS
+    return value
+
+
+def _isInteger(value):
+    return -(1 << (INTEGER_BITS - 1)) <= value < 1 << (INTEGER_BITS - 1)
+
+
+def _foldType(lit):
+    if lit.type in ('string', 'boolean'):
+        return lit.type, lit.value
+    value = lit.value
+    return isinstance(value, int) and 'integer' or 'number', value
+
+
+def _isPure(expr):
+    # whether evaluating ``expr`` has no side effects (i.e. it calls no
+    # functions, e.g. $add_header())
+    if isinstance(expr, FunctionCall):
+        return False
+    for item in util.allchildren(expr, FunctionCall):
+        return False
+    return True
+
+
+def _foldLogical(op):
+    # false in a conjunction, or true in a disjunction, decides it (as
+    # And.__esi__() and Or.__esi__() do), provided that the other arguments
+    # can be dropped; the other boolean literals are neutral.
+    decisive = isinstance(op, Or)
+    for arg in op.args:
+        if isinstance(arg, Literal) and arg.type == 'boolean' and arg.value is decisive:
+            if not all(_isPure(e) for e in op.args):
+                return None
+            return Literal(decisive)
+    for arg in op.args:
+        if not isinstance(arg, Literal) or arg.type != 'boolean':
+            return None
+    return Literal(not decisive)
+
+
+def foldLiteral(op):
+    '''
+    Returns the literal that the operator ``op`` evaluates to if it can be
+    determined at compile time (e.g. 3+4 is 7, and 'a'<'b' is true), or None.
+    '''
+    if isinstance(op, (And, Or)):
+        return _foldLogical(op)
+    if len(op.args) == 0:
+        return None
+    for arg in op.args:
+        if not isinstance(arg, Literal):
+            return None
+    if isinstance(op, Not):
+        if op.args[0].type != 'boolean':
+            return None
+        return Literal(not op.args[0].value)
+    if isinstance(op, BitwiseNot):
+        kind, val = _foldType(op.args[0])
+        return kind == 'integer' and Literal(_wrapInteger(~val)) or None
+    if op.op not in _folders:
+        return None
+    types, handler = _folders[op.op]
+    kinds = set()
+    values = []
+    for arg in op.args:
+        kind, val = _foldType(arg)
+        kinds.add(kind)
+        values.append(val)
+    if len(kinds) > 1:
+        # integers are numbers too
+        if kinds != set(('integer', 'number')):
+            return None
+        kinds = set(('number',))
+    kind = kinds.pop()
+    if kind not in types and not (kind == 'integer' and 'number' in types):
+        return None
+    bitwise = op.op in _bitwise
+    try:
+        val = values[0]
+        for arg in values[1:]:
+            if bitwise:
+                if op.op in ('<<', '>>') and not 0 <= arg < INTEGER_BITS:
+                    # i.e. undefined
+                    return None
+                val = _wrapInteger(handler(_wrapInteger(val), _wrapInteger(arg)))
+            else:
+                val = handler(val, arg)
+    except (ArithmeticError, ValueError):
+        # e.g. division by zero: leave it to the ESI processor
+        return None
+    if isinstance(val, float) and val.is_integer():
+        val = int(val)
+    if kind == 'integer' and isinstance(val, int) and not isinstance(val, bool) and not _isInteger(val):
+        # i.e. an overflow
+        return None
+    return Literal(val)
+
+
+def foldLiterals(tree, index):
+    '''
+    Collapses the operators of ``tree`` whose arguments are all literals (see
+    :func:`foldLiteral`), and returns ``tree`` (or its replacement).
+    '''
+    # in reverse document order, an operator comes after all of the operators
+    # that it contains: nested operators are folded in a single pass.
+    for op in reversed(index.instances(Operator)):
+        if op not in index:
+            continue
+        lit = foldLiteral(op)
+        if lit is None:
+            continue
+        op.replace(lit)
+        if op is tree:
+            tree = lit
+    return tree
+
+
+def _constants(index):
+    # returns the assignments that may be propagated: the only assignments
+    # of their variable (which is not otherwise bound, e.g. as a loop item, a
+    # function parameter or the groups of a match), that are not keyed, and that are statements of
+    # a block. since a fragment that is evaluated (<esi:eval>) shares the
+    # variables of the script, only constants can be assumed not to be
+    # reassigned by one.
+    constOnly = len(index.instances(Eval)) > 0
+    bound = set()
+    for loop in index.instances(ForEach):
+        bound.add(loop.key is None and 'item' or loop.key)
+    for param in index.instances(FunctionParam):
+        bound.add(param.name)
+    for op in index.instances(Matches):
+        bound.add(op.matchName or 'MATCHES')
+    ret = []
+    for assign in index.instances(Assign):
+        if assign.key is not None or assign.name in bound:
+            continue
+        if constOnly and assign.decl != 'const':
+            continue
+        if not isinstance(assign.parent, BlockFragment) or assign._slot[0] != 'statements':
+            continue
+        if len(index.named(Assign, assign.name)) != 1:
+            continue
+        ret.append(assign)
+    return ret
+
+
+def _dominated(var, assign):
+    # whether ``var`` is evaluated after ``assign``, i.e. in one of the
+    # statements that follow it in its block (but not in a function, which
+    # has variables of its own)
+    block = assign.parent
+    position = assign._slot[1][0]
+    item = var
+    while True:
+        parent = item.parent
+        if parent is None or isinstance(parent, FunctionDefinition):
+            return False
+        if parent is block:
+            return item._slot[0] == 'statements' and item._slot[1][0] > position
+        item = parent
+
+
+def _inStringOperand(var):
+    # whether ``var`` is (within) an operand of a string operator
+    op = var.parent
+    while isinstance(op, Operator):
+        if isinstance(op, (Matches, Has)):
+            return True
+        op = op.parent
+    return False
+
+
+def propagateConstants(tree, index):
+    '''
+    Substitutes the variables that are assigned exactly once from a literal
+    (at the places where that assignment is known to have been made) with
+    that literal, and folds the operators (and joins the string literals of
+    the additions) that this makes foldable. Returns
+    ``tree`` (or its replacement). The assignments themselves are kept.
+    '''
+    # note: in document order, so that a constant that is assigned from
+    #       another (e.g. "const b = a * 2") is a literal by the time it is
+    #       reached.
+    for assign in _constants(index):
+        if assign not in index or not isinstance(assign.value, Literal):
+            continue
+        value = assign.value.value
+        for var in index.named(Variable, assign.name):
+            if var.key is not None or var not in index or not _dominated(var, assign):
+                continue
+            if not isinstance(value, str) and _inStringOperand(var):
+                # e.g. "16 matches '17'", which is only valid for strings
+                continue
+            lit = var.replace(Literal(value))
+            if var is tree:
+                tree = lit
+            # fold the operators that now have literal arguments only
+            op = lit.parent
+            while isinstance(op, Operator):
+                folded = foldLiteral(op)
+                if folded is None:
+                    break
+                op.replace(folded)
+                if op is tree:
+                    tree = folded
+                op = folded.parent
+            # ...and join the string literals that are now adjacent
+            if isinstance(op, Add):
+                args = op.mergeStrings()
+                if len(args) < len(op.args):
+                    merged = op.replace(len(args) == 1 and args[0] or Add(*args))
+                    if op is tree:
+                        tree = merged
+    return tree
+
+
+def _drop(tree, item, new=None):
+    # removes the statement ``item`` (or, if it is not held in a list, e.g.
+    # if it is the statement of a loop, empties it), or replaces it by
+    # ``new``, and returns ``tree`` (or its replacement)
+    if new is None:
+        if item.parent is not None and isinstance(getattr(item.parent, item._slot[0]), list):
+            item.remove()
+            return tree
+        new = Block()
+    new = item.replace(new)
+    return item is tree and new or tree
+
+
+def _resolveConstantTests(tree, index):
+    # replaces the conditionals whose test is a literal by the statement
+    # that they execute (in document order, so that "else if" chains are
+    # resolved from the top)
+    for cond in index.instances(If):
+        if cond not in index or cond.debug is not None:
+            continue
+        if not isinstance(cond.test, Literal) or cond.test.type not in ('boolean', 'number'):
+            continue
+        tree = _drop(tree, cond, cond.match if cond.test.value else cond.nomatch)
+    return tree
+
+
+def _enclosingFunction(item):
+    item = item.parent
+    while item is not None and not isinstance(item, FunctionDefinition):
+        item = item.parent
+    return item
+
+
+def _removeUncalledFunctions(tree, index):
+    # function name => the functions that it calls (None for the script)
+    calls = dict()
+    for fcall in index.instances(FunctionCall):
+        fdef = _enclosingFunction(fcall)
+        calls.setdefault(fdef is not None and fdef.name or None, set()).add(fcall.name)
+    called = set()
+    pending = [None]
+    while len(pending) > 0:
+        for name in calls.get(pending.pop(), ()):
+            if name not in called:
+                called.add(name)
+                pending.append(name)
+    for fdef in index.instances(FunctionDefinition):
+        if fdef.name not in called and fdef in index:
+            tree = _drop(tree, fdef)
+    return tree
+
+
+def _removeUnreadAssignments(tree, index):
+    # the variables that are read from printraw() output
+    raw = set()
+    for out in index.instances(Output):
+        if out.raw:
+            for lit in out.statements:
+                raw.update(re.findall(r'\$\((\w+)', str(lit.value)))
+
+    def isRead(name):
+        return name in raw or len(index.named(Variable, name)) > 0
+
+    pending = deque(index.instances(Assign))
+    while len(pending) > 0:
+        assign = pending.popleft()
+        if assign not in index or isRead(assign.name):
+            continue
+        if not _isPure(assign.value) or (assign.key is not None and not _isPure(assign.key)):
+            continue
+        names = set(var.name for var in util.allchildren(assign, Variable))
+        tree = _drop(tree, assign)
+        # ...which may leave the variables that it read unread
+        for name in names:
+            if not isRead(name):
+                pending.extend(index.named(Assign, name))
+    return tree
+
+
+def eliminateDeadCode(tree, index):
+    '''
+    Removes the code of ``tree`` that has no effect: the conditionals whose
+    test is a literal are replaced by the branch that they take, and the
+    functions that are never called and the (side effect free) assignments
+    of variables that are never read are removed, as are the imports that
+    are left empty. Returns ``tree`` (or its replacement).
+
+    Note that a fragment that is evaluated (<esi:eval>) shares the functions
+    and variables of the script: if ``tree`` evaluates one, only the
+    conditionals are resolved.
+    '''
+    tree = _resolveConstantTests(tree, index)
+    if len(index.instances(Eval)) > 0:
+        return tree
+    tree = _removeUncalledFunctions(tree, index)
+    tree = _removeUnreadAssignments(tree, index)
+    for imp in index.instances(Import):
+        if imp not in index:
+            continue
+        if imp.inline is None or (isinstance(imp.inline, BlockFragment) and len(imp.inline.statements) == 0):
+            tree = _drop(tree, imp)
+    return tree
+
+
+# the variables that ESI defines (which are never renamed, even if a script
+# assigns them), in addition to all the HTTP_* variables
+ESI_VARIABLES = frozenset((
+    'ARGS', 'GEO', 'HTTP_ACCEPT_LANGUAGE', 'HTTP_COOKIE', 'HTTP_HOST', 'HTTP_REFERER',
+    'HTTP_USER_AGENT', 'MATCHES', 'QUERY_STRING', 'REMOTE_ADDR', 'REQUEST_METHOD',
+    'REQUEST_PATH', 'TRAFFIC_INFO', 'item',
+))
+
+# the functions that ESI defines, which renamed functions must not shadow
+ESI_FUNCTIONS = frozenset((
+    'add_cachebusting_header', 'add_header', 'base64_decode', 'base64_encode', 'bin_int',
+    'convert_from_unicode', 'convert_to_unicode', 'digest_md5', 'digest_md5_hex', 'dollar',
+    'dquote', 'exists', 'html_decode', 'html_encode', 'http_time', 'index', 'int', 'is_empty',
+    'join', 'last_rand', 'len', 'list_delitem', 'lower', 'lstrip', 'rand', 'replace', 'rindex',
+    'rstrip', 'set_redirect', 'set_response_code', 'squote', 'str', 'strftime', 'string_split',
+    'strip', 'substr', 'time', 'upper', 'url_decode', 'url_encode',
+))
+
+_FIRST = string.ascii_lowercase + string.ascii_uppercase
+_OTHER = _FIRST + string.digits + '_'
+
+
+def _shortNames(taken):
+    # yields the shortest identifiers first, skipping those in ``taken``
+    size = 1
+    while True:
+        for idx in range(len(_FIRST) * len(_OTHER) ** (size - 1)):
+            name = ''
+            for pos in range(size - 1):
+                idx, rest = divmod(idx, len(_OTHER))
+                name = _OTHER[rest] + name
+            name = _FIRST[idx] + name
+            if name not in taken:
+                yield name
+        size += 1
+
+
+def _symbols(index):
+    # returns the number of uses of each variable and each function that the
+    # script defines, by name (in document order, for stable renames), and
+    # the variable names that must not be renamed or reused.
+    from js2esi.token import ctokens
+    variables = dict()
+    functions = dict()
+    fixed = set(ESI_VARIABLES) | set(ctokens.reserved)
+    for item in index.instances(Assign) + index.instances(FunctionParam):
+        variables[item.name] = 0
+    for loop in index.instances(ForEach):
+        if loop.key is not None:
+            variables[loop.key] = 0
+    for op in index.instances(Matches):
+        if op.matchName is not None:
+            variables[op.matchName] = 0
+    for fdef in index.instances(FunctionDefinition):
+        functions[fdef.name] = 0
+    for out in index.instances(Output):
+        if out.raw:
+            for lit in out.statements:
+                fixed.update(re.findall(r'\$\((\w+)', str(lit.value)))
+    for name in index.names:
+        bykls = index.names[name]
+        if name in variables:
+            variables[name] += sum(len(bykls.get(kls, ())) for kls in (Assign, FunctionParam, Variable))
+        elif len(bykls.get(Variable, ())) > 0:
+            # read, but defined elsewhere (e.g. by ESI)
+            fixed.add(name)
+        if name in functions:
+            functions[name] += sum(len(bykls.get(kls, ())) for kls in (FunctionDefinition, FunctionCall))
+    for loop in index.instances(ForEach):
+        if loop.key is not None:
+            variables[loop.key] += 1
+    for op in index.instances(Matches):
+        if op.matchName is not None:
+            variables[op.matchName] += 1
+    return variables, functions, fixed
+
+
+def _renames(uses, fixed):
+    # maps the names in ``uses`` (but not those in ``fixed``) to the shortest
+    # names that are not in use, the most used names first
+    names = sorted((name for name in uses if name not in fixed), key=lambda name: -uses[name])
+    ret = dict()
+    short = _shortNames(fixed | set(uses))
+    new = next(short)
+    for name in names:
+        if len(new) < len(name):
+            ret[name] = new
+            new = next(short)
+    return ret
+
+
+def minify(tree, index, keep=(), renames=None):
+    '''
+    Renames the variables and functions that ``tree`` defines to the
+    shortest available names, the most used ones first, except for the
+    variables that ESI defines and for the names in ``keep``. Returns
+    ``tree``. If ``renames`` is given, it is filled with the renames, as
+    ``{'variables': {old: new}, 'functions': {old: new}}``.
+
+    Note that a fragment that is evaluated (<esi:eval>) shares the functions
+    and variables of the script: if ``tree`` evaluates one, nothing is
+    renamed.
+    '''
+    keep = set(keep)
+    variables, functions, fixed = _symbols(index)
+    if len(index.instances(Eval)) > 0:
+        variables = functions = dict()
+    fixed |= keep
+    fixed.update(name for name in variables if name.startswith('HTTP_'))
+    varmap = _renames(variables, fixed)
+    # (the functions that are called but not defined are ESI's, or unknown)
+    fixed = keep | ESI_FUNCTIONS | set(fcall.name for fcall in index.instances(FunctionCall))
+    funcmap = _renames(functions, fixed - set(functions))
+    for kls, names in ((Assign, varmap), (FunctionParam, varmap), (Variable, varmap),
+                       (FunctionDefinition, funcmap), (FunctionCall, funcmap)):
+        for name, new in names.items():
+            for item in index.named(kls, name):
+                index.rename(item, new)
+    for loop in index.instances(ForEach):
+        if loop.key in varmap:
+            loop.key = varmap[loop.key]
+    for op in index.instances(Matches):
+        if op.matchName in varmap:
+            op.matchName = varmap[op.matchName]
+    if renames is not None:
+        renames['variables'] = varmap
+        renames['functions'] = funcmap
+    return tree
+
+
+def optimize(tree, level=7, keep=(), renames=None):
+    '''
+    Optimizes ``tree`` at ``level`` (see :meth:`Item.optimize`), and returns
+    it (or its replacement). At level 9, the names in ``keep`` are not
+    renamed, and ``renames`` (if given) is filled with the renames (see
+    :func:`minify`).
+    '''
+    ret = tree.link()
+    with NodeIndex(ret) as index:
+        if level < 5:
+            # un-inline all inline functions
+            for fdef in index.instances(FunctionDefinition):
+                fdef.inline = False
+        else:
+            ret = resolveInlines(ret, index)
+        if level >= 3:
+            ret = foldLiterals(ret, index)
+        if level >= 6:
+            ret = propagateConstants(ret, index)
+        if level >= 8:
+            ret = eliminateDeadCode(ret, index)
+        if level >= 9:
+            ret = minify(ret, index, keep, renames)
+    return ret
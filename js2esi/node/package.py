@@ -10,6 +10,10 @@ __license__ = "Apache2"
 
 
 class Import(Statement):
+    __slots__ = ('src', 'force', 'inline')
+    # note: ``force`` is a Literal node when given as a named argument
+    _fields = ('force', 'inline')
+
     def __init__(self, src, force=False):
         super(Import, self).__init__()
         self.src = src
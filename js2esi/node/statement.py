@@ -9,10 +9,14 @@ __copyright__ = "Copyright 2017, Akamai Technologies"
 __license__ = "Apache2"
 
 
-class Statement(Item): pass
+class Statement(Item):
+    __slots__ = ()
 
 
 class BlockFragment(Statement):
+    __slots__ = ('statements',)
+    _fields = ('statements',)
+
     def __init__(self, *statements):
         super(BlockFragment, self).__init__()
         self.statements = []
@@ -48,6 +52,8 @@ class BlockFragment(Statement):
 
 
 class Block(BlockFragment):
+    __slots__ = ('explicit',)
+
     def __init__(self, *statements, **kwargs):
         super(Block, self).__init__(*statements)
         util.assertOnlyKeywords(kwargs, 'explicit')
@@ -73,24 +79,25 @@ class Block(BlockFragment):
                 groups.append(BlockFragment(st))
                 continue
             groups[-1].append(st)
+        # (group, assignment width, first comment)
+        layout = []
         for group in groups:
+            maxwid = 0
+            firstcomment = None
             if isinstance(group.statements[0], Assign):
-                group.maxwid = 0
                 for st in group.statements:
-                    group.maxwid = max(group.maxwid, st.width(ctxt))
-                continue
-            if isinstance(group.statements[0], Comment):
-                group.firstcomment = group.statements[0]
+                    maxwid = max(maxwid, st.width(ctxt))
+            elif isinstance(group.statements[0], Comment):
+                firstcomment = group.statements[0]
+            layout.append((group, maxwid, firstcomment))
         outdent = int(ctxt.indent) >= 1
         if outdent:
             ctxt.indent -= 1
         ctxt.write(ctxt.indent + '{\n')
         ctxt.indent += 1
-        for st in groups:
-            ctxt.assignwidth = 0
-            if hasattr(st, 'maxwid'):
-                ctxt.assignwidth = st.maxwid
-            ctxt.firstcomment = getattr(st, 'firstcomment', None)
+        for st, maxwid, firstcomment in layout:
+            ctxt.assignwidth = maxwid
+            ctxt.firstcomment = firstcomment
             st.js(ctxt)
         ctxt.indent -= 1
         ctxt.write(ctxt.indent + '}\n')
@@ -99,6 +106,8 @@ class Block(BlockFragment):
 
 
 class Output(BlockFragment):
+    __slots__ = ('raw', 'vars')
+
     # tbd: 'vars' should be auto-detectable... especially now that i have
     #      context.nodehier[]... the issue with doing that is that sometimes
     #      it will be unwanted, eg:
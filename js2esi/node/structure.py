@@ -10,6 +10,9 @@ __license__ = "Apache2"
 
 
 class List(Expression):
+    __slots__ = ('elements',)
+    _fields = ('elements',)
+
     def __init__(self, *args):
         super(List, self).__init__()
         self.elements = []
@@ -40,6 +43,10 @@ Array = List
 
 
 class Dictionary(Expression):
+    __slots__ = ('elements',)
+    # note: the elements are (key, value) tuples
+    _fields = ('elements',)
+
     def __init__(self, *args):
         super(Dictionary, self).__init__()
         self.elements = []
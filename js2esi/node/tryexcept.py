@@ -10,6 +10,9 @@ __license__ = "Apache2"
 
 
 class Try(Statement):
+    __slots__ = ('tryBlock', 'exceptBlock')
+    _fields = ('tryBlock', 'exceptBlock')
+
     def __init__(self, tryBlock, exceptBlock=None):
         super(Try, self).__init__()
         self.tryBlock = tryBlock
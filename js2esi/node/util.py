@@ -1,7 +1,6 @@
 """ js2esi.node.util
 Module to help with generating logical constructs.
 """
-import io
 
 __author__ = "Phil Grabner, Colin Bendell"
 __copyright__ = "Copyright 2017, Akamai Technologies"
@@ -52,15 +51,94 @@ class ContextIndent(object):
         return self.i * '  '
 
 
+# the number of writes that a Writer collects before passing them on
+CHUNKSIZE = 4096
+
+
+class Writer(object):
+    '''
+    A file-like object that collects the many small writes of the emitters as
+    a list of string parts, and passes them on to ``out`` joined into large
+    chunks (of ``chunksize`` writes) as they are written. A placeholder can be
+    reserved in the output and filled in once the text that follows it has
+    been written, which lets an emitter choose e.g. between two opening tags
+    without rendering the enclosed text twice. Nothing is passed on while a
+    placeholder is pending, and the rest is passed on by :meth:`flush`.
+    '''
+
+    def __init__(self, out=None, chunksize=CHUNKSIZE):
+        self.out = out
+        self.chunksize = chunksize
+        self.parts = []
+        self.pending = 0
+        if out is None:
+            # note: writing is by far the most frequent operation, and a
+            #       writer without ``out`` only collects...
+            self.write = self.parts.append
+
+    def write(self, text):
+        parts = self.parts
+        parts.append(text)
+        if len(parts) >= self.chunksize and self.pending == 0:
+            self.flush()
+
+    def flush(self):
+        if self.out is None or self.pending > 0 or len(self.parts) <= 0:
+            return
+        self.out.write(''.join(self.parts))
+        del self.parts[:]
+
+    def getvalue(self):
+        return ''.join(self.parts)
+
+    def placeholder(self):
+        self.pending += 1
+        self.parts.append('')
+        return len(self.parts) - 1
+
+    def fill(self, idx, text):
+        self.parts[idx] = text
+        self.pending -= 1
+        if self.pending == 0 and len(self.parts) >= self.chunksize:
+            self.flush()
+
+    def written(self, idx):
+        '''
+        Returns whether anything was written after the placeholder ``idx``.
+        '''
+        parts = self.parts
+        for pos in range(idx + 1, len(parts)):
+            if len(parts[pos]) > 0:
+                return True
+        return False
+
+    def contains(self, idx, chars):
+        '''
+        Returns whether any of ``chars`` was written after the placeholder
+        ``idx``.
+        '''
+        parts = self.parts
+        for pos in range(idx + 1, len(parts)):
+            for char in chars:
+                if char in parts[pos]:
+                    return True
+        return False
+
+
 class Context(object):
     def __init__(self):
         self.debug = False
         self.matchname = None
         self.testlevel = 0
         self.isvars = False
+        # whether to emit the shortest equivalent ESI (-Os) instead of the
+        # most generic one
+        self.size = False
         self.indent = ContextIndent()
         self.buffers = []
         self.out = None
+        # the stack of nodes being rendered
+        self.nodehier = []
         self.lib = []
         self.inlines = {}
 
@@ -69,7 +147,7 @@ class Context(object):
 
     def push_buffered(self):
         self.buffers.append(self.out)
-        self.out = io.StringIO()
+        self.out = Writer()
 
     def pop_buffered(self):
         ret = self.out.getvalue()
@@ -79,10 +157,36 @@ class Context(object):
     def save_buffered(self):
         self.out.write(self.pop_buffered())
 
+    def placeholder(self):
+        '''
+        Reserves a position in the output, which must then be filled in with
+        :meth:`fill` (see :class:`Writer`).
+        '''
+        if not isinstance(self.out, Writer):
+            # i.e. writing straight to a stream: collect the output until the
+            # placeholder is filled (see fill())
+            self.out = Writer(self.out, 0)
+        return self.out.placeholder()
+
+    def fill(self, idx, text):
+        self.out.fill(idx, text)
+        if self.out.chunksize == 0 and self.out.pending == 0:
+            self.out = self.out.out
+
 
 def allchildren(item, kls=None, test=None):
-    for sub in item.children:
+    # note: iterative (see also node.Visitor), so that walking a deep tree
+    #       does not cost O(depth) per node. the children of a node are only
+    #       looked up once it has been yielded, so the caller may replace them.
+    stack = list(item.children)
+    stack.reverse()
+    pop = stack.pop
+    while len(stack) > 0:
+        sub = pop()
         if (kls is None or isinstance(sub, kls)) and (test is None or test(sub)):
             yield sub
-        for i in allchildren(sub, kls=kls, test=test):
-            yield i
+        if sub._fields:
+            start = len(stack)
+            stack.extend(sub.children)
+            if len(stack) - start > 1:
+                stack[start:] = reversed(stack[start:])
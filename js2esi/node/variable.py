@@ -12,6 +12,9 @@ __license__ = "Apache2"
 
 
 class Variable(Expression):
+    __slots__ = ('name', 'key', 'default')
+    _fields = ('key', 'default')
+
     def __init__(self, name, key=None, default=None):
         super(Variable, self).__init__()
 
@@ -60,11 +63,16 @@ Var = Variable
 
 
 class Assign(Statement):
-    def __init__(self, name, valueExpr, key=None):
+    __slots__ = ('name', 'key', 'value', 'decl')
+    _fields = ('key', 'value')
+
+    def __init__(self, name, valueExpr, key=None, decl=None):
         super(Assign, self).__init__()
         self.name = name
         self.key = util.expr(key)
         self.value = util.expr(valueExpr)
+        # the declaration keyword ("const", "let" or "var"), if any
+        self.decl = decl
 
     @property
     def __label__(self):
@@ -79,10 +87,15 @@ class Assign(Statement):
             self.key.esi(ctxt)
             ctxt.write('}')
         ctxt.write('"')
-        val = self.value.esibuf(ctxt)
-        if '\n' in val or '"' in val:
-            return ctxt.write('>%s</esi:assign>' % val)
-        return ctxt.write(' value="%s"/>' % val)
+        # the value can only be an attribute if it has no newlines or quotes,
+        # which is only known once it has been written...
+        idx = ctxt.placeholder()
+        self.value.esi(ctxt)
+        if ctxt.out.contains(idx, '\n"'):
+            ctxt.fill(idx, '>')
+            return ctxt.write('</esi:assign>')
+        ctxt.fill(idx, ' value="')
+        return ctxt.write('"/>')
 
     def __js__(self, ctxt):
         ctxt.write(str(ctxt.indent))
@@ -0,0 +1,178 @@
+""" js2esi.node.visitor
+tree walking: visitors (:class:`Visitor`) and transformers (:class:`Transformer`)
+with per-class handlers, walking the tree with an explicit stack (i.e. their
+cost does not depend on the depth of the tree, and deep trees do not hit the
+recursion limit).
+"""
+
+from js2esi.node.base import Item, _getSubItems
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+class _Signal(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return self.name
+
+
+# handler return values: do not walk the children of the node, or stop the walk
+SKIP = _Signal('SKIP')
+STOP = _Signal('STOP')
+
+# visitor class => {node class: (visit handler, leave handler)}
+_dispatch = dict()
+
+
+def _getTable(vkls):
+    ret = _dispatch.get(vkls)
+    if ret is None:
+        ret = _dispatch[vkls] = dict()
+    return ret
+
+
+def _getHandlers(vkls, nkls):
+    visit = leave = None
+    for kls in nkls.__mro__:
+        if visit is None:
+            visit = getattr(vkls, 'visit_' + kls.__name__, None)
+        if leave is None:
+            leave = getattr(vkls, 'leave_' + kls.__name__, None)
+    ret = _getTable(vkls)[nkls] = (visit, leave)
+    return ret
+
+
+def _pushChildren(stack, item):
+    # pushes the children of ``item`` so that they are popped in order
+    start = len(stack)
+    for field in item._fields:
+        value = getattr(item, field)
+        if value is None:
+            continue
+        if isinstance(value, Item):
+            stack.append(value)
+        else:
+            stack.extend(_getSubItems(value))
+    if len(stack) - start > 1:
+        stack[start:] = reversed(stack[start:])
+
+
+class Visitor(object):
+    '''
+    Walks a tree in pre-order, calling the handlers that are defined for each
+    node's class (or for the nearest base class that has some): the
+    ``visit_CLASSNAME(node)`` method before walking the node's children, and
+    the ``leave_CLASSNAME(node)`` method after. E.g. ``visit_Operator()`` is
+    called for all the operators that have no more specific handler, such as
+    ``visit_Add()``, and ``visit_Item()`` for all the nodes.
+
+    A ``visit_`` handler can return :data:`SKIP` to not walk the node's
+    children (its ``leave_`` handler is still called), and any handler can
+    return :data:`STOP` to end the walk.
+    '''
+
+    def walk(self, tree):
+        '''
+        Walks ``tree``, and returns the node for which a handler returned
+        :data:`STOP` (or None).
+        '''
+        vkls = self.__class__
+        table = _getTable(vkls)
+        stack = [tree]
+        pop = stack.pop
+        while len(stack) > 0:
+            item = pop()
+            kls = item.__class__
+            if kls is tuple:
+                # a pending leave handler
+                item = item[0]
+                if table[item.__class__][1](self, item) is STOP:
+                    return item
+                continue
+            handlers = table.get(kls)
+            if handlers is None:
+                handlers = _getHandlers(vkls, kls)
+            visit, leave = handlers
+            ret = None
+            if visit is not None:
+                ret = visit(self, item)
+                if ret is STOP:
+                    return item
+            if leave is not None:
+                stack.append((item,))
+            if ret is SKIP or not kls._fields:
+                continue
+            # (inlined _pushChildren(), which makes up for much of a walk)
+            start = len(stack)
+            for field in kls._fields:
+                value = getattr(item, field)
+                if value is None:
+                    continue
+                if isinstance(value, Item):
+                    stack.append(value)
+                else:
+                    stack.extend(_getSubItems(value))
+            if len(stack) - start > 1:
+                stack[start:] = reversed(stack[start:])
+        return None
+
+
+class Transformer(Visitor):
+    '''
+    A :class:`Visitor` whose handlers can replace the node that they are
+    called for, by returning the replacement node (returning None, or the
+    node itself, keeps it). The nodes are replaced in place (see
+    :meth:`Item.replace`).
+
+    The replacement returned by a ``visit_`` handler is walked in place of
+    the node (i.e. its own ``visit_`` handler is called, so it must
+    eventually return a node that it keeps), whereas the replacement
+    returned by a ``leave_`` handler is not walked: its children are
+    expected to have been walked already.
+    '''
+
+    def transform(self, tree):
+        '''
+        Walks and transforms ``tree``, and returns it (or its replacement).
+        '''
+        vkls = self.__class__
+        table = _getTable(vkls)
+        root = tree.link()
+        stack = [tree]
+        while len(stack) > 0:
+            item = stack.pop()
+            kls = item.__class__
+            if kls is tuple:
+                item = item[0]
+                ret = table[item.__class__][1](self, item)
+                if ret is STOP:
+                    return root
+                if ret is not None and ret is not item:
+                    ret = item.replace(ret)
+                    if item is root:
+                        root = ret
+                continue
+            handlers = table.get(kls)
+            if handlers is None:
+                handlers = _getHandlers(vkls, kls)
+            visit, leave = handlers
+            ret = None
+            if visit is not None:
+                ret = visit(self, item)
+                if ret is STOP:
+                    return root
+                if ret is not None and ret is not SKIP and ret is not item:
+                    ret = item.replace(ret)
+                    if item is root:
+                        root = ret
+                    stack.append(ret)
+                    continue
+            if leave is not None:
+                stack.append((item,))
+            if ret is not SKIP and kls._fields:
+                _pushChildren(stack, item)
+        return root
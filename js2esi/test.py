@@ -13,11 +13,15 @@ schemes can be loaded.
 
 """
 
+import copy
 import difflib
 import io
+import json
 import os
 import re
+import shutil
 import sys
+import tempfile
 import unittest
 
 from js2esi import node
@@ -60,7 +64,7 @@ class MultiLineEqual:
             cdiff.append(line)
         for line in cdiff:
             print (line, file=sys.stderr)
-            # super(TestJs2Esi, self).assertEqual('expected', 'received')
+        raise self.failureException(msg or 'strings differ (see the diff above)')
 
 
 class EsiEqual(MultiLineEqual):
@@ -142,6 +146,264 @@ class TestJs2Esi(unittest.TestCase, EsiEqual):
               '<esi:assign name="v" value="$i(\'string\')"/>'
         self.assertEqualEsi(chk, self.js2esi(js, 3))
 
+    def test_collapseLiterals(self):
+        js = 'a = 1 < 2; b = "abc" >= "abd"; c = !true; d = true && (2 == 3); f = x && false;' \
+             ' g = 1 / 0; h = "x" + ".0"; i = "a" + 1; j = 7 / 2 * 2; k = true + 1; l = ~(1 << 3);'
+        chk = '<esi:assign name="a" value="1"/><esi:assign name="b" value="0"/>' \
+              '<esi:assign name="c" value="0"/><esi:assign name="d" value="0"/>' \
+              '<esi:assign name="f" value="0"/><esi:assign name="g" value="1/0"/>' \
+              '<esi:assign name="h" value="\'x.0\'"/><esi:assign name="i" value="\'a\'+1"/>' \
+              '<esi:assign name="j" value="6"/><esi:assign name="k" value="1+1"/>' \
+              '<esi:assign name="l" value="-9"/>'
+        self.assertTrue(chk == self.js2esi(js))
+        # a function call is not dropped, for its side effects (other expressions are)
+        js = "a = add_header('X-A', 'b') && false; b = x && false; c = (x + 1 > 2) || true;"
+        chk = '<esi:assign name="a" value="$add_header(\'X-A\',\'b\')&&0"/><esi:assign name="b" value="0"/>' \
+              '<esi:assign name="c" value="1"/>'
+        self.assertTrue(chk == self.js2esi(js, 3))
+        # ESI integers are 32 bits wide
+        js = 'a = (200 << 24) >> 24; b = ~0 & 255; c = 1 << 40; d = 2147483647 + 1;'
+        chk = '<esi:assign name="a" value="-56"/><esi:assign name="b" value="255"/>' \
+              '<esi:assign name="c" value="1<<40"/><esi:assign name="d" value="2147483647+1"/>'
+        self.assertTrue(chk == self.js2esi(js, 3))
+
+    def test_propagateConstants(self):
+        js = 'w = a; const a = 2; const b = a * 3; c = b + 1; c = 0; let d = "x";' \
+             ' if (y) { let e = 1; f = e + d; } g = e; for (const item of l) { h = item; } item = 3;'
+        chk = '<esi:assign name="w" value="$(a)"/><esi:assign name="a" value="2"/>' \
+              '<esi:assign name="b" value="6"/><esi:assign name="c" value="7"/>' \
+              '<esi:assign name="c" value="0"/><esi:assign name="d" value="\'x\'"/>' \
+              '<esi:choose><esi:when test="$(y)"><esi:assign name="e" value="1"/>' \
+              '<esi:assign name="f" value="1+\'x\'"/></esi:when></esi:choose>' \
+              '<esi:assign name="g" value="$(e)"/><esi:foreach collection="$(l)">' \
+              '<esi:assign name="h" value="$(item)"/></esi:foreach><esi:assign name="item" value="3"/>'
+        self.assertTrue(chk == self.js2esi(js))
+        # an evaluated fragment may reassign anything but constants
+        js = 'const a = 2; b = 3; eval(src="/f"); c = a + b;'
+        self.assertTrue(self.js2esi(js).endswith('<esi:assign name="c" value="2+$(b)"/>'))
+        self.assertTrue(self.js2esi(js, 5).endswith('<esi:assign name="c" value="$(a)+$(b)"/>'))
+        # a match rebinds its match name
+        js = "m = 'none'; if (QUERY_STRING matches '(a)' as m) { print('x'); } printv(m);"
+        self.assertTrue(self.js2esi(js, 6).endswith('<esi:vars>$(m)</esi:vars>'))
+        # the string literals that propagation makes adjacent are joined
+        js = "const f = 'aE'; v = 'd' + f + x;"
+        self.assertTrue(self.js2esi(js, 6).endswith('<esi:assign name="v" value="\'daE\'+$(x)"/>'))
+
+    def test_eliminateDeadCode(self):
+        js = 'const debug = false; if (debug) { a = 1; } else if (HTTP_HOST == "x") { b = 2; } else { c = 3; }' \
+             ' function f(x) { return x + 1; } function g(x) { return f(x); } function h() { return 1; }' \
+             ' d = 1; e = d + 1; s = add_header("x", "y"); for (const i of l) if (0) { print(i); }' \
+             ' print(b, g(2));'
+        chk = '<esi:choose><esi:when test="$(HTTP_HOST)==\'x\'"><esi:assign name="b" value="2"/></esi:when></esi:choose>' \
+              '<esi:function name="f"><esi:assign name="x" value="$(ARGS{0})"/><esi:return value="$(x)+1"/></esi:function>' \
+              '<esi:function name="g"><esi:assign name="x" value="$(ARGS{0})"/><esi:return value="$f($(x))"/></esi:function>' \
+              '<esi:assign name="s" value="$add_header(\'x\',\'y\')"/><esi:foreach collection="$(l)" item="i"></esi:foreach>' \
+              '$(b)$g(2)'
+        self.assertTrue(chk == self.js2esi(js, 8))
+        self.assertTrue('<esi:function name="h">' in self.js2esi(js, 7))
+        # an evaluated fragment may call any function, and read any variable
+        js = 'eval(src="/e"); function h() { return 1; } a = 1; if (false) { b = 1; }'
+        chk = '<esi:eval src="/e"/><esi:function name="h"><esi:return value="1"/></esi:function>' \
+              '<esi:assign name="a" value="1"/>'
+        self.assertTrue(chk == self.js2esi(js, 8))
+        # a true test without statements executes none
+        tree = node.Block(node.If(node.Literal(True), None, node.Block(node.Output('no'))), node.Output('end'))
+        self.assertTrue('end' == tree.optimize(8).esibuf())
+
+    def test_minify(self):
+        js = 'function compute(value) { return value * 2; } longName = HTTP_HOST; a = longName;' \
+             ' for (const entry of longName) { total = compute(entry) + a; }' \
+             ' if (longName matches "x" as found) { print(found[0], total, keepMe); } keepMe = 1;'
+        chk = '<esi:function name="a"><esi:assign name="d" value="$(ARGS{0})"/>' \
+              '<esi:return value="$(d)*2"/></esi:function><esi:assign name="b" value="$(HTTP_HOST)"/>' \
+              '<esi:assign name="a" value="$(b)"/><esi:foreach collection="$(b)" item="e">' \
+              '<esi:assign name="c" value="$a($(e))+$(a)"/></esi:foreach><esi:choose>' \
+              '<esi:when test="$(b) matches \'x\'" matchname="f">$(f{0})$(c)$(keepMe)</esi:when>' \
+              '</esi:choose><esi:assign name="keepMe" value="1"/>'
+        context = cli.Context()
+        context.filename = '<STRING>'
+        context.options = adict.new(verbose=0, lex=False, warn=False)
+        context.errfp = sys.stderr
+        renames = dict()
+        tree = cli.js2node(context, io.StringIO(js)).optimize(9, keep=['keepMe'], renames=renames)
+        out = io.StringIO()
+        cli.node2esi(context, tree, out)
+        self.assertTrue(chk == out.getvalue())
+        self.assertEqual(dict(compute='a'), renames['functions'])
+        self.assertEqual(dict(longName='b', total='c', value='d', entry='e', found='f'), renames['variables'])
+        # the one-character names read back (esi => js => esi)
+        mid = io.StringIO()
+        cli.node2js(context, cli.esi2node(context, io.StringIO(chk)), mid)
+        esi = io.StringIO()
+        cli.node2esi(context, cli.js2node(context, io.StringIO(mid.getvalue())), esi)
+        self.assertTrue(chk == esi.getvalue())
+        self.assertNotIn('<esi:function name="a">', self.js2esi(js, 8))
+
+    def test_optimizeSize(self):
+        js = '//@esi-comment note\nif (x matches "a.*" && y has z) { v = "a" + x + "b" + "c"; }' \
+             ' w = n + "1" + "2"; p = "\'a\' \'b\' \'c\'."; q = "\'a\' \'b\' \'c\'";'
+        chk = '<esi:choose><esi:when test="($(x) matches \'a.*\')&&($(y) has $(z))">' \
+              '<esi:assign name="v" value="\'a\'+$(x)+\'bc\'"/></esi:when></esi:choose>' \
+              '<esi:assign name="w" value="$(n)+\'1\'+\'2\'"/>' \
+              '<esi:assign name="p" value="\'\'\'\'a\' \'b\' \'c\'.\'\'\'"/>' \
+              '<esi:assign name="q" value="\'\\\'a\\\' \\\'b\\\' \\\'c\\\'\'"/>'
+        context = cli.Context()
+        context.filename = '<STRING>'
+        context.options = adict.new(verbose=0, lex=False, warn=True, optlevel=7, size=True)
+        context.errfp = io.StringIO()
+        out = io.StringIO()
+        cli.compileScript(context, io.StringIO(js), out)
+        self.assertTrue(chk == out.getvalue())
+        # the generic ESI also has the warning banner
+        generic = len(self.js2esi(js)) + 56
+        self.assertEqual('[  ] <STRING>: %d bytes, %d bytes saved by -Os (%d bytes without)\n'
+                         % (len(chk), generic - len(chk), generic), context.errfp.getvalue())
+
+    def test_sizeReport(self):
+        js = 'function inline twice(x) { return x * 2; } function f(a) { return twice(a) + "suffix"; }' \
+             ' v = f(twice(n)); w = "suffix";'
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'report.json')
+            context = cli.Context()
+            context.filename = 'f.js'
+            context.options = adict.new(verbose=0, lex=False, warn=False, optlevel=7, size_report=path)
+            context.errfp = io.StringIO()
+            out = io.StringIO()
+            cli.compileScript(context, io.StringIO(js), out)
+            with io.open(path) as fp:
+                report = json.load(fp)
+        finally:
+            shutil.rmtree(tmpdir)
+        self.assertEqual(len(out.getvalue()), report['total'])
+        self.assertEqual([dict(function='f', bytes=118), dict(function='(top level)', bytes=80)],
+                         report['functions'])
+        self.assertEqual([dict(module='f.js', bytes=198)], report['modules'])
+        self.assertEqual([dict(function='twice', site=1, caller='f', module='f.js', bytes=6),
+                          dict(function='twice', site=2, caller='(top level)', module='f.js', bytes=6)],
+                         report['inlined'])
+        self.assertEqual(dict(literal="'suffix'", count=2, bytes=16), report['literals'][0])
+        self.assertIn('twice() #2 in (top level)', context.errfp.getvalue())
+
+    def test_sizeReportBuffered(self):
+        from js2esi.tools import sizereport
+        context = sizereport.CountingContext()
+        context.out = io.StringIO()
+        context.nodehier.origins.append(('f', None, None, None))
+        context.push_buffered()
+        context.write('x')
+        text = context.pop_buffered()
+        context.nodehier.origins.pop()
+        # the same (interned) text, written before the buffered one
+        context.write('x')
+        context.write(text)
+        self.assertEqual([((None, None, None, None), 'x'), (('f', None, None, None), 'x')],
+                         context.records[0])
+
+    def test_foldDivision(self):
+        from js2esi.node import interpreter
+        from js2esi.tools import run
+        # integers divide as ESI does, truncated towards zero
+        js = 'a = -7 % 3; b = 7 / 2; c = -7 / 2; d = 7 % -3; e = 6 / 3; f = 7 / 2 * 2;'
+        context = cli.Context()
+        context.filename = '<STRING>'
+        context.options = adict.new(verbose=0, lex=False, node=False, deps=None, warn=False)
+        context.errfp = io.StringIO()
+        context.lib = []
+        results = []
+        for level in (0, 7):
+            context.options.optlevel = level
+            machine = interpreter.Interpreter()
+            machine.run(run.load(context, io.StringIO(js)))
+            results.append([machine.lookup(name) for name in 'abcdef'])
+        self.assertEqual([-1, 3, -3, 1, 2, 6], results[0])
+        self.assertEqual(results[0], results[1])
+        self.assertTrue('<esi:assign name="a" value="-1"/><esi:assign name="b" value="3"/>' in self.js2esi(js))
+
+    def test_costModel(self):
+        from js2esi.node import cost
+        js = 'function f(s) { if (s matches "a") { include(src="/a", alt="/b"); } return s; }' \
+             ' for (x of [1, 2, 3]) { y = f(x); } if (z) { eval(src="/e"); } for (x of l) { w = len(x); }'
+        context = cli.Context()
+        context.filename = '<STRING>'
+        context.options = adict.new(verbose=0, lex=False, warn=False, max_cost=1000)
+        context.errfp = io.StringIO()
+        tree = cli.js2node(context, io.StringIO(js)).optimize(7)
+        report = cost.CostModel(tree).report()
+        # the include and its alternative, on the worst path only
+        self.assertEqual(dict(worst=213, typical=63.0,
+                              counts=dict(worst=dict(lookup=3, regex=1, include=2),
+                                          typical=dict(lookup=3, regex=1, include=0.5))),
+                         report['functions']['f'])
+        # 3 calls to f(), the eval, and a loop over a collection of unknown size
+        script = report['script']
+        self.assertEqual((1212, 327.0), (script['worst'], script['typical']))
+        self.assertEqual(dict(iteration=103, lookup=114, call=3, regex=3, include=6, eval=1, builtin=100),
+                         script['counts']['worst'])
+        self.assertRaises(cli.CompilationErrors, cli.checkCost, context, tree)
+        self.assertIn('worst-case cost 1212 exceeds the maximum (1000)', context.errfp.getvalue())
+        # a range with literal bounds has a known size
+        tree = cli.js2node(context, io.StringIO('l = [1..50]; for (x of l) { y = x; }')).optimize(7)
+        self.assertEqual(101, cost.CostModel(tree).report()['script']['worst'])
+        # a function defined in a block costs nothing where it is defined
+        js = 'if (z) function g(a) { return a; } for (x of [1, 2]) function h() { return 1; }'
+        tree = cli.js2node(context, io.StringIO(js)).optimize(0)
+        self.assertEqual(dict(lookup=1, iteration=2), cost.CostModel(tree).report()['script']['counts']['worst'])
+
+    def test_interpreter(self):
+        from js2esi.node import interpreter
+        from js2esi.tools import run
+        esi = '<esi:function name="dbl"><esi:return value="$(ARGS{0}) * 2"/></esi:function>' \
+              '<esi:choose><esi:when test="$(HTTP_USER_AGENT) matches \'(iPhone)\'">mobile</esi:when>' \
+              '<esi:otherwise>desktop</esi:otherwise></esi:choose>' \
+              '<esi:foreach collection="[1..5]"><esi:vars>$(item),</esi:vars>' \
+              '<esi:choose><esi:when test="$(item) == 2"><esi:break/></esi:when></esi:choose></esi:foreach>' \
+              '<esi:vars>[$dbl(3)][$(HTTP_COOKIE{id})][$(QUERY_STRING{b})][$(MATCHES{1})]</esi:vars>' \
+              '<esi:try><esi:attempt>A<esi:include src="/missing"/></esi:attempt>' \
+              '<esi:except>E</esi:except></esi:try><esi:include src="http://example.com/frag/a.html"/>'
+        context = cli.Context()
+        context.filename = '<STRING>.esi'
+        context.options = adict.new(verbose=0, lex=False, node=False, deps=None, warn=False, optlevel=7)
+        context.errfp = io.StringIO()
+        context.lib = []
+        stubs = tempfile.mkdtemp()
+        try:
+            os.mkdir(os.path.join(stubs, 'frag'))
+            with io.open(os.path.join(stubs, 'frag', 'a.html'), 'w') as fp:
+                fp.write('FRAG')
+            request = interpreter.Request(headers={'User-Agent': 'Mozilla (iPhone)'}, cookies={'id': '42'},
+                                          query='a=1&b=x')
+            machine = interpreter.Interpreter(request, stubs, run.makeParser(context))
+            machine.run(run.load(context, io.StringIO(esi)))
+        finally:
+            shutil.rmtree(stubs)
+        report = machine.report()
+        self.assertEqual('mobile1,2,[6][42][x][iPhone]EFRAG', report['output'])
+        self.assertEqual(dict(regex=1, lookup=9, iteration=2, call=1, include=2), report['counts'])
+        self.assertEqual(226, report['cost'])
+        # compiled from js: a function called as a statement is executed
+        context.filename = '<STRING>'
+        tree = run.load(context, io.StringIO('add_header("X-Test", "yes"); v = 1 + 1; printv(v);'))
+        machine = interpreter.Interpreter(parse=run.makeParser(context))
+        self.assertEqual('2', machine.run(tree))
+        self.assertEqual([('X-Test', 'yes')], machine.report()['headers'])
+        self.assertRaises(interpreter.IncludeError, machine.run,
+                          run.load(context, io.StringIO('include(src="/missing");')))
+        # with the names shortened, and the expressions minified
+        context.options.optlevel = 9
+        js = 'function twice(value) { return value * 2; } total = twice(3) + 1; printv(total);'
+        machine = interpreter.Interpreter(parse=run.makeParser(context))
+        self.assertTrue('7' == machine.run(run.load(context, io.StringIO(js))))
+        self.assertTrue('<STRING>' == context.filename)
+        # a falsy argument is passed as is, not replaced with the default
+        js = 'function f(a = "x") { return "[" + a + "]"; } v = f(0) + f("") + f();'
+        machine.run(cli.js2node(context, io.StringIO(js)))
+        self.assertTrue('[0][][x]' == machine.lookup('v'))
+        # a builtin that fails is an evaluation error
+        for esi in ('<esi:vars>$bin_int(\'x\')</esi:vars>', '<esi:vars>$http_time(99999999999999999999)</esi:vars>'):
+            self.assertRaises(interpreter.InterpreterError, machine.run,
+                              run.load(context, io.StringIO(esi), esi=True))
+
     def test_inline_ok(self):
         js = 'function inline i(x) {return x*2;} v = i(2);'
         chk = '<esi:assign name="v" value="4"/>'
@@ -157,6 +419,469 @@ class TestJs2Esi(unittest.TestCase, EsiEqual):
         chk = '<esi:assign name="v" value="6"/>'
         self.assertEqualEsi(chk, self.js2esi(js))
 
+    def test_inline_parameterOnly(self):
+        js = 'function inline id(x) return x; v = id(3); w = id(id(y));'
+        chk = '<esi:assign name="v" value="3"/><esi:assign name="w" value="$(y)"/>'
+        self.assertEqualEsi(chk, self.js2esi(js))
+
+    def test_inline_callGraph(self):
+        # definitions inline their callees whatever the order they are defined in
+        js = 'function inline a(x) return b(x) + c(x); function inline b(x) return c(c(x)) * 2;' \
+             ' function inline c(x) return x + 1; v = a(y);'
+        chk = '<esi:assign name="v" value="((($(y)+1)+1)*2)+($(y)+1)"/>'
+        self.assertTrue(chk == self.js2esi(js))
+
+    def test_inline_recursive(self):
+        js = 'function inline a(x) return b(x); function inline b(x) return c(x) + 1;' \
+             ' function inline c(x) return b(x) * 2; v = a(1);'
+        self.assertRaisesRegexp(node.StructureError, r'recursive inlined function a\(\) detected',
+                                self.js2esi, js)
+        js = 'function inline f(x) return x * f(x - 1); v = f(3);'
+        self.assertRaisesRegexp(node.StructureError, r'recursive inlined function f\(\) detected',
+                                self.js2esi, js)
+
+    def test_node_replace(self):
+        lit = node.Literal(2)
+        var = node.Variable('b')
+        op = node.Plus(node.Literal(1), lit)
+        tree = node.Block(node.Assign('a', op), node.Assign('d', node.Dictionary((node.Literal('k'), var))))
+        tree.link()
+        self.assertIs(op, lit.parent)
+        self.assertIs(tree, op.parent.parent)
+        new = lit.replace(node.Variable('c'))
+        self.assertIs(op, new.parent)
+        self.assertIsNone(lit.parent)
+        self.assertTrue('1+$(c)' == op.esibuf())
+        self.assertIs(op, tree.statements[0].replace(node.Assign('a', op)).value)
+        self.assertIs(op, op.replace(op))
+        var.replace(node.Literal(3))
+        self.assertTrue('<esi:assign name="a" value="1+$(c)"/><esi:assign name="d" value="{\'k\':3}"/>'
+                        == tree.esibuf())
+        # copies are unlinked (and do not drag the rest of the tree along)
+        self.assertIsNone(copy.deepcopy(op).parent)
+
+    def test_visitor(self):
+        class Recorder(node.Visitor):
+            def __init__(self):
+                self.events = []
+
+            def visit_Item(self, item):
+                self.events.append(item.__label__)
+
+            def visit_FunctionCall(self, fcall):
+                self.events.append(fcall.__label__)
+                return node.SKIP
+
+            def leave_Operator(self, op):
+                self.events.append('/' + op.__label__)
+
+            def visit_Variable(self, var):
+                if var.name == 'stop':
+                    return node.STOP
+
+        tree = node.Block(node.Assign('a', node.Plus(node.Literal(1), node.FunctionCall('f', node.Literal(2)))),
+                          node.Assign('b', node.Variable('stop')), node.Assign('c', node.Literal(3)))
+        visitor = Recorder()
+        self.assertIs(tree.statements[1].value, visitor.walk(tree))
+        self.assertEqual(['node.Block', 'node.Assign(a)', 'node.Add(+)', 'node.Literal(1)',
+                          'node.FunctionCall(f)', '/node.Add(+)', 'node.Assign(b)'], visitor.events)
+
+        class Doubler(node.Transformer):
+            def leave_Literal(self, lit):
+                return node.Literal(lit.value * 2)
+
+        # deeper than the recursion limit
+        tree = node.Literal(1)
+        for idx in range(sys.getrecursionlimit() + 100):
+            tree = node.Not(tree)
+        tree = Doubler().transform(node.Not(tree))
+        self.assertEqual(sys.getrecursionlimit() + 101, len(list(node.allchildren(tree))))
+        self.assertEqual(2, list(node.allchildren(tree, node.Literal))[0].value)
+        self.assertIsInstance(Doubler().transform(node.Literal(3)), node.Literal)
+
+        # matchname through a negation
+        cond = node.If(node.Not(node.Matches(node.Variable('a'), node.Literal('x'))), node.Block())
+        cond.setMatchName('m')
+        self.assertEqual('m', cond.test.args[0].matchName)
+
+    def test_node_index(self):
+        call = node.FunctionCall('f', node.Plus(node.Literal(1), node.Variable('b')))
+        tree = node.Block(node.Assign('a', call), node.Assign('b', node.FunctionCall('g')),
+                          node.Assign('c', node.FunctionCall('f', node.Literal(2))))
+        with node.NodeIndex(tree.link()) as index:
+            self.assertEqual(11, len(index))
+            self.assertEqual(['a', 'b', 'c'], [e.name for e in index.instances(node.Assign)])
+            self.assertEqual(1, len(index.instances(node.Operator)))
+            self.assertIs(call, index.calls('f')[0])
+            self.assertEqual(['f', 'g', 'f'], [e.name for e in index.calls('f', 'g')])
+            self.assertEqual(1, len(index.named(node.Item, 'a')))
+            # the index follows replacements: the old subtree is dropped
+            var = call.args[0].args[1]
+            new = call.replace(node.FunctionCall('g', node.Literal(3)))
+            self.assertNotIn(call, index)
+            self.assertNotIn(var, index)
+            self.assertIn(new.args[0], index)
+            self.assertEqual([], index.instances(node.Operator))
+            self.assertEqual(['g', 'g'], [e.name for e in index.calls('g')])
+            self.assertEqual(1, len(index.calls('f')))
+            # ...and removals, which re-link the following statements
+            last = tree.statements[2]
+            self.assertIs(tree.statements[0], tree.statements[0].remove())
+            self.assertNotIn(new, index)
+            last = last.replace(node.Assign('c', node.Literal(5)))
+            self.assertIs(last, tree.statements[1])
+            self.assertEqual(['b', 'c'], [e.name for e in index.instances(node.Assign)])
+        # ...but only while attached
+        tree.statements[0].replace(node.Assign('b', node.Literal(4)))
+        self.assertEqual(1, len(index.calls('g')))
+
+    def test_node_fields(self):
+        # every node held by a node must be reachable through its declared fields
+        js = 'require("moddir/trim.js", force=true);' \
+             ' function inline f(a, b=1) { return a + b; }' \
+             ' d = {"k": [f(1), LIST[0]]};' \
+             ' if ( HTTP_HOST == "x" ) { for ( const e of d ) { break; } } else { debug(d); }' \
+             ' try { include(src="/a", alt="/b", setHeader=["h: v"]); } except { y = !d; }'
+        context = cli.Context()
+        context.filename = os.path.join(os.path.dirname(__file__), 'test', '<STRING>')
+        context.options = adict.new(verbose=0, lex=False, warn=False)
+        context.errfp = sys.stderr
+        tree = cli.js2node(context, io.StringIO(js))
+        cli.resolveImports(context, tree)
+
+        def held(value):
+            if isinstance(value, node.Item):
+                yield value
+            elif isinstance(value, (list, tuple)):
+                for v in value:
+                    for i in held(v):
+                        yield i
+
+        def attributes(item):
+            for kls in reversed(item.__class__.__mro__):
+                for k in getattr(kls, '__slots__', ()):
+                    if k not in ('_parent', '_slot') and hasattr(item, k):
+                        yield getattr(item, k)
+
+        seen = set()
+        for item in [tree] + list(node.allchildren(tree)):
+            seen.add(item.__class__)
+            self.assertFalse(hasattr(item, '__dict__'), item.__class__.__name__)
+            expected = [i for v in attributes(item) for i in held(v)]
+            self.assertEqual([id(e) for e in expected], [id(e) for e in item.children],
+                             '%s._fields' % (item.__class__.__name__,))
+        for kls in (node.Import, node.FunctionDefinition, node.FunctionParam, node.Dictionary,
+                    node.List, node.If, node.ForEach, node.Try, node.Include, node.Not):
+            self.assertIn(kls, seen)
+
+    def test_parser_plusChain(self):
+        # a long concatenation builds its operands once, into a tuple
+        js = 'v = "a"' + ' + x' * 5000 + '; w = 1 + (2 + y) + 3;'
+        context = cli.Context()
+        context.filename = '<STRING>'
+        context.options = adict.new(verbose=0, lex=False, warn=False)
+        context.errfp = io.StringIO()
+        tree = cli.js2node(context, io.StringIO(js))
+        chain, nested = [op for op in node.allchildren(tree) if isinstance(op, node.Plus)][:2]
+        self.assertEqual((tuple, 5001), (type(chain.args), len(chain.args)))
+        self.assertEqual(tuple, type(nested.args))
+        self.assertEqual(3, len(nested.args))
+
+    def test_emitter_placeholders(self):
+        tree = node.Block(
+            node.Assign('a', 'x"y'),
+            node.If(node.Variable('b'), node.Assign('c', 1), node.Block(node.Assign('d', 2))),
+            node.If(node.Variable('b'), node.Assign('c', 1), node.Block()))
+        expected = '<esi:assign name="a">\'x"y\'</esi:assign>' \
+                   '<esi:choose><esi:when test="$(b)"><esi:assign name="c" value="1"/></esi:when>' \
+                   '<esi:otherwise><esi:assign name="d" value="2"/></esi:otherwise></esi:choose>' \
+                   '<esi:choose><esi:when test="$(b)"><esi:assign name="c" value="1"/></esi:when></esi:choose>'
+        self.assertTrue(expected == tree.esibuf())
+        # straight to a stream, i.e. without a Writer set up by node2esi
+        ctxt = node.Context()
+        ctxt.out = io.StringIO()
+        tree.esi(ctxt)
+        self.assertIsInstance(ctxt.out, io.StringIO)
+        self.assertTrue(expected == ctxt.out.getvalue())
+        # chunks are passed on as they are written, but not while a
+        # placeholder is pending
+        out = io.StringIO()
+        writer = node.Writer(out, 2)
+        writer.write('a')
+        idx = writer.placeholder()
+        writer.write('b')
+        writer.write('c')
+        self.assertEqual('', out.getvalue())
+        writer.fill(idx, 'X')
+        writer.write('d')
+        writer.write('e')
+        self.assertEqual('aXbcde', out.getvalue())
+
+    def test_machinery_reused(self):
+        lexer1, parser1 = cli.getMachinery(cli.ctokens, cli.cparser, 'clextab', 'cparsetab')
+        lexer1.push_state('multicomment')
+        lexer2, parser2 = cli.getMachinery(cli.ctokens, cli.cparser, 'clextab', 'cparsetab')
+        self.assertIs(parser1, parser2)
+        self.assertIsNot(lexer1, lexer2)
+        self.assertEqual('INITIAL', lexer2.lexstate)
+        self.assertEqual([], lexer2.lexstatestack)
+
+    def test_machinery_tablesCurrent(self):
+        # if this fails, run "python -m js2esi.token.tables" to regenerate them
+        from js2esi.token import tables
+        self.assertEqual([], tables.check())
+
+    def test_machinery_afterError(self):
+        self.assertRaises(cli.CompilationErrors, self.js2esi, 'v = "unterminated;\n//@esi-comment x\n')
+        self.assertEqualEsi('<esi:assign name="v" value="1"/>', self.js2esi('v = 1;'))
+
+    def test_libraryIndex(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            for lib in ('a', 'b'):
+                os.makedirs(os.path.join(tmpdir, lib, 'sub'))
+                with io.open(os.path.join(tmpdir, lib, 'sub', 'mod.js'), 'w') as fp:
+                    fp.write('v = 1;')
+            context = cli.Context()
+            context.options = adict.new(verbose=3)
+            context.errfp = io.StringIO()
+            context.lib = [os.path.join(tmpdir, 'b'), os.path.join(tmpdir, 'a')]
+            frompath = os.path.join(tmpdir, 'entry.js')
+            # the first lookup directory wins
+            self.assertEqual(os.path.join(tmpdir, 'b', 'sub', 'mod.js'),
+                             cli.findImport(context, './sub/mod.js', frompath))
+            self.assertIsNone(cli.findImport(context, 'new.js', frompath))
+            self.assertIn('tried "%s" and failed: file not found' % (os.path.join(tmpdir, 'a', 'new.js'),),
+                          context.errfp.getvalue())
+            # only the directories that imports use are listed
+            self.assertEqual(sorted(os.path.join(tmpdir, e) for e in ('a', 'b', os.path.join('b', 'sub'))),
+                             sorted(context.libindex.dirs))
+            # new files are only seen after a refresh
+            with io.open(os.path.join(tmpdir, 'a', 'new.js'), 'w') as fp:
+                fp.write('v = 2;')
+            self.assertIsNone(cli.findImport(context, 'new.js', frompath))
+            self.assertEqual([os.path.join(tmpdir, 'a')], context.libindex.refresh())
+            self.assertEqual(os.path.join(tmpdir, 'a', 'new.js'), cli.findImport(context, 'new.js', frompath))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_moduleCache(self):
+        from js2esi.tools import cache
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'mod.js')
+            with io.open(path, 'w') as fp:
+                fp.write('function one() { return 1; }')
+            context = cli.Context()
+            context.options = adict.new(verbose=0, lex=False, warn=False)
+            context.errfp = io.StringIO()
+            context.filename = path
+            context.modules = cache.ModuleCache()
+            first = cli.loadModule(context, path, path)
+            second = cli.loadModule(context, path, path)
+            self.assertEqual(dict(entries=1, hits=1, misses=1), context.modules.stats())
+            self.assertIsNot(first, second)
+            self.assertTrue(first.jsbuf() == second.jsbuf())
+            # a modified file must be re-parsed
+            with io.open(path, 'w') as fp:
+                fp.write('function two() { return 2; }')
+            os.utime(path, ns=(0, 0))
+            self.assertIn("two", cli.loadModule(context, path, path).jsbuf())
+            self.assertEqual(dict(entries=1, hits=1, misses=2), context.modules.stats())
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_diskCache(self):
+        from js2esi.tools import cache
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(testdirname, 'moddir', 'trim.js')
+            diskcache = cache.DiskCache(os.path.join(tmpdir, 'cache'), 'salt')
+            trees = []
+            for run in range(2):
+                # i.e. a fresh process, with an empty in-memory cache
+                context = cli.Context()
+                context.options = adict.new(verbose=0, lex=False, warn=False)
+                context.errfp = io.StringIO()
+                context.filename = path
+                context.lib = [os.path.join(testdirname, 'moddir')]
+                context.modules = cache.ModuleCache()
+                context.diskcache = diskcache
+                trees.append(str(cli.loadModule(context, path, path)))
+            self.assertEqual(dict(hits=1, misses=1), diskcache.stats())
+            self.assertTrue(trees[0] == trees[1])
+            # only the modules of the JSLIB directories are cached
+            context.lib = []
+            context.modules = cache.ModuleCache()
+            cli.loadModule(context, path, path)
+            self.assertEqual(dict(hits=1, misses=1), diskcache.stats())
+            # a different salt (e.g. js2esi version) must not share entries
+            self.assertIsNone(cache.DiskCache(diskcache.path, 'other').get(io.open(path).read()))
+            # least recently used entries are evicted beyond the size cap
+            for mtime, size, entry in diskcache.entries():
+                os.utime(entry, ns=(0, 0))
+            # (down to 3/4 of the cap)
+            diskcache.maxsize = size + 1
+            diskcache.put('a', trees[0])
+            self.assertEqual(1, len(diskcache.entries()))
+            self.assertTrue(diskcache.get('a') == trees[0])
+            # the size is tracked: the cache is only walked again to prune it
+            self.assertEqual(sum(e[1] for e in diskcache.entries()), diskcache.size)
+            diskcache.entries = None
+            diskcache.put('a', trees[0])
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_batch(self):
+        from js2esi.tools import batch
+        tmpdir = tempfile.mkdtemp()
+        try:
+            for name, js in (('a.js', 'require("moddir/trim.js"); v = trim(" x ");'),
+                             ('sub/b.js', 'require("moddir/trim.js"); w = 2;'),
+                             ('sub/bad.js', 'v = ;')):
+                os.makedirs(os.path.dirname(os.path.join(tmpdir, 'src', name)), exist_ok=True)
+                with io.open(os.path.join(tmpdir, 'src', name), 'w') as fp:
+                    fp.write(js)
+            context = cli.Context()
+            context.options = adict.new(verbose=0, lex=False, warn=False, optlevel=7, quiet=False,
+                                        filename=[os.path.join(tmpdir, 'src')],
+                                        outdir=os.path.join(tmpdir, 'out'))
+            context.errfp = io.StringIO()
+            context.lib = [testdirname]
+            self.assertEqual(101, batch.run(context, cli.compileScript, '.js', '.esi'))
+            self.assertEqual(['a.esi', 'sub'], sorted(os.listdir(os.path.join(tmpdir, 'out'))))
+            self.assertEqual(['b.esi'], os.listdir(os.path.join(tmpdir, 'out', 'sub')))
+            with io.open(os.path.join(tmpdir, 'out', 'sub', 'b.esi')) as fp:
+                self.assertTrue(fp.read().endswith('</esi:function><esi:assign name="w" value="2"/>'))
+            self.assertIn(os.path.join(testdirname, 'moddir', 'trim.js'), context.modules)
+            self.assertIn('3 file(s): 2 compiled, 1 failed', context.errfp.getvalue())
+            # two plain files with the same name would overwrite one another
+            context.options.filename = [os.path.join(tmpdir, 'src', 'sub', 'b.js'), os.path.join(tmpdir, 'b.js')]
+            context.options.outdir = os.path.join(tmpdir, 'out2')
+            context.errfp = io.StringIO()
+            self.assertEqual(101, batch.run(context, cli.compileScript, '.js', '.esi'))
+            self.assertIn('is also the output of %s' % os.path.join(tmpdir, 'src', 'sub', 'b.js'),
+                          context.errfp.getvalue())
+            self.assertFalse(os.path.exists(context.options.outdir))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_deps(self):
+        from js2esi.tools import batch, deps
+        self.assertTrue(deps.formatMake('out dir/a.esi', ['a.js', '/lib/$b.js'])
+                        == 'out\\ dir/a.esi: a.js \\\n  /lib/$$b.js\n\n/lib/$$b.js:\n')
+        tmpdir = tempfile.mkdtemp()
+        try:
+            with io.open(os.path.join(tmpdir, 'a.js'), 'w') as fp:
+                fp.write('require("moddir/trim.js"); v = trim(" x ");')
+            context = cli.Context()
+            context.options = adict.new(verbose=0, lex=False, warn=False, optlevel=7, deps='json')
+            context.errfp = io.StringIO()
+            context.lib = [testdirname]
+            dst = os.path.join(tmpdir, 'out', 'a.esi')
+            self.assertEqual(0, batch.compileOne(context, cli.compileScript, os.path.join(tmpdir, 'a.js'), dst))
+            with io.open(dst + '.deps.json') as fp:
+                self.assertEqual(dict(target=dst, sources=[os.path.join(tmpdir, 'a.js'),
+                                                           os.path.join(testdirname, 'moddir', 'trim.js')]),
+                                 json.load(fp))
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_watch(self):
+        from js2esi.tools import cache, watch
+        tmpdir = tempfile.mkdtemp()
+        try:
+            def write(name, js, mtime):
+                with io.open(os.path.join(tmpdir, name), 'w') as fp:
+                    fp.write(js)
+                os.utime(os.path.join(tmpdir, name), (mtime, mtime))
+            os.makedirs(os.path.join(tmpdir, 'lib'))
+            os.makedirs(os.path.join(tmpdir, 'src'))
+            write('lib/a.js', 'function a() { return 1; }', 1)
+            write('lib/b.js', 'function b() { return 2; }', 1)
+            write('src/one.js', 'require("a.js"); v = a();', 1)
+            write('src/two.js', 'require("b.js"); v = b();', 1)
+            write('src/three.js', 'v = 3;', 1)
+            context = cli.Context()
+            context.options = adict.new(verbose=0, lex=False, warn=False, optlevel=7, quiet=True,
+                                        filename=[os.path.join(tmpdir, 'src')], outdir=None)
+            context.errfp = io.StringIO()
+            context.lib = [os.path.join(tmpdir, 'lib')]
+            context.modules = cache.ModuleCache()
+            watcher = watch.Watcher(context, cli.compileScript, '.js', '.esi')
+
+            def poll():
+                return [(os.path.basename(path), errcnt) for path, dst, errcnt in watcher.poll()]
+            self.assertEqual([('one.js', 0), ('three.js', 0), ('two.js', 0)], poll())
+            self.assertEqual([], poll())
+            # only the dependents of a changed library module are recompiled
+            write('lib/b.js', 'function b() { return 22; }', 2)
+            self.assertEqual([('two.js', 0)], poll())
+            self.assertEqual(dict(entries=2, hits=0, misses=3), context.modules.stats())
+            # failed sources are retried on any change
+            write('src/three.js', 'v = ;', 2)
+            self.assertEqual([('three.js', 1)], poll())
+            self.assertEqual([], poll())
+            write('src/three.js', 'v = 33;', 3)
+            self.assertEqual([('three.js', 0)], poll())
+        finally:
+            shutil.rmtree(tmpdir)
+
+    def test_serve(self):
+        import http.client
+        import threading
+        from js2esi.tools import serve
+        state = serve.Server([testdirname])
+        self.assertEqual(dict(ok=True, output='<esi:assign name="v" value="2"/>'),
+                         state.compile(dict(source='v = 1 + 1;', warn=False)))
+        ret = state.compile(dict(source='require("nosuchmodule.js");\nv = ;', filename='x.js'))
+        self.assertEqual(dict(ok=False, errcnt=1, errors=[
+            dict(filename='x.js', line=2, column=5, message='unexpected parser token ";"')]), ret)
+        ret = state.compile(dict(source='require("nosuchmodule.js");'))
+        self.assertEqual([dict(filename=None, line=None, column=None,
+                               message='could not find import "nosuchmodule.js"')], ret['errors'])
+        server = serve.makeServer(state, port=0)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            conn = http.client.HTTPConnection(*server.server_address[:2])
+            conn.request('POST', '/compile', json.dumps(dict(
+                source='require("moddir/trim.js"); v = trim(" x ");', warn=False)))
+            ret = json.loads(conn.getresponse().read().decode('utf-8'))
+            self.assertTrue(ret['ok'] and ret['output'].startswith('<esi:function name="trim">'))
+            conn.request('GET', '/status')
+            self.assertEqual(4, json.loads(conn.getresponse().read().decode('utf-8'))['requests'])
+            conn.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def test_batch_jobs(self):
+        import argparse
+        from js2esi.tools import batch
+        tmpdir = tempfile.mkdtemp()
+        try:
+            names = ['s%02d.js' % (idx,) for idx in range(6)]
+            for idx, name in enumerate(names):
+                with io.open(os.path.join(tmpdir, name), 'w') as fp:
+                    fp.write(idx == 2 and 'v = ;' or 'v = %d + 1;' % (idx,))
+            context = cli.Context()
+            context.options = argparse.Namespace(verbose=0, lex=False, warn=False, optlevel=7, quiet=False,
+                                                 filename=[tmpdir], outdir=None, jobs=3,
+                                                 output=sys.stdout)
+            context.errfp = io.StringIO()
+            self.assertEqual(101, batch.run(context, cli.compileScript, '.js', '.esi'))
+            lines = context.errfp.getvalue().splitlines()
+            self.assertEqual([os.path.join(tmpdir, name) for name in names],
+                             [re.sub(r'^\[..\] (FAILED )?([^ :]+).*$', r'\2', e) for e in lines
+                              if e.startswith('[ok]') or e.startswith('[**]')])
+            self.assertIn('s02.js@1,5: ERROR', lines[2])
+            with io.open(os.path.join(tmpdir, 's05.esi')) as fp:
+                self.assertTrue(fp.read() == '<esi:assign name="v" value="6"/>')
+        finally:
+            shutil.rmtree(tmpdir)
+
 
 # FILESYSTEM BASED UNIT TESTS
 
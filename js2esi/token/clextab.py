@@ -0,0 +1,10 @@
+# clextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'AS', 'ASSIGN', 'ASSIGNDIVIDE', 'ASSIGNMINUS', 'ASSIGNMODULUS', 'ASSIGNMULTIPLY', 'ASSIGNPLUS', 'BITWISEAND', 'BITWISENOT', 'BITWISEOR', 'BITWISEXOR', 'BREAK', 'CATCH', 'COLON', 'COMMA', 'CONST', 'DECREMENT', 'DIVIDE', 'DOT', 'ELSE', 'EQUAL', 'ESICOMMENT', 'ESICOMMENT_CONT', 'EVAL', 'EXCEPT', 'FALSE', 'FOR', 'FUNCTION', 'GREATEROREQUAL', 'GREATERTHAN', 'HAS', 'HAS_I', 'IF', 'INCLUDE', 'INCREMENT', 'INLINE', 'LBRACE', 'LBRACKET', 'LESSEROREQUAL', 'LESSERTHAN', 'LET', 'LPAREN', 'MATCHES', 'MATCHES_I', 'MINUS', 'MODULUS', 'MULTIPLY', 'NOT', 'NOTEQUAL', 'NUMBER', 'OF', 'OR', 'PLUS', 'QUESTION', 'RANGE', 'RBRACE', 'RBRACKET', 'REQUIRE', 'RETURN', 'RPAREN', 'SHIFTLEFT', 'SHIFTRIGHT', 'STOP', 'STRING', 'SYMBOL', 'TRUE', 'TRY', 'VAR'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'multicomment': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_NUMBER>\\d+|0x\\d+)|(?P<t_STRING>("([^"\\\\]|\\\\[^xuU]|\\\\x[\\da-fA-F]{2}|\\\\u[\\da-fA-F]{4}|\\\\U[\\da-fA-F]{8})*"|\\\'([^\\\'\\\\]|\\\\[^xuU]|\\\\x[\\da-fA-F]{2}|\\\\u[\\da-fA-F]{4}|\\\\U[\\da-fA-F]{8})*\\\'))|(?P<t_newline>\\n+)|(?P<t_ESICOMMENT>//@esi-comment.*)|(?P<t_SYMBOL>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_ignore_JSLONGCOMMENT>\\/\\*(.|\\n)*?\\*\\/)|(?P<t_ignore_JSCOMMENT>\\/\\/.*)|(?P<t_EQUAL>===?)|(?P<t_INCREMENT>\\+\\+)|(?P<t_NOTEQUAL>!==?)|(?P<t_OR>\\|\\|)|(?P<t_RANGE>\\.\\.)|(?P<t_ASSIGNMULTIPLY>\\*=)|(?P<t_ASSIGNPLUS>\\+=)|(?P<t_AND>&&)|(?P<t_ASSIGNDIVIDE>/=)|(?P<t_ASSIGNMINUS>-=)|(?P<t_ASSIGNMODULUS>%=)|(?P<t_BITWISEOR>\\|)|(?P<t_BITWISEXOR>\\^)|(?P<t_DECREMENT>--)|(?P<t_DOT>\\.)|(?P<t_GREATEROREQUAL>>=)|(?P<t_LBRACE>\\{)|(?P<t_LBRACKET>\\[)|(?P<t_LESSEROREQUAL><=)|(?P<t_LPAREN>\\()|(?P<t_MULTIPLY>\\*)|(?P<t_PLUS>\\+)|(?P<t_QUESTION>\\?)|(?P<t_RBRACE>\\})|(?P<t_RBRACKET>\\])|(?P<t_RPAREN>\\))|(?P<t_SHIFTLEFT><<)|(?P<t_SHIFTRIGHT>>>)|(?P<t_ASSIGN>=)|(?P<t_BITWISEAND>&)|(?P<t_BITWISENOT>~)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_GREATERTHAN>>)|(?P<t_LESSERTHAN><)|(?P<t_MINUS>-)|(?P<t_MODULUS>%)|(?P<t_NOT>!)|(?P<t_STOP>;)', [None, ('t_NUMBER', 'NUMBER'), ('t_STRING', 'STRING'), None, None, None, ('t_newline', 'newline'), ('t_ESICOMMENT', 'ESICOMMENT'), ('t_SYMBOL', 'SYMBOL'), (None, None), None, (None, None), (None, 'EQUAL'), (None, 'INCREMENT'), (None, 'NOTEQUAL'), (None, 'OR'), (None, 'RANGE'), (None, 'ASSIGNMULTIPLY'), (None, 'ASSIGNPLUS'), (None, 'AND'), (None, 'ASSIGNDIVIDE'), (None, 'ASSIGNMINUS'), (None, 'ASSIGNMODULUS'), (None, 'BITWISEOR'), (None, 'BITWISEXOR'), (None, 'DECREMENT'), (None, 'DOT'), (None, 'GREATEROREQUAL'), (None, 'LBRACE'), (None, 'LBRACKET'), (None, 'LESSEROREQUAL'), (None, 'LPAREN'), (None, 'MULTIPLY'), (None, 'PLUS'), (None, 'QUESTION'), (None, 'RBRACE'), (None, 'RBRACKET'), (None, 'RPAREN'), (None, 'SHIFTLEFT'), (None, 'SHIFTRIGHT'), (None, 'ASSIGN'), (None, 'BITWISEAND'), (None, 'BITWISENOT'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GREATERTHAN'), (None, 'LESSERTHAN'), (None, 'MINUS'), (None, 'MODULUS'), (None, 'NOT'), (None, 'STOP')])], 'multicomment': [('(?P<t_multicomment_ESICOMMENT_CONT>//@esi-comment.*)|(?P<t_multicomment_OTHER>.+)|(?P<t_multicomment_newline>\\n+)', [None, ('t_multicomment_ESICOMMENT_CONT', 'ESICOMMENT_CONT'), ('t_multicomment_OTHER', 'OTHER'), ('t_multicomment_newline', 'newline')])]}
+_lexstateignore = {'INITIAL': ' \t', 'multicomment': ' \t'}
+_lexstateerrorf = {'INITIAL': 't_error', 'multicomment': 't_error'}
+_lexstateeoff = {}
@@ -38,6 +38,11 @@ def p_script(p):
     '''script : declarations
               | empty'''
     p[0] = p[1]
+    # the operands of the "+" chains are collected in lists while they grow
+    # (see p_expression_binop): operators hold tuples
+    for op in p.lexer.chains:
+        op.args = tuple(op.args)
+    del p.lexer.chains[:]
 
 
 def p_declarations(p):
@@ -152,7 +157,7 @@ def p_assign_def(p):
 
 def p_assign_strict(p):
     '''assign : letVar assignLvalue ASSIGN expression STOP'''
-    p[0] = node.Assign(p[2][0], p[4], key=p[2][1])
+    p[0] = node.Assign(p[2][0], p[4], key=p[2][1], decl=p[1])
 
 
 def p_assign(p):
@@ -501,7 +506,10 @@ def p_expression_operator(p):
     # tbd: this should be done for all associative operators... or should it?
     if kls == node.Plus and isinstance(p[1], kls):
         p[0] = p[1]
-        p[0].append(p[3])
+        if isinstance(p[0].args, tuple):
+            p[0].args = list(p[0].args)
+            p.lexer.chains.append(p[0])
+        p[0].args.append(p[3])
     else:
         p[0] = kls(p[1], p[3])
 
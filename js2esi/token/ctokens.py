@@ -259,6 +259,8 @@ def t_SYMBOL(t):
     # check for reserved words
     if t.value in reserved or t.value in functions:
         t.type = t.value.upper()
+    # variable and function names repeat a lot: share a single copy of each
+    t.value = sys.intern(t.value)
     return t
 
 
@@ -0,0 +1,10 @@
+# dlextab.py. This file automatically created by PLY (version 3.11). Don't edit!
+_tabversion   = '3.10'
+_lextokens    = set(('AND', 'BITWISEAND', 'BITWISENOT', 'BITWISEOR', 'BITWISEXOR', 'COLON', 'COMMA', 'DIVIDE', 'DOLLAR', 'EQUAL', 'FUNCCALL', 'GREATEROREQUAL', 'GREATERTHAN', 'HAS', 'HAS_I', 'LBRACE', 'LBRACKET', 'LESSEROREQUAL', 'LESSERTHAN', 'LPAREN', 'MATCHES', 'MATCHES_I', 'MINUS', 'MODULUS', 'MULTIPLY', 'NOT', 'NOTEQUAL', 'NUMBER', 'OR', 'PIPE', 'PLUS', 'RANGE', 'RBRACE', 'RBRACKET', 'RPAREN', 'SHIFTLEFT', 'SHIFTRIGHT', 'STRING', 'SYMBOL', 'VARREF', 'WS', 'aALT', 'aAPPENDHEADER', 'aCOLLECTION', 'aDCA', 'aENTITY', 'aITEM', 'aMATCHNAME', 'aMAXWAIT', 'aMETHOD', 'aNAME', 'aNOSTORE', 'aONERROR', 'aREMOVEHEADER', 'aSETHEADER', 'aSRC', 'aTEST', 'aTEXT', 'aTTL', 'aVALUE', 'cASSIGN', 'cATTEMPT', 'cBREAK', 'cCHOOSE', 'cCOMMENT', 'cDEBUG', 'cEVAL', 'cEXCEPT', 'cFOREACH', 'cFUNCTION', 'cINCLUDE', 'cOTHERWISE', 'cRETURN', 'cTRY', 'cVARS', 'cWHEN', 'eATTEMPT', 'eBREAK', 'eCHOOSE', 'eDEBUG', 'eEXCEPT', 'eOTHERWISE', 'eTRY', 'oATTEMPT', 'oBREAK', 'oCHOOSE', 'oDEBUG', 'oEXCEPT', 'oOTHERWISE', 'oTRY', 'sASSIGN', 'sCOMMENT', 'sEVAL', 'sFOREACH', 'sFUNCTION', 'sINCLUDE', 'sRETURN', 'sVARS', 'sWHEN', 'xEMPTY', 'xEND'))
+_lexreflags   = 64
+_lexliterals  = ''
+_lexstateinfo = {'INITIAL': 'inclusive', 'xmlattr': 'exclusive', 'xmlattrvalue': 'exclusive', 'xmlattrtext': 'exclusive', 'xmlattrvars': 'exclusive', 'vars': 'exclusive', 'expr': 'exclusive', 'exprlist': 'exclusive'}
+_lexstatere   = {'INITIAL': [('(?P<t_simpleEsiOpen><esi:(?P<tag>debug|try|attempt|except|break|choose|otherwise)[ \t\n]*>)', [None, ('t_simpleEsiOpen', 'simpleEsiOpen'), None]), ('(?P<t_simpleEsiEmpty><esi:(?P<tag>debug|try|attempt|except|break|choose|otherwise)[ \t\n]*/>)', [None, ('t_simpleEsiEmpty', 'simpleEsiEmpty'), None]), ('(?P<t_esiStart><esi:(?P<tag>assign|include|eval|vars|foreach|when|comment|function|return)[ \t\n]*)', [None, ('t_esiStart', 'esiStart'), None]), ('(?P<t_esiClose></esi:(?P<tag>assign|debug|include|eval|vars|try|attempt|except|foreach|break|choose|when|otherwise|comment|function|return)[ \t\n]*>)|(?P<t_STRING><?[^<]+)', [None, ('t_esiClose', 'esiClose'), None, ('t_STRING', 'STRING')])], 'xmlattr': [('(?P<t_xmlattr_ATTR>"?[ \\t\\n]*(?P<symbol>[a-zA-Z][a-zA-Z0-9-]*)[ \\t\\n]*=[ \\t\\n]*")|(?P<t_xmlattr_xEND>"?[ \t\n]*>)|(?P<t_xmlattr_xEMPTY>"?[ \t\n]*/>)', [None, ('t_xmlattr_ATTR', 'ATTR'), None, ('t_xmlattr_xEND', 'xEND'), ('t_xmlattr_xEMPTY', 'xEMPTY')])], 'xmlattrvalue': [('(?P<t_xmlattrvalue_XQUOTE>")|(?P<t_xmlattrvalue_expr_exprlist_LPAREN>[\\(\\{\\[])|(?P<t_xmlattrvalue_expr_exprlist_REGEX>(has|matches)(_i)?)|(?P<t_xmlattrvalue_expr_exprlist_NUMBER>\\d+)|(?P<t_xmlattrvalue_expr_exprlist_TRIPLEQUOTE>\\\'\\\'\\\'(.|\\n)*?\\\'\\\'\\\')|(?P<t_xmlattrvalue_expr_exprlist_STRING>\\\'([^\\\'\\\\]|\\\\.)*\\\')|(?P<t_xmlattrvalue_expr_exprlist_newline>\\n+)|(?P<t_xmlattrvalue_expr_exprlist_SYMBOL>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_xmlattrvalue_expr_exprlist_OR>\\|\\|)|(?P<t_xmlattrvalue_expr_exprlist_RANGE>\\.\\.)|(?P<t_xmlattrvalue_expr_exprlist_AND>&&)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEOR>\\|)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEXOR>\\^)|(?P<t_xmlattrvalue_expr_exprlist_DOLLAR>\\$)|(?P<t_xmlattrvalue_expr_exprlist_EQUAL>==)|(?P<t_xmlattrvalue_expr_exprlist_GREATEROREQUAL>>=)|(?P<t_xmlattrvalue_expr_exprlist_LESSEROREQUAL><=)|(?P<t_xmlattrvalue_expr_exprlist_MODULUS>\\%)|(?P<t_xmlattrvalue_expr_exprlist_MULTIPLY>\\*)|(?P<t_xmlattrvalue_expr_exprlist_NOTEQUAL>!=)|(?P<t_xmlattrvalue_expr_exprlist_PIPE>\\|)|(?P<t_xmlattrvalue_expr_exprlist_PLUS>\\+)|(?P<t_xmlattrvalue_expr_exprlist_SHIFTLEFT><<)|(?P<t_xmlattrvalue_expr_exprlist_SHIFTRIGHT>>>)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEAND>&)|(?P<t_xmlattrvalue_expr_exprlist_BITWISENOT>~)|(?P<t_xmlattrvalue_expr_exprlist_COLON>:)|(?P<t_xmlattrvalue_expr_exprlist_COMMA>,)|(?P<t_xmlattrvalue_expr_exprlist_DIVIDE>/)|(?P<t_xmlattrvalue_expr_exprlist_GREATERTHAN>>)|(?P<t_xmlattrvalue_expr_exprlist_LESSERTHAN><)|(?P<t_xmlattrvalue_expr_exprlist_MINUS>-)|(?P<t_xmlattrvalue_expr_exprlist_NOT>!)', [None, ('t_xmlattrvalue_XQUOTE', 'XQUOTE'), ('t_xmlattrvalue_expr_exprlist_LPAREN', 'LPAREN'), ('t_xmlattrvalue_expr_exprlist_REGEX', 'REGEX'), None, None, ('t_xmlattrvalue_expr_exprlist_NUMBER', 'NUMBER'), ('t_xmlattrvalue_expr_exprlist_TRIPLEQUOTE', 'TRIPLEQUOTE'), None, ('t_xmlattrvalue_expr_exprlist_STRING', 'STRING'), None, ('t_xmlattrvalue_expr_exprlist_newline', 'newline'), ('t_xmlattrvalue_expr_exprlist_SYMBOL', 'SYMBOL'), (None, 'OR'), (None, 'RANGE'), (None, 'AND'), (None, 'BITWISEOR'), (None, 'BITWISEXOR'), (None, 'DOLLAR'), (None, 'EQUAL'), (None, 'GREATEROREQUAL'), (None, 'LESSEROREQUAL'), (None, 'MODULUS'), (None, 'MULTIPLY'), (None, 'NOTEQUAL'), (None, 'PIPE'), (None, 'PLUS'), (None, 'SHIFTLEFT'), (None, 'SHIFTRIGHT'), (None, 'BITWISEAND'), (None, 'BITWISENOT'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GREATERTHAN'), (None, 'LESSERTHAN'), (None, 'MINUS'), (None, 'NOT')])], 'xmlattrtext': [('(?P<t_xmlattrtext_STRING>[^"]+)|(?P<t_xmlattrtext_XQUOTE>")', [None, ('t_xmlattrtext_STRING', 'STRING'), ('t_xmlattrtext_XQUOTE', 'XQUOTE')])], 'xmlattrvars': [('(?P<t_xmlattrvars_STRING>[^"$\\\\]+)|(?P<t_xmlattrvars_vars_ESCAPE>[\\\\].)|(?P<t_xmlattrvars_vars_ESCAPEFUNC>[$](dollar|dquote|squote)\\([ \\t\\n]*\\))', [None, ('t_xmlattrvars_STRING', 'STRING'), ('t_xmlattrvars_vars_ESCAPE', 'ESCAPE'), ('t_xmlattrvars_vars_ESCAPEFUNC', 'ESCAPEFUNC')]), ('(?P<t_xmlattrvars_vars_VARREF>\\$\\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*)\\))', [None, ('t_xmlattrvars_vars_VARREF', 'VARREF'), None]), ('(?P<t_xmlattrvars_vars_VARREF_more>\\$\\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*))', [None, ('t_xmlattrvars_vars_VARREF_more', 'VARREF_more'), None]), ('(?P<t_xmlattrvars_vars_FUNCCALL>\\$(?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*)\\()|(?P<t_xmlattrvars_XQUOTE>")', [None, ('t_xmlattrvars_vars_FUNCCALL', 'FUNCCALL'), None, ('t_xmlattrvars_XQUOTE', 'XQUOTE')])], 'vars': [('(?P<t_vars_simpleEsiOpen><esi:(?P<tag>debug|try|attempt|except|break|choose|otherwise)[ \t\n]*>)', [None, ('t_vars_simpleEsiOpen', 'simpleEsiOpen'), None]), ('(?P<t_vars_simpleEsiEmpty><esi:(?P<tag>debug|try|attempt|except|break|choose|otherwise)[ \t\n]*/>)', [None, ('t_vars_simpleEsiEmpty', 'simpleEsiEmpty'), None]), ('(?P<t_vars_esiStart><esi:(?P<tag>assign|include|eval|vars|foreach|when|comment|function|return)[ \t\n]*)', [None, ('t_vars_esiStart', 'esiStart'), None]), ('(?P<t_vars_esiClose></esi:(?P<tag>assign|debug|include|eval|vars|try|attempt|except|foreach|break|choose|when|otherwise|comment|function|return)[ \t\n]*>)|(?P<t_vars_STRING><?[^$<\\\\]+)', [None, ('t_vars_esiClose', 'esiClose'), None, ('t_vars_STRING', 'STRING')]), ('(?P<t_xmlattrvars_vars_ESCAPE>[\\\\].)|(?P<t_xmlattrvars_vars_ESCAPEFUNC>[$](dollar|dquote|squote)\\([ \\t\\n]*\\))', [None, ('t_xmlattrvars_vars_ESCAPE', 'ESCAPE'), ('t_xmlattrvars_vars_ESCAPEFUNC', 'ESCAPEFUNC')]), ('(?P<t_xmlattrvars_vars_VARREF>\\$\\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*)\\))', [None, ('t_xmlattrvars_vars_VARREF', 'VARREF'), None]), ('(?P<t_xmlattrvars_vars_VARREF_more>\\$\\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*))', [None, ('t_xmlattrvars_vars_VARREF_more', 'VARREF_more'), None]), ('(?P<t_xmlattrvars_vars_FUNCCALL>\\$(?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*)\\()', [None, ('t_xmlattrvars_vars_FUNCCALL', 'FUNCCALL'), None])], 'expr': [('(?P<t_expr_simpleEsiOpen><esi:(?P<tag>debug|try|attempt|except|break|choose|otherwise)[ \t\n]*>)', [None, ('t_expr_simpleEsiOpen', 'simpleEsiOpen'), None]), ('(?P<t_expr_simpleEsiEmpty><esi:(?P<tag>debug|try|attempt|except|break|choose|otherwise)[ \t\n]*/>)', [None, ('t_expr_simpleEsiEmpty', 'simpleEsiEmpty'), None]), ('(?P<t_expr_esiStart><esi:(?P<tag>assign|include|eval|vars|foreach|when|comment|function|return)[ \t\n]*)', [None, ('t_expr_esiStart', 'esiStart'), None]), ('(?P<t_expr_esiClose></esi:(?P<tag>assign|debug|include|eval|vars|try|attempt|except|foreach|break|choose|when|otherwise|comment|function|return)[ \t\n]*>)', [None, ('t_expr_esiClose', 'esiClose'), None]), ("(?P<t_xmlattrvalue_expr_exprlist_LPAREN>[\\(\\{\\[])|(?P<t_expr_exprlist_RPAREN>[\\)\\}\\]])|(?P<t_xmlattrvalue_expr_exprlist_REGEX>(has|matches)(_i)?)|(?P<t_xmlattrvalue_expr_exprlist_NUMBER>\\d+)|(?P<t_xmlattrvalue_expr_exprlist_TRIPLEQUOTE>\\'\\'\\'(.|\\n)*?\\'\\'\\')", [None, ('t_xmlattrvalue_expr_exprlist_LPAREN', 'LPAREN'), ('t_expr_exprlist_RPAREN', 'RPAREN'), ('t_xmlattrvalue_expr_exprlist_REGEX', 'REGEX'), None, None, ('t_xmlattrvalue_expr_exprlist_NUMBER', 'NUMBER'), ('t_xmlattrvalue_expr_exprlist_TRIPLEQUOTE', 'TRIPLEQUOTE')]), ("(?P<t_xmlattrvalue_expr_exprlist_STRING>\\'([^\\'\\\\]|\\\\.)*\\')|(?P<t_xmlattrvalue_expr_exprlist_newline>\\n+)|(?P<t_xmlattrvalue_expr_exprlist_SYMBOL>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_expr_exprlist_XMLCOMMENT><!--.*?-->)|(?P<t_xmlattrvalue_expr_exprlist_OR>\\|\\|)|(?P<t_xmlattrvalue_expr_exprlist_RANGE>\\.\\.)|(?P<t_xmlattrvalue_expr_exprlist_AND>&&)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEOR>\\|)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEXOR>\\^)|(?P<t_xmlattrvalue_expr_exprlist_DOLLAR>\\$)", [None, ('t_xmlattrvalue_expr_exprlist_STRING', 'STRING'), None, ('t_xmlattrvalue_expr_exprlist_newline', 'newline'), ('t_xmlattrvalue_expr_exprlist_SYMBOL', 'SYMBOL'), ('t_expr_exprlist_XMLCOMMENT', 'XMLCOMMENT'), (None, 'OR'), (None, 'RANGE'), (None, 'AND'), (None, 'BITWISEOR'), (None, 'BITWISEXOR'), (None, 'DOLLAR')]), ('(?P<t_xmlattrvalue_expr_exprlist_EQUAL>==)|(?P<t_xmlattrvalue_expr_exprlist_GREATEROREQUAL>>=)|(?P<t_xmlattrvalue_expr_exprlist_LESSEROREQUAL><=)|(?P<t_xmlattrvalue_expr_exprlist_MODULUS>\\%)|(?P<t_xmlattrvalue_expr_exprlist_MULTIPLY>\\*)|(?P<t_xmlattrvalue_expr_exprlist_NOTEQUAL>!=)|(?P<t_xmlattrvalue_expr_exprlist_PIPE>\\|)|(?P<t_xmlattrvalue_expr_exprlist_PLUS>\\+)|(?P<t_xmlattrvalue_expr_exprlist_SHIFTLEFT><<)|(?P<t_xmlattrvalue_expr_exprlist_SHIFTRIGHT>>>)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEAND>&)|(?P<t_xmlattrvalue_expr_exprlist_BITWISENOT>~)|(?P<t_xmlattrvalue_expr_exprlist_COLON>:)|(?P<t_xmlattrvalue_expr_exprlist_COMMA>,)|(?P<t_xmlattrvalue_expr_exprlist_DIVIDE>/)|(?P<t_xmlattrvalue_expr_exprlist_GREATERTHAN>>)|(?P<t_xmlattrvalue_expr_exprlist_LESSERTHAN><)|(?P<t_xmlattrvalue_expr_exprlist_MINUS>-)|(?P<t_xmlattrvalue_expr_exprlist_NOT>!)', [None, (None, 'EQUAL'), (None, 'GREATEROREQUAL'), (None, 'LESSEROREQUAL'), (None, 'MODULUS'), (None, 'MULTIPLY'), (None, 'NOTEQUAL'), (None, 'PIPE'), (None, 'PLUS'), (None, 'SHIFTLEFT'), (None, 'SHIFTRIGHT'), (None, 'BITWISEAND'), (None, 'BITWISENOT'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GREATERTHAN'), (None, 'LESSERTHAN'), (None, 'MINUS'), (None, 'NOT')])], 'exprlist': [("(?P<t_xmlattrvalue_expr_exprlist_LPAREN>[\\(\\{\\[])|(?P<t_expr_exprlist_RPAREN>[\\)\\}\\]])|(?P<t_xmlattrvalue_expr_exprlist_REGEX>(has|matches)(_i)?)|(?P<t_xmlattrvalue_expr_exprlist_NUMBER>\\d+)|(?P<t_xmlattrvalue_expr_exprlist_TRIPLEQUOTE>\\'\\'\\'(.|\\n)*?\\'\\'\\')|(?P<t_xmlattrvalue_expr_exprlist_STRING>\\'([^\\'\\\\]|\\\\.)*\\')|(?P<t_xmlattrvalue_expr_exprlist_newline>\\n+)|(?P<t_xmlattrvalue_expr_exprlist_SYMBOL>[a-zA-Z_][a-zA-Z_0-9]*)|(?P<t_expr_exprlist_XMLCOMMENT><!--.*?-->)|(?P<t_xmlattrvalue_expr_exprlist_OR>\\|\\|)|(?P<t_xmlattrvalue_expr_exprlist_RANGE>\\.\\.)|(?P<t_xmlattrvalue_expr_exprlist_AND>&&)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEOR>\\|)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEXOR>\\^)|(?P<t_xmlattrvalue_expr_exprlist_DOLLAR>\\$)|(?P<t_xmlattrvalue_expr_exprlist_EQUAL>==)|(?P<t_xmlattrvalue_expr_exprlist_GREATEROREQUAL>>=)|(?P<t_xmlattrvalue_expr_exprlist_LESSEROREQUAL><=)|(?P<t_xmlattrvalue_expr_exprlist_MODULUS>\\%)|(?P<t_xmlattrvalue_expr_exprlist_MULTIPLY>\\*)|(?P<t_xmlattrvalue_expr_exprlist_NOTEQUAL>!=)|(?P<t_xmlattrvalue_expr_exprlist_PIPE>\\|)|(?P<t_xmlattrvalue_expr_exprlist_PLUS>\\+)|(?P<t_xmlattrvalue_expr_exprlist_SHIFTLEFT><<)|(?P<t_xmlattrvalue_expr_exprlist_SHIFTRIGHT>>>)|(?P<t_xmlattrvalue_expr_exprlist_BITWISEAND>&)|(?P<t_xmlattrvalue_expr_exprlist_BITWISENOT>~)|(?P<t_xmlattrvalue_expr_exprlist_COLON>:)|(?P<t_xmlattrvalue_expr_exprlist_COMMA>,)|(?P<t_xmlattrvalue_expr_exprlist_DIVIDE>/)|(?P<t_xmlattrvalue_expr_exprlist_GREATERTHAN>>)|(?P<t_xmlattrvalue_expr_exprlist_LESSERTHAN><)|(?P<t_xmlattrvalue_expr_exprlist_MINUS>-)|(?P<t_xmlattrvalue_expr_exprlist_NOT>!)", [None, ('t_xmlattrvalue_expr_exprlist_LPAREN', 'LPAREN'), ('t_expr_exprlist_RPAREN', 'RPAREN'), ('t_xmlattrvalue_expr_exprlist_REGEX', 'REGEX'), None, None, ('t_xmlattrvalue_expr_exprlist_NUMBER', 'NUMBER'), ('t_xmlattrvalue_expr_exprlist_TRIPLEQUOTE', 'TRIPLEQUOTE'), None, ('t_xmlattrvalue_expr_exprlist_STRING', 'STRING'), None, ('t_xmlattrvalue_expr_exprlist_newline', 'newline'), ('t_xmlattrvalue_expr_exprlist_SYMBOL', 'SYMBOL'), ('t_expr_exprlist_XMLCOMMENT', 'XMLCOMMENT'), (None, 'OR'), (None, 'RANGE'), (None, 'AND'), (None, 'BITWISEOR'), (None, 'BITWISEXOR'), (None, 'DOLLAR'), (None, 'EQUAL'), (None, 'GREATEROREQUAL'), (None, 'LESSEROREQUAL'), (None, 'MODULUS'), (None, 'MULTIPLY'), (None, 'NOTEQUAL'), (None, 'PIPE'), (None, 'PLUS'), (None, 'SHIFTLEFT'), (None, 'SHIFTRIGHT'), (None, 'BITWISEAND'), (None, 'BITWISENOT'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'GREATERTHAN'), (None, 'LESSERTHAN'), (None, 'MINUS'), (None, 'NOT')])]}
+_lexstateignore = {'INITIAL': '', 'xmlattr': '', 'xmlattrtext': '', 'xmlattrvalue': ' \t', 'expr': ' \t', 'exprlist': ' \t', 'xmlattrvars': '', 'vars': ''}
+_lexstateerrorf = {'INITIAL': 't_error', 'xmlattr': 't_error', 'xmlattrtext': 't_error', 'xmlattrvalue': 't_error', 'expr': 't_error', 'exprlist': 't_error', 'xmlattrvars': 't_error', 'vars': 't_error'}
+_lexstateeoff = {}
@@ -1,11 +1,12 @@
 
 # dparsetab.py
 # This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
 _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'scriptleftORleftANDleftBITWISEORPIPEleftBITWISEXORleftBITWISEANDnonassocEQUALNOTEQUALLESSERTHANLESSEROREQUALGREATERTHANGREATEROREQUALnonassocNOTBITWISENOTleftSHIFTLEFTSHIFTRIGHTleftPLUSMINUSMULTIPLYMODULUSDIVIDErightUMINUSxEND xEMPTY NUMBER STRING WS DOLLAR LPAREN RPAREN LBRACE RBRACE LBRACKET RBRACKET PIPE COMMA COLON EQUAL NOTEQUAL LESSERTHAN LESSEROREQUAL GREATERTHAN GREATEROREQUAL PLUS MINUS MULTIPLY MODULUS DIVIDE RANGE NOT AND OR BITWISENOT BITWISEAND BITWISEOR BITWISEXOR SHIFTLEFT SHIFTRIGHT HAS HAS_I MATCHES MATCHES_I SYMBOL VARREF FUNCCALL sASSIGN sINCLUDE sEVAL sVARS sFOREACH sWHEN sCOMMENT sFUNCTION sRETURN oDEBUG oTRY oATTEMPT oEXCEPT oBREAK oCHOOSE oOTHERWISE eDEBUG eTRY eATTEMPT eEXCEPT eBREAK eCHOOSE eOTHERWISE cASSIGN cDEBUG cINCLUDE cEVAL cVARS cTRY cATTEMPT cEXCEPT cFOREACH cBREAK cCHOOSE cWHEN cOTHERWISE cCOMMENT cFUNCTION cRETURN aNAME aVALUE aTEXT aSRC aALT aDCA aONERROR aMAXWAIT aTTL aNOSTORE aAPPENDHEADER aREMOVEHEADER aSETHEADER aMETHOD aENTITY aCOLLECTION aITEM aTEST aMATCHNAMEempty :script : nvStatements\n              | empty\n              | cTRY eTRY eATTEMPT eEXCEPT eCHOOSE eOTHERWISE cEVAL cINCLUDE\n              | cBREAK oBREAK eBREAK cCOMMENT cRETURN\n              nvStatements : nvStatement\n                    | nvStatements nvStatement\n                    nvStatement : esiStatement\n                   | rawString\n                   rawString : stringesiStatement : comment\n                    | assign\n                    | try\n                    | condition\n                    | evalinclude\n                    | vars\n                    | debug\n                    | functiondef\n                    | return\n                    | loop\n                    | break\n                    statements : statement\n                  | statements statement\n                  statement : esiStatement\n                 | varsStatement\n                 varsStatement : varsExprcomment : sCOMMENT aTEXT string xEMPTYassign : sASSIGN aNAME assignName aVALUE attrExpression xEMPTY\n              | sASSIGN aNAME assignName xEND expression cASSIGN\n              assignName : SYMBOL\n                  | SYMBOL LBRACE expression RBRACE\n                  condition : oCHOOSE whenClauseList ws otherwiseClause ws cCHOOSEwhenClauseList : iws\n                      | whenClause\n                      | whenClauseList whenClause\n                      whenClause : sWHEN aTEST expression xEND cWHENwhenClause : sWHEN aTEST expression xEND statements cWHENwhenClause : sWHEN aTEST expression aMATCHNAME string xEND statements cWHENotherwiseClause : empty\n                       | oOTHERWISE statements cOTHERWISE\n                       try : oTRY oATTEMPT statements cATTEMPT cTRYtry : oTRY oATTEMPT statements cATTEMPT oEXCEPT statements cEXCEPT cTRYevalinclude : sINCLUDE includeAttributes xEMPTY\n                   | sEVAL includeAttributes xEMPTY\n                   includeAttributes : empty\n                         | includeAttribute\n                         | includeAttributes includeAttribute\n                         includeAttribute : aSRC varsExpr\n                        | aALT varsExpr\n                        | aDCA varsExpr\n                        | aONERROR varsExpr\n                        | aMAXWAIT varsExpr\n                        | aTTL varsExpr\n                        | aNOSTORE varsExpr\n                        | aAPPENDHEADER varsExpr\n                        | aREMOVEHEADER varsExpr\n                        | aSETHEADER varsExpr\n                        | aMETHOD varsExpr\n                        | aENTITY varsExpr\n                        vars : sVARS aNAME assignName xEMPTYvars : sVARS xEND varsExpr cVARSvars : sVARS xEND statements cVARSloop : sFOREACH aCOLLECTION expression xEND statements cFOREACHloop : sFOREACH aITEM SYMBOL aCOLLECTION expression xEND statements cFOREACHloop : sFOREACH aCOLLECTION expression aITEM SYMBOL xEND statements cFOREACHbreak : eBREAKfunctiondef : sFUNCTION aNAME SYMBOL xEND statements cFUNCTIONreturn : sRETURN aVALUE attrExpression xEMPTYdebug : eDEBUG\n             | oDEBUG cDEBUG\n             attrExpression : expressionvarsExpr : empty\n                | varsExprElement\n                | varsExpr varsExprElement\n                varsExprElement : stringvarsExprElement : VARREFvarsExprElement : functioncallvarsExprElement : VARREF varKey varDefault RPARENvarKey : empty\n              | LBRACE expression RBRACE\n              varDefault : empty\n                  | PIPE expression\n                  ws : empty\n          | WS\n          iws : wsexpression : expression EQUAL expression\n                  | expression NOTEQUAL expression\n                  | expression LESSERTHAN expression\n                  | expression LESSEROREQUAL expression\n                  | expression GREATERTHAN expression\n                  | expression GREATEROREQUAL expression\n                  | expression PLUS expression\n                  | expression MINUS expression\n                  | expression MULTIPLY expression\n                  | expression MODULUS expression\n                  | expression DIVIDE expression\n                  | expression AND expression\n                  | expression OR expression\n                  | expression BITWISENOT expression\n                  | expression BITWISEAND expression\n                  | expression BITWISEOR expression\n                  | expression BITWISEXOR expression\n                  | expression PIPE expression\n                  | expression SHIFTLEFT expression\n                  | expression SHIFTRIGHT expression\n                  expression : expression HAS expression\n                  | expression HAS_I expression\n                  expression : expression MATCHES expression\n                  | expression MATCHES_I expression\n                  expression : NOT expression\n                  | BITWISENOT expression\n                  expression : MINUS expression %prec UMINUSexpression : factorfactor : functioncallfunctioncall : DOLLAR SYMBOL LPAREN expressionList RPARENfunctioncall : FUNCCALL expressionList RPARENfactor : DOLLAR LPAREN SYMBOL varrefKey varrefDefault RPARENvarrefKey : empty\n                 | LBRACE expression RBRACE\n                 varrefDefault : empty\n                     | BITWISEOR literal\n                     | PIPE literal\n                     factor : literalfactor : SYMBOLfactor : LPAREN expression RPARENfactor : LBRACKET listExpressionList RBRACKETlistExpressionList : empty\n                          | listExpression\n                          | listExpressionList COMMA listExpression\n                          listExpression : expression\n                      | rangeExpression\n                      rangeExpression : expression RANGE expressionexpressionList : empty\n                      | expression\n                      | expressionList COMMA expression\n                      factor : LBRACE dictionaryList RBRACEdictionaryList : empty\n                      | dictionaryEntry\n                      | dictionaryList COMMA dictionaryEntry\n                      dictionaryEntry : literal COLON expressiondictionaryEntry : SYMBOL COLON expressionliteral : NUMBER\n               | string\n               string : WS\n              | STRING\n              | string WS\n              | string STRING\n              '
+_lr_signature = 'scriptleftORleftANDleftBITWISEORPIPEleftBITWISEXORleftBITWISEANDnonassocEQUALNOTEQUALLESSERTHANLESSEROREQUALGREATERTHANGREATEROREQUALnonassocNOTBITWISENOTleftSHIFTLEFTSHIFTRIGHTleftPLUSMINUSMULTIPLYMODULUSDIVIDErightUMINUSAND BITWISEAND BITWISENOT BITWISEOR BITWISEXOR COLON COMMA DIVIDE DOLLAR EQUAL FUNCCALL GREATEROREQUAL GREATERTHAN HAS HAS_I LBRACE LBRACKET LESSEROREQUAL LESSERTHAN LPAREN MATCHES MATCHES_I MINUS MODULUS MULTIPLY NOT NOTEQUAL NUMBER OR PIPE PLUS RANGE RBRACE RBRACKET RPAREN SHIFTLEFT SHIFTRIGHT STRING SYMBOL VARREF WS aALT aAPPENDHEADER aCOLLECTION aDCA aENTITY aITEM aMATCHNAME aMAXWAIT aMETHOD aNAME aNOSTORE aONERROR aREMOVEHEADER aSETHEADER aSRC aTEST aTEXT aTTL aVALUE cASSIGN cATTEMPT cBREAK cCHOOSE cCOMMENT cDEBUG cEVAL cEXCEPT cFOREACH cFUNCTION cINCLUDE cOTHERWISE cRETURN cTRY cVARS cWHEN eATTEMPT eBREAK eCHOOSE eDEBUG eEXCEPT eOTHERWISE eTRY oATTEMPT oBREAK oCHOOSE oDEBUG oEXCEPT oOTHERWISE oTRY sASSIGN sCOMMENT sEVAL sFOREACH sFUNCTION sINCLUDE sRETURN sVARS sWHEN xEMPTY xENDempty :script : nvStatements\n              | empty\n              | cTRY eTRY eATTEMPT eEXCEPT eCHOOSE eOTHERWISE cEVAL cINCLUDE\n              | cBREAK oBREAK eBREAK cCOMMENT cRETURN\n              nvStatements : nvStatement\n                    | nvStatements nvStatement\n                    nvStatement : esiStatement\n                   | rawString\n                   rawString : stringesiStatement : comment\n                    | assign\n                    | try\n                    | condition\n                    | evalinclude\n                    | vars\n                    | debug\n                    | functiondef\n                    | return\n                    | loop\n                    | break\n                    statements : statement\n                  | statements statement\n                  statement : esiStatement\n                 | varsStatement\n                 varsStatement : varsExprcomment : sCOMMENT aTEXT string xEMPTYassign : sASSIGN aNAME assignName aVALUE attrExpression xEMPTY\n              | sASSIGN aNAME assignName xEND expression cASSIGN\n              assignName : SYMBOL\n                  | SYMBOL LBRACE expression RBRACE\n                  condition : oCHOOSE whenClauseList ws otherwiseClause ws cCHOOSEwhenClauseList : iws\n                      | whenClause\n                      | whenClauseList whenClause\n                      whenClause : sWHEN aTEST expression xEND cWHENwhenClause : sWHEN aTEST expression xEND statements cWHENwhenClause : sWHEN aTEST expression aMATCHNAME string xEND statements cWHENotherwiseClause : empty\n                       | oOTHERWISE statements cOTHERWISE\n                       try : oTRY oATTEMPT statements cATTEMPT cTRYtry : oTRY oATTEMPT statements cATTEMPT oEXCEPT statements cEXCEPT cTRYevalinclude : sINCLUDE includeAttributes xEMPTY\n                   | sEVAL includeAttributes xEMPTY\n                   includeAttributes : empty\n                         | includeAttribute\n                         | includeAttributes includeAttribute\n                         includeAttribute : aSRC varsExpr\n                        | aALT varsExpr\n                        | aDCA varsExpr\n                        | aONERROR varsExpr\n                        | aMAXWAIT varsExpr\n                        | aTTL varsExpr\n                        | aNOSTORE varsExpr\n                        | aAPPENDHEADER varsExpr\n                        | aREMOVEHEADER varsExpr\n                        | aSETHEADER varsExpr\n                        | aMETHOD varsExpr\n                        | aENTITY varsExpr\n                        vars : sVARS aNAME assignName xEMPTYvars : sVARS xEND varsExpr cVARSvars : sVARS xEND statements cVARSloop : sFOREACH aCOLLECTION expression xEND statements cFOREACHloop : sFOREACH aITEM SYMBOL aCOLLECTION expression xEND statements cFOREACHloop : sFOREACH aCOLLECTION expression aITEM SYMBOL xEND statements cFOREACHbreak : eBREAKfunctiondef : sFUNCTION aNAME SYMBOL xEND statements cFUNCTIONreturn : sRETURN aVALUE attrExpression xEMPTYdebug : eDEBUG\n             | oDEBUG cDEBUG\n             attrExpression : expressionvarsExpr : empty\n                | varsExprElement\n                | varsExpr varsExprElement\n                varsExprElement : stringvarsExprElement : VARREFvarsExprElement : functioncallvarsExprElement : VARREF varKey varDefault RPARENvarKey : empty\n              | LBRACE expression RBRACE\n              varDefault : empty\n                  | PIPE expression\n                  ws : empty\n          | WS\n          iws : wsexpression : expression EQUAL expression\n                  | expression NOTEQUAL expression\n                  | expression LESSERTHAN expression\n                  | expression LESSEROREQUAL expression\n                  | expression GREATERTHAN expression\n                  | expression GREATEROREQUAL expression\n                  | expression PLUS expression\n                  | expression MINUS expression\n                  | expression MULTIPLY expression\n                  | expression MODULUS expression\n                  | expression DIVIDE expression\n                  | expression AND expression\n                  | expression OR expression\n                  | expression BITWISENOT expression\n                  | expression BITWISEAND expression\n                  | expression BITWISEOR expression\n                  | expression BITWISEXOR expression\n                  | expression PIPE expression\n                  | expression SHIFTLEFT expression\n                  | expression SHIFTRIGHT expression\n                  expression : expression HAS expression\n                  | expression HAS_I expression\n                  expression : expression MATCHES expression\n                  | expression MATCHES_I expression\n                  expression : NOT expression\n                  | BITWISENOT expression\n                  expression : MINUS expression %prec UMINUSexpression : factorfactor : functioncallfunctioncall : DOLLAR SYMBOL LPAREN expressionList RPARENfunctioncall : FUNCCALL expressionList RPARENfactor : DOLLAR LPAREN SYMBOL varrefKey varrefDefault RPARENvarrefKey : empty\n                 | LBRACE expression RBRACE\n                 varrefDefault : empty\n                     | BITWISEOR literal\n                     | PIPE literal\n                     factor : literalfactor : SYMBOLfactor : LPAREN expression RPARENfactor : LBRACKET listExpressionList RBRACKETlistExpressionList : empty\n                          | listExpression\n                          | listExpressionList COMMA listExpression\n                          listExpression : expression\n                      | rangeExpression\n                      rangeExpression : expression RANGE expressionexpressionList : empty\n                      | expression\n                      | expressionList COMMA expression\n                      factor : LBRACE dictionaryList RBRACEdictionaryList : empty\n                      | dictionaryEntry\n                      | dictionaryList COMMA dictionaryEntry\n                      dictionaryEntry : literal COLON expressiondictionaryEntry : SYMBOL COLON expressionliteral : NUMBER\n               | string\n               string : WS\n              | STRING\n              | string WS\n              | string STRING\n              '
     
 _lr_action_items = {'cTRY':([0,136,280,],[4,202,292,]),'cBREAK':([0,],[5,]),'$end':([0,1,2,3,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,69,94,108,132,150,151,152,154,198,202,253,254,262,267,276,291,292,298,299,],[-1,0,-2,-3,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,-70,-43,-44,-27,-60,-61,-62,-68,-5,-41,-28,-29,-32,-67,-63,-4,-42,-65,-64,]),'sCOMMENT':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[22,22,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,22,22,-70,22,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,22,-27,-23,-74,22,-60,-61,-62,22,-68,22,-41,22,-116,22,22,22,22,-28,-29,22,-78,-32,22,-67,-63,22,22,-115,22,22,22,-42,22,-65,-64,]),'sASSIGN':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[23,23,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,23,23,-70,23,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,23,-27,-23,-74,23,-60,-61,-62,23,-68,23,-41,23,-116,23,23,23,23,-28,-29,23,-78,-32,23,-67,-63,23,23,-115,23,23,23,-42,23,-65,-64,]),'oTRY':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[24,24,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,24,24,-70,24,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,24,-27,-23,-74,24,-60,-61,-62,24,-68,24,-41,24,-116,24,24,24,24,-28,-29,24,-78,-32,24,-67,-63,24,24,-115,24,24,24,-42,24,-65,-64,]),'oCHOOSE':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[25,25,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,25,25,-70,25,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,25,-27,-23,-74,25,-60,-61,-62,25,-68,25,-41,25,-116,25,25,25,25,-28,-29,25,-78,-32,25,-67,-63,25,25,-115,25,25,25,-42,25,-65,-64,]),'sINCLUDE':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[26,26,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,26,26,-70,26,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,26,-27,-23,-74,26,-60,-61,-62,26,-68,26,-41,26,-116,26,26,26,26,-28,-29,26,-78,-32,26,-67,-63,26,26,-115,26,26,26,-42,26,-65,-64,]),'sEVAL':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[27,27,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,27,27,-70,27,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,27,-27,-23,-74,27,-60,-61,-62,27,-68,27,-41,27,-116,27,27,27,27,-28,-29,27,-78,-32,27,-67,-63,27,27,-115,27,27,27,-42,27,-65,-64,]),'sVARS':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[28,28,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,28,28,-70,28,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,28,-27,-23,-74,28,-60,-61,-62,28,-68,28,-41,28,-116,28,28,28,28,-28,-29,28,-78,-32,28,-67,-63,28,28,-115,28,28,28,-42,28,-65,-64,]),'eDEBUG':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[29,29,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,29,29,-70,29,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,29,-27,-23,-74,29,-60,-61,-62,29,-68,29,-41,29,-116,29,29,29,29,-28,-29,29,-78,-32,29,-67,-63,29,29,-115,29,29,29,-42,29,-65,-64,]),'oDEBUG':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[30,30,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,30,30,-70,30,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,30,-27,-23,-74,30,-60,-61,-62,30,-68,30,-41,30,-116,30,30,30,30,-28,-29,30,-78,-32,30,-67,-63,30,30,-115,30,30,30,-42,30,-65,-64,]),'sFUNCTION':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[31,31,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,31,31,-70,31,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,31,-27,-23,-74,31,-60,-61,-62,31,-68,31,-41,31,-116,31,31,31,31,-28,-29,31,-78,-32,31,-67,-63,31,31,-115,31,31,31,-42,31,-65,-64,]),'sRETURN':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[32,32,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,32,32,-70,32,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,32,-27,-23,-74,32,-60,-61,-62,32,-68,32,-41,32,-116,32,32,32,32,-28,-29,32,-78,-32,32,-67,-63,32,32,-115,32,32,32,-42,32,-65,-64,]),'sFOREACH':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[33,33,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,-146,-147,33,33,-70,33,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,33,-27,-23,-74,33,-60,-61,-62,33,-68,33,-41,33,-116,33,33,33,33,-28,-29,33,-78,-32,33,-67,-63,33,33,-115,33,33,33,-42,33,-65,-64,]),'eBREAK':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,38,39,40,43,68,69,79,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[6,6,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-10,-69,-144,-145,-7,75,-146,-147,6,6,-70,6,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-26,6,-27,-23,-74,6,-60,-61,-62,6,-68,6,-41,6,-116,6,6,6,6,-28,-29,6,-78,-32,6,-67,-63,6,6,-115,6,6,6,-42,6,-65,-64,]),'WS':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,25,29,34,35,36,39,40,41,43,44,45,46,47,49,50,54,55,56,57,58,59,60,61,62,63,64,65,68,69,71,72,76,79,80,81,82,83,84,85,86,87,88,90,91,92,93,94,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,115,116,117,121,124,125,127,132,133,134,135,137,138,141,146,147,148,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,194,196,202,203,206,208,209,210,212,213,214,215,243,244,246,247,248,249,253,254,256,257,262,263,264,265,266,267,270,276,277,278,281,282,283,286,287,289,290,292,293,298,299,300,],[34,34,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,39,50,-69,-144,-145,-7,-146,-147,34,34,50,-85,-33,-34,-83,-84,34,34,34,34,34,34,34,34,34,34,34,34,34,-70,34,34,39,34,-22,-24,-25,34,39,-72,-73,-76,-77,34,-1,-35,34,-43,34,34,34,34,34,34,34,34,34,34,34,34,-44,34,34,34,34,34,34,34,34,39,-27,34,34,34,-23,-74,34,50,-39,34,-60,-61,-62,34,-68,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-41,34,34,34,-116,34,34,34,34,34,34,34,34,34,34,34,-28,-29,34,-78,-32,-40,-36,34,39,-67,34,-63,34,34,-115,-37,34,34,34,34,34,-42,34,-65,-64,-38,]),'STRING':([0,2,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,29,34,35,36,39,40,41,43,54,55,56,57,58,59,60,61,62,63,64,65,68,69,71,72,76,79,80,81,82,83,84,85,86,87,88,90,93,94,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,115,116,117,121,124,125,127,132,133,134,135,137,138,141,148,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,194,196,202,203,206,208,209,210,212,213,214,215,243,244,246,247,248,249,253,254,256,257,262,265,266,267,270,276,277,278,281,283,286,287,289,290,292,293,298,299,],[35,35,-66,-6,-8,-9,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,40,-69,-144,-145,-7,-146,-147,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-70,35,35,40,35,-22,-24,-25,35,40,-72,-73,-76,-77,35,35,-43,35,35,35,35,35,35,35,35,35,35,35,35,-44,35,35,35,35,35,35,35,35,40,-27,35,35,35,-23,-74,35,35,-60,-61,-62,35,-68,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-41,35,35,35,-116,35,35,35,35,35,35,35,35,35,35,35,-28,-29,35,-78,-32,35,40,-67,35,-63,35,35,-115,35,35,35,35,35,-42,35,-65,-64,]),'eTRY':([4,],[37,]),'oBREAK':([5,],[38,]),'cATTEMPT':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,43,69,79,80,81,82,83,84,85,86,87,88,94,108,132,137,138,150,151,152,154,202,209,253,254,257,262,267,276,281,292,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,-1,-70,136,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-27,-23,-74,-60,-61,-62,-68,-41,-116,-28,-29,-78,-32,-67,-63,-115,-42,-65,-64,]),'VARREF':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,43,54,55,56,57,58,59,60,61,62,63,64,65,68,69,79,80,81,82,83,84,85,86,87,88,94,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,132,137,138,148,150,151,152,153,154,194,202,203,209,212,213,215,249,253,254,256,257,262,265,267,276,277,278,281,283,289,290,292,293,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,87,87,87,87,87,87,87,87,87,87,87,87,87,87,-70,87,-22,-24,-25,87,-75,-72,-73,-76,-77,-43,87,87,87,87,87,87,87,87,87,87,87,87,-44,87,87,-27,-23,-74,87,-60,-61,-62,87,-68,87,-41,87,-116,87,87,87,87,-28,-29,87,-78,-32,87,-67,-63,87,87,-115,87,87,87,-42,87,-65,-64,]),'DOLLAR':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,43,54,55,56,57,58,59,60,61,62,63,64,65,68,69,71,72,79,80,81,82,83,84,85,86,87,88,90,93,94,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,115,116,117,121,124,132,133,134,135,137,138,141,148,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,194,196,202,203,206,208,209,210,212,213,215,243,244,247,248,249,253,254,256,257,262,265,267,270,276,277,278,281,283,289,290,292,293,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,89,89,89,89,89,89,89,89,89,89,89,89,89,89,-70,120,120,89,-22,-24,-25,89,-75,-72,-73,-76,-77,120,120,-43,89,89,89,89,89,89,89,89,89,89,89,89,-44,89,89,120,120,120,120,120,-27,120,120,120,-23,-74,120,89,-60,-61,-62,89,-68,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,120,89,120,-41,89,120,120,-116,120,89,89,89,120,120,120,120,89,-28,-29,89,-78,-32,89,-67,120,-63,89,89,-115,89,89,89,-42,89,-65,-64,]),'FUNCCALL':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,43,54,55,56,57,58,59,60,61,62,63,64,65,68,69,71,72,79,80,81,82,83,84,85,86,87,88,90,93,94,96,97,98,99,100,101,102,103,104,105,106,107,108,110,111,115,116,117,121,124,132,133,134,135,137,138,141,148,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,194,196,202,203,206,208,209,210,212,213,215,243,244,247,248,249,253,254,256,257,262,265,267,270,276,277,278,281,283,289,290,292,293,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-70,90,90,90,-22,-24,-25,90,-75,-72,-73,-76,-77,90,90,-43,90,90,90,90,90,90,90,90,90,90,90,90,-44,90,90,90,90,90,90,90,-27,90,90,90,-23,-74,90,90,-60,-61,-62,90,-68,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,90,-41,90,90,90,-116,90,90,90,90,90,90,90,90,90,-28,-29,90,-78,-32,90,-67,90,-63,90,90,-115,90,90,90,-42,90,-65,-64,]),'cVARS':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,68,69,80,81,82,83,84,85,86,87,88,94,108,110,111,132,137,138,150,151,152,154,202,209,253,254,257,262,267,276,281,292,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,-1,-70,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,151,152,-27,-23,-74,-60,-61,-62,-68,-41,-116,-28,-29,-78,-32,-67,-63,-115,-42,-65,-64,]),'cOTHERWISE':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,69,80,81,82,83,84,85,86,87,88,94,108,132,137,138,148,150,151,152,154,202,209,212,253,254,257,262,267,276,281,292,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,-70,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-27,-23,-74,-1,-60,-61,-62,-68,-41,-116,263,-28,-29,-78,-32,-67,-63,-115,-42,-65,-64,]),'cFUNCTION':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,69,80,81,82,83,84,85,86,87,88,94,108,132,137,138,150,151,152,153,154,202,209,215,253,254,257,262,267,276,281,292,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,-70,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-27,-23,-74,-60,-61,-62,-1,-68,-41,-116,267,-28,-29,-78,-32,-67,-63,-115,-42,-65,-64,]),'cFOREACH':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,69,80,81,82,83,84,85,86,87,88,94,108,132,137,138,150,151,152,154,194,202,209,249,253,254,257,262,267,276,277,278,281,289,290,292,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,-70,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-27,-23,-74,-60,-61,-62,-68,-1,-41,-116,276,-28,-29,-78,-32,-67,-63,-1,-1,-115,298,299,-42,-65,-64,]),'cEXCEPT':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,69,80,81,82,83,84,85,86,87,88,94,108,132,137,138,150,151,152,154,202,203,209,253,254,256,257,262,267,276,281,292,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,-70,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-27,-23,-74,-60,-61,-62,-68,-41,-1,-116,-28,-29,280,-78,-32,-67,-63,-115,-42,-65,-64,]),'cWHEN':([6,10,11,12,13,14,15,16,17,18,19,20,29,34,35,39,40,69,80,81,82,83,84,85,86,87,88,94,108,132,137,138,150,151,152,154,202,209,213,253,254,257,262,265,267,276,281,283,292,293,298,299,],[-66,-11,-12,-13,-14,-15,-16,-17,-18,-19,-20,-21,-69,-144,-145,-146,-147,-70,-22,-24,-25,-26,-75,-72,-73,-76,-77,-43,-44,-27,-23,-74,-60,-61,-62,-68,-41,-116,264,-28,-29,-78,-32,282,-67,-63,-115,-1,-42,300,-65,-64,]),'aTEXT':([22,],[41,]),'aNAME':([23,28,31,],[42,67,70,]),'oATTEMPT':([24,],[43,]),'sWHEN':([25,44,45,46,47,49,50,92,264,282,300,],[48,48,-85,-33,-34,-83,-84,-35,-36,-37,-38,]),'oOTHERWISE':([25,44,45,46,47,49,50,91,92,264,282,300,],[-1,-1,-85,-33,-34,-83,-84,148,-35,-36,-37,-38,]),'cCHOOSE':([25,44,45,46,47,49,50,91,92,146,147,211,263,264,282,300,],[-1,-1,-85,-33,-34,-83,-84,-1,-35,-1,-39,262,-40,-36,-37,-38,]),'xEMPTY':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,76,78,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,109,113,114,118,119,122,123,126,127,138,179,180,181,199,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,255,257,281,294,],[-1,-1,-144,-145,-146,-147,94,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,108,132,-30,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,150,154,-71,-113,-114,-124,-123,-142,-143,-74,-112,-111,-110,253,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,-31,-78,-115,-117,]),'aSRC':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[54,54,-144,-145,-146,-147,54,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,54,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aALT':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[55,55,-144,-145,-146,-147,55,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,55,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aDCA':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[56,56,-144,-145,-146,-147,56,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,56,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aONERROR':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[57,57,-144,-145,-146,-147,57,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,57,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aMAXWAIT':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[58,58,-144,-145,-146,-147,58,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,58,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aTTL':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[59,59,-144,-145,-146,-147,59,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,59,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aNOSTORE':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[60,60,-144,-145,-146,-147,60,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,60,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aAPPENDHEADER':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[61,61,-144,-145,-146,-147,61,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,61,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aREMOVEHEADER':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[62,62,-144,-145,-146,-147,62,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,62,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aSETHEADER':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[63,63,-144,-145,-146,-147,63,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,63,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aMETHOD':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[64,64,-144,-145,-146,-147,64,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,64,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'aENTITY':([26,27,34,35,39,40,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,84,85,86,87,88,95,96,97,98,99,100,101,102,103,104,105,106,107,138,209,257,281,],[65,65,-144,-145,-146,-147,65,-45,-46,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,-1,65,-75,-72,-73,-76,-77,-47,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-74,-116,-78,-115,]),'xEND':([28,34,35,39,40,77,78,112,118,119,122,123,126,127,128,149,179,180,181,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,250,251,255,266,281,294,],[68,-144,-145,-146,-147,134,-30,153,-113,-114,-124,-123,-142,-143,194,213,-112,-111,-110,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,277,278,-31,283,-115,-117,]),'cDEBUG':([30,],[69,]),'aVALUE':([32,77,78,255,],[71,133,-30,-31,]),'aCOLLECTION':([33,129,],[72,196,]),'aITEM':([33,34,35,39,40,118,119,122,123,126,127,128,179,180,181,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,281,294,],[73,-144,-145,-146,-147,-113,-114,-124,-123,-142,-143,195,-112,-111,-110,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,-115,-117,]),'EQUAL':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,155,-113,-114,-124,-123,-142,-143,155,155,155,-112,-111,-110,155,155,155,155,155,-116,None,None,None,None,None,None,-92,-93,-94,-95,-96,155,155,-99,155,155,155,155,-104,-105,155,155,155,155,-125,-126,-136,155,155,155,155,155,155,-115,155,-117,]),'NOTEQUAL':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,156,-113,-114,-124,-123,-142,-143,156,156,156,-112,-111,-110,156,156,156,156,156,-116,None,None,None,None,None,None,-92,-93,-94,-95,-96,156,156,-99,156,156,156,156,-104,-105,156,156,156,156,-125,-126,-136,156,156,156,156,156,156,-115,156,-117,]),'LESSERTHAN':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,157,-113,-114,-124,-123,-142,-143,157,157,157,-112,-111,-110,157,157,157,157,157,-116,None,None,None,None,None,None,-92,-93,-94,-95,-96,157,157,-99,157,157,157,157,-104,-105,157,157,157,157,-125,-126,-136,157,157,157,157,157,157,-115,157,-117,]),'LESSEROREQUAL':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,158,-113,-114,-124,-123,-142,-143,158,158,158,-112,-111,-110,158,158,158,158,158,-116,None,None,None,None,None,None,-92,-93,-94,-95,-96,158,158,-99,158,158,158,158,-104,-105,158,158,158,158,-125,-126,-136,158,158,158,158,158,158,-115,158,-117,]),'GREATERTHAN':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,159,-113,-114,-124,-123,-142,-143,159,159,159,-112,-111,-110,159,159,159,159,159,-116,None,None,None,None,None,None,-92,-93,-94,-95,-96,159,159,-99,159,159,159,159,-104,-105,159,159,159,159,-125,-126,-136,159,159,159,159,159,159,-115,159,-117,]),'GREATEROREQUAL':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,160,-113,-114,-124,-123,-142,-143,160,160,160,-112,-111,-110,160,160,160,160,160,-116,None,None,None,None,None,None,-92,-93,-94,-95,-96,160,160,-99,160,160,160,160,-104,-105,160,160,160,160,-125,-126,-136,160,160,160,160,160,160,-115,160,-117,]),'PLUS':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,161,-113,-114,-124,-123,-142,-143,161,161,161,-112,161,161,161,161,161,161,161,-116,161,161,161,161,161,161,-92,-93,-94,-95,-96,161,161,161,161,161,161,161,161,161,161,161,161,161,-125,-126,-136,161,161,161,161,161,161,-115,161,-117,]),'MINUS':([34,35,39,40,71,72,90,93,114,115,116,117,118,119,121,122,123,124,126,127,128,133,134,135,141,145,149,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,183,187,196,200,201,206,207,208,209,210,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,243,244,245,247,248,251,258,261,270,272,274,275,281,288,294,],[-144,-145,-146,-147,115,115,115,115,162,115,115,115,-113,-114,115,-124,-123,115,-142,-143,162,115,115,115,115,162,162,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,115,-112,162,162,162,162,115,162,162,115,162,115,-116,115,162,162,162,162,162,162,-92,-93,-94,-95,-96,162,162,162,162,162,162,162,162,162,162,162,162,162,-125,-126,115,115,-136,115,115,162,162,162,115,162,162,162,-115,162,-117,]),'MULTIPLY':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,163,-113,-114,-124,-123,-142,-143,163,163,163,-112,163,163,163,163,163,163,163,-116,163,163,163,163,163,163,-92,-93,-94,-95,-96,163,163,163,163,163,163,163,163,163,163,163,163,163,-125,-126,-136,163,163,163,163,163,163,-115,163,-117,]),'MODULUS':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,164,-113,-114,-124,-123,-142,-143,164,164,164,-112,164,164,164,164,164,164,164,-116,164,164,164,164,164,164,-92,-93,-94,-95,-96,164,164,164,164,164,164,164,164,164,164,164,164,164,-125,-126,-136,164,164,164,164,164,164,-115,164,-117,]),'DIVIDE':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,165,-113,-114,-124,-123,-142,-143,165,165,165,-112,165,165,165,165,165,165,165,-116,165,165,165,165,165,165,-92,-93,-94,-95,-96,165,165,165,165,165,165,165,165,165,165,165,165,165,-125,-126,-136,165,165,165,165,165,165,-115,165,-117,]),'AND':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,166,-113,-114,-124,-123,-142,-143,166,166,166,-112,-111,-110,166,166,166,166,166,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,166,-99,-100,-101,-102,-103,-104,-105,166,166,166,166,-125,-126,-136,166,166,166,166,166,166,-115,166,-117,]),'OR':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,167,-113,-114,-124,-123,-142,-143,167,167,167,-112,-111,-110,167,167,167,167,167,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,167,167,167,167,-125,-126,-136,167,167,167,167,167,167,-115,167,-117,]),'BITWISENOT':([34,35,39,40,71,72,90,93,114,115,116,117,118,119,121,122,123,124,126,127,128,133,134,135,141,145,149,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,183,187,196,200,201,206,207,208,209,210,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,243,244,245,247,248,251,258,261,270,272,274,275,281,288,294,],[-144,-145,-146,-147,116,116,116,116,168,116,116,116,-113,-114,116,-124,-123,116,-142,-143,168,116,116,116,116,168,168,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,116,-112,None,None,168,168,116,168,168,116,168,116,-116,116,168,168,168,168,168,168,-92,-93,-94,-95,-96,168,168,None,168,168,168,168,-104,-105,168,168,168,168,-125,-126,116,116,-136,116,116,168,168,168,116,168,168,168,-115,168,-117,]),'BITWISEAND':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,169,-113,-114,-124,-123,-142,-143,169,169,169,-112,-111,-110,169,169,169,169,169,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,169,169,-99,-100,169,169,169,-104,-105,169,169,169,169,-125,-126,-136,169,169,169,169,169,169,-115,169,-117,]),'BITWISEOR':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,251,258,261,268,269,272,274,275,281,288,294,297,],[-144,-145,-146,-147,170,-113,-114,-124,-123,-142,-143,170,170,170,-112,-111,-110,170,170,170,170,170,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,170,170,-99,-100,-101,-102,-103,-104,-105,170,170,170,170,-1,-125,-126,-136,170,170,170,286,-118,170,170,170,-115,170,-117,-119,]),'BITWISEXOR':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,171,-113,-114,-124,-123,-142,-143,171,171,171,-112,-111,-110,171,171,171,171,171,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,171,171,-99,-100,171,-102,171,-104,-105,171,171,171,171,-125,-126,-136,171,171,171,171,171,171,-115,171,-117,]),'PIPE':([34,35,39,40,87,114,118,119,122,123,126,127,128,139,140,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,251,258,259,261,268,269,272,274,275,281,288,294,297,],[-144,-145,-146,-147,-1,172,-113,-114,-124,-123,-142,-143,172,206,-79,172,172,-112,-111,-110,172,172,172,172,172,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,172,172,-99,-100,-101,-102,-103,-104,-105,172,172,172,172,-1,-125,-126,-136,172,172,-80,172,287,-118,172,172,172,-115,172,-117,-119,]),'SHIFTLEFT':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,173,-113,-114,-124,-123,-142,-143,173,173,173,-112,173,173,173,173,173,173,173,-116,173,173,173,173,173,173,-92,-93,-94,-95,-96,173,173,173,173,173,173,173,-104,-105,173,173,173,173,-125,-126,-136,173,173,173,173,173,173,-115,173,-117,]),'SHIFTRIGHT':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,174,-113,-114,-124,-123,-142,-143,174,174,174,-112,174,174,174,174,174,174,174,-116,174,174,174,174,174,174,-92,-93,-94,-95,-96,174,174,174,174,174,174,174,-104,-105,174,174,174,174,-125,-126,-136,174,174,174,174,174,174,-115,174,-117,]),'HAS':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,175,-113,-114,-124,-123,-142,-143,175,175,175,-112,-111,-110,175,175,175,175,175,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,175,175,175,175,-125,-126,-136,175,175,175,175,175,175,-115,175,-117,]),'HAS_I':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,176,-113,-114,-124,-123,-142,-143,176,176,176,-112,-111,-110,176,176,176,176,176,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,176,176,176,176,-125,-126,-136,176,176,176,176,176,176,-115,176,-117,]),'MATCHES':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,177,-113,-114,-124,-123,-142,-143,177,177,177,-112,-111,-110,177,177,177,177,177,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,177,177,177,177,-125,-126,-136,177,177,177,177,177,177,-115,177,-117,]),'MATCHES_I':([34,35,39,40,114,118,119,122,123,126,127,128,145,149,179,180,181,183,187,200,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,251,258,261,272,274,275,281,288,294,],[-144,-145,-146,-147,178,-113,-114,-124,-123,-142,-143,178,178,178,-112,-111,-110,178,178,178,178,178,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,178,178,178,178,-125,-126,-136,178,178,178,178,178,178,-115,178,-117,]),'RPAREN':([34,35,39,40,87,90,118,119,122,123,126,127,139,140,143,144,145,179,180,181,183,204,205,208,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,240,241,242,245,258,259,260,261,268,269,281,284,285,294,295,296,297,],[-144,-145,-146,-147,-1,-1,-113,-114,-124,-123,-142,-143,-1,-79,209,-133,-134,-112,-111,-110,241,257,-81,-1,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-1,-125,-126,-136,-82,-80,281,-135,-1,-118,-115,294,-120,-117,-121,-122,-119,]),'COMMA':([34,35,39,40,90,118,119,122,123,124,125,126,127,143,144,145,179,180,181,184,185,186,187,188,189,190,191,208,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,260,261,271,272,273,274,275,281,294,],[-144,-145,-146,-147,-1,-113,-114,-124,-123,-1,-1,-142,-143,210,-133,-134,-112,-111,-110,243,-127,-128,-130,-131,246,-137,-138,-1,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,210,-135,-129,-132,-139,-140,-141,-115,-117,]),'aMATCHNAME':([34,35,39,40,118,119,122,123,126,127,149,179,180,181,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,281,294,],[-144,-145,-146,-147,-113,-114,-124,-123,-142,-143,214,-112,-111,-110,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,-115,-117,]),'RANGE':([34,35,39,40,118,119,122,123,126,127,179,180,181,187,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,281,294,],[-144,-145,-146,-147,-113,-114,-124,-123,-142,-143,-112,-111,-110,244,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,-115,-117,]),'RBRACKET':([34,35,39,40,118,119,122,123,124,126,127,179,180,181,184,185,186,187,188,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,271,272,281,294,],[-144,-145,-146,-147,-113,-114,-124,-123,-1,-142,-143,-112,-111,-110,242,-127,-128,-130,-131,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,-129,-132,-115,-117,]),'cASSIGN':([34,35,39,40,118,119,122,123,126,127,179,180,181,200,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,281,294,],[-144,-145,-146,-147,-113,-114,-124,-123,-142,-143,-112,-111,-110,254,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,-115,-117,]),'RBRACE':([34,35,39,40,118,119,122,123,125,126,127,179,180,181,189,190,191,201,207,209,216,217,218,219,220,221,222,223,224,225,226,227,228,229,230,231,232,233,234,235,236,237,238,239,241,242,245,273,274,275,281,288,294,],[-144,-145,-146,-147,-113,-114,-124,-123,-1,-142,-143,-112,-111,-110,245,-137,-138,255,259,-116,-86,-87,-88,-89,-90,-91,-92,-93,-94,-95,-96,-97,-98,-99,-100,-101,-102,-103,-104,-105,-106,-107,-108,-109,-125,-126,-136,-139,-140,-141,-115,297,-117,]),'COLON':([34,35,39,40,126,127,192,193,],[-144,-145,-146,-147,-142,-143,247,248,]),'eATTEMPT':([37,],[74,]),'SYMBOL':([42,67,70,71,72,73,89,90,93,115,116,117,120,121,124,125,133,134,135,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,182,195,196,206,208,210,243,244,246,247,248,270,],[78,78,112,122,122,129,142,122,122,122,122,122,142,122,122,193,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,122,240,250,122,122,122,122,122,122,193,122,122,122,]),'aTEST':([48,],[93,]),'NOT':([71,72,90,93,115,116,117,121,124,133,134,135,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,196,206,208,210,243,244,247,248,270,],[117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,117,]),'LPAREN':([71,72,90,93,115,116,117,120,121,124,133,134,135,141,142,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,196,206,208,210,243,244,247,248,270,],[121,121,121,121,121,121,121,182,121,121,121,121,121,121,208,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,121,]),'LBRACKET':([71,72,90,93,115,116,117,121,124,133,134,135,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,196,206,208,210,243,244,247,248,270,],[124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,124,]),'LBRACE':([71,72,78,87,90,93,115,116,117,121,124,133,134,135,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,196,206,208,210,240,243,244,247,248,270,],[125,125,135,141,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,125,270,125,125,125,125,125,]),'NUMBER':([71,72,90,93,115,116,117,121,124,125,133,134,135,141,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,196,206,208,210,243,244,246,247,248,270,286,287,],[126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,126,]),'eEXCEPT':([74,],[130,]),'cCOMMENT':([75,],[131,]),'eCHOOSE':([130,],[197,]),'cRETURN':([131,],[198,]),'oEXCEPT':([136,],[203,]),'eOTHERWISE':([197,],[252,]),'cEVAL':([252,],[279,]),'cINCLUDE':([279,],[291,]),}
 
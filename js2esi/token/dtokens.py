@@ -516,13 +516,13 @@ def t_xmlattrvars_vars_ESCAPEFUNC(t):
 
 
 def t_xmlattrvars_vars_VARREF(t):
-    r'\$\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]+)\)'
+    r'\$\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*)\)'
     t.value = t.lexer.lexmatch.group('symbol')
     return t
 
 
 def t_xmlattrvars_vars_VARREF_more(t):
-    r'\$\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]+)'
+    r'\$\((?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*)'
     t.value = t.lexer.lexmatch.group('symbol')
     t.type = 'VARREF'
     # tbd: this is prolly not the right state... i should really be detecting
@@ -532,7 +532,7 @@ def t_xmlattrvars_vars_VARREF_more(t):
 
 
 def t_xmlattrvars_vars_FUNCCALL(t):
-    r'\$(?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]+)\('
+    r'\$(?P<symbol>[a-zA-Z_][a-zA-Z_0-9-]*)\('
     t.value = t.lexer.lexmatch.group('symbol')
     t.lexer.push_state('exprlist')
     return t
@@ -0,0 +1,155 @@
+""" js2esi.token.tables
+generation (by hand, see below) and loading (at run time) of the ply lexer and
+parser tables.
+
+The tables are pre-generated into this package (``clextab``/``cparsetab``
+for js-to-esi and ``dlextab``/``dparsetab`` for esi-to-js) so that, at run
+time, ply can load them in optimized mode: no regex validation, no grammar
+checks and, most importantly, no table (re)generation or writing. To
+regenerate them after changing a token or grammar module, run:
+
+  python -m js2esi.token.tables
+
+and ``python -m js2esi.token.tables --check`` to verify that they are current.
+"""
+
+import hashlib
+import importlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+from ply import lex, yacc
+from js2esi.token import ctokens, cparser, dtokens, dparser
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# format: (token module, grammar module, lextab module, parsetab module)
+grammars = (
+    (ctokens, cparser, 'clextab', 'cparsetab'),
+    (dtokens, dparser, 'dlextab', 'dparsetab'),
+)
+
+
+def _qualify(tabmodule):
+    return '%s.%s' % (__package__, tabmodule)
+
+
+def _import(tabmodule):
+    try:
+        return importlib.import_module(_qualify(tabmodule))
+    except ImportError:
+        return None
+
+
+def load(tokmod, parsemod, lextab, tabmodule):
+    '''
+    Returns a newly built ``(lexer, parser)`` pair for the specified token and
+    grammar modules. If the pre-generated tables are available, they are
+    loaded in ply's optimized mode. Otherwise, the lexer and parser are built
+    through reflection (slow), but the tables are never written at run time,
+    since the package directory may very well be read-only.
+    '''
+    ltab = _import(lextab)
+    ptab = _import(tabmodule)
+    if ltab is None or ptab is None \
+            or getattr(ltab, '_tabversion', None) != lex.__tabversion__ \
+            or getattr(ptab, '_tabversion', None) != yacc.__tabversion__:
+        return (lex.lex(module=tokmod),
+                yacc.yacc(module=parsemod, tabmodule=tabmodule, debug=0, write_tables=False))
+    return (lex.lex(module=tokmod, optimize=1, lextab=lextab),
+            yacc.yacc(module=parsemod, tabmodule=tabmodule, debug=0, optimize=1,
+                      write_tables=False))
+
+
+def signature(tokmod, parsemod, lextab, tabmodule):
+    '''
+    Returns a digest of the grammar: the parse table signature (which covers
+    the tokens, precedence and rules) as well as the token and grammar module
+    sources (which cover the token regexes and the tree building actions).
+    It changes whenever the parse trees that the grammar builds may change.
+    '''
+    ptab = _import(tabmodule)
+    if ptab is not None and getattr(ptab, '_tabversion', None) == yacc.__tabversion__:
+        sig = ptab._lr_signature
+    else:
+        pinfo = yacc.ParserReflect(vars(parsemod), log=yacc.NullLogger())
+        pinfo.get_all()
+        sig = pinfo.signature()
+    digest = hashlib.sha1(sig.encode('utf-8'))
+    for mod in (tokmod, parsemod):
+        digest.update((_read(os.path.splitext(mod.__file__)[0] + '.py') or '').encode('utf-8'))
+    return digest.hexdigest()
+
+
+def generate(outputdir=None):
+    '''
+    (Re-)generates all lexer and parser tables into ``outputdir`` (default:
+    this package's directory).
+    '''
+    if outputdir is None:
+        outputdir = os.path.dirname(os.path.abspath(__file__))
+    for tokmod, parsemod, lextab, tabmodule in grammars:
+        lex.lex(module=tokmod).writetab(lextab, outputdir)
+        # note: ply only writes the parse tables when it cannot read a
+        #       current version of them, so force a fresh generation...
+        path = os.path.join(outputdir, tabmodule + '.py')
+        if os.path.exists(path):
+            os.unlink(path)
+        sys.modules.pop(_qualify(tabmodule), None)
+        yacc.yacc(module=parsemod, tabmodule=tabmodule, outputdir=outputdir,
+                  debug=0, write_tables=True)
+        sys.modules.pop(_qualify(lextab), None)
+        sys.modules.pop(_qualify(tabmodule), None)
+
+
+def check():
+    '''
+    Returns the list of pre-generated table modules that are missing or that
+    no longer match their token or grammar module.
+    '''
+    ret = []
+    pkgdir = os.path.dirname(os.path.abspath(__file__))
+    tmpdir = tempfile.mkdtemp(prefix='js2esi-tables-')
+    try:
+        for tokmod, parsemod, lextab, tabmodule in grammars:
+            lex.lex(module=tokmod).writetab(lextab, tmpdir)
+            if _read(os.path.join(pkgdir, lextab + '.py')) != _read(os.path.join(tmpdir, lextab + '.py')):
+                ret.append(lextab)
+            ptab = _import(tabmodule)
+            pinfo = yacc.ParserReflect(vars(parsemod), log=yacc.NullLogger())
+            pinfo.get_all()
+            if ptab is None \
+                    or getattr(ptab, '_tabversion', None) != yacc.__tabversion__ \
+                    or ptab._lr_signature != pinfo.signature():
+                ret.append(tabmodule)
+    finally:
+        shutil.rmtree(tmpdir)
+    return ret
+
+
+def _read(path):
+    try:
+        with io.open(path, 'r') as fp:
+            return fp.read()
+    except IOError:
+        return None
+
+
+def main(args=None):  # pragma: no cover
+    args = sys.argv[1:] if args is None else args
+    if '--check' in args:
+        stale = check()
+        for name in stale:
+            print('%s: missing or out of date' % (_qualify(name),), file=sys.stderr)
+        return 1 if stale else 0
+    generate()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,217 @@
+""" js2esi.tools.batch
+compiles (or decompiles) many sources in a single process, sharing the
+lexer/parser, the import resolution and the parsed library modules between
+them (``js2esi --batch``), or across a pool of such processes (``js2esi -j N``).
+"""
+
+import argparse
+import glob
+import io
+import multiprocessing
+import os
+
+from js2esi.tools import main as cli
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def collectSources(args, srcext):
+    '''
+    Expands the command line input arguments (files, directories or globs)
+    into a list of ``(path, relpath)`` tuples, where ``relpath`` is the path
+    that the output should have relative to the output directory. Directories
+    are searched recursively for files ending in ``srcext``.
+    '''
+    ret = []
+    for arg in args:
+        if os.path.isdir(arg):
+            for dirpath, dirnames, filenames in os.walk(arg):
+                dirnames.sort()
+                for fname in sorted(filenames):
+                    if not fname.endswith(srcext):
+                        continue
+                    path = os.path.join(dirpath, fname)
+                    ret.append((path, os.path.relpath(path, arg)))
+            continue
+        if glob.has_magic(arg):
+            base = _globBase(arg)
+            for path in sorted(glob.glob(arg, recursive=True)):
+                if os.path.isfile(path):
+                    ret.append((path, os.path.relpath(path, base)))
+            continue
+        ret.append((arg, os.path.basename(arg)))
+    return ret
+
+
+def _globBase(pattern):
+    # the leading directories of the pattern that contain no wildcards
+    parts = pattern.split(os.sep)
+    for idx, part in enumerate(parts):
+        if glob.has_magic(part):
+            return os.sep.join(parts[:idx]) or os.curdir
+    return os.path.dirname(pattern)
+
+
+def outputPath(path, relpath, outdir, srcext, dstext):
+    if outdir is None:
+        relpath = path
+    else:
+        relpath = os.path.join(outdir, relpath)
+    if relpath.endswith(srcext):
+        relpath = relpath[:-len(srcext)]
+    return relpath + dstext
+
+
+def newContext(base, filename):
+    '''
+    Returns a compilation context for ``filename`` that shares the options,
+    library path and the import caches of the ``base`` context.
+    '''
+    context = cli.Context()
+    context.options = base.options
+    context.errfp = base.errfp
+    context.lib = base.lib
+    context.libindex = base.libindex
+    context.modules = base.modules
+    context.diskcache = base.diskcache
+    context.filename = filename
+    return context
+
+
+def compileOne(base, compiler, path, dst, deps=None):
+    '''
+    Compiles the source at ``path`` into ``dst`` with ``compiler`` (e.g.
+    ``cli.compileScript``), and returns the number of errors encountered.
+    The output file is only written if the compilation succeeds. If ``deps``
+    is specified, the real paths of all the modules that were imported (or
+    that failed to load) are appended to it, even if the compilation fails.
+    '''
+    context = newContext(base, path)
+    out = io.StringIO()
+    try:
+        with io.open(path, 'r') as src:
+            compiler(context, src, out)
+    except cli.CompilationErrors as e:
+        return e.errcnt
+    except Exception as e:
+        context.errfp.write('%s: ERROR: %s\n' % (path, e))
+        return 1
+    finally:
+        if deps is not None:
+            deps.extend(context.imports)
+    dirname = os.path.dirname(dst)
+    if len(dirname) > 0 and not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    with io.open(dst, 'w') as fp:
+        fp.write(out.getvalue())
+    if getattr(context.options, 'deps', None) is not None:
+        cli.writeDeps(context, path, dst)
+    return 0
+
+
+def report(context, path, dst, errcnt):
+    if context.options.quiet:
+        return
+    if errcnt > 0:
+        context.errfp.write('[**] FAILED %s: %d error(s)\n' % (path, errcnt))
+    else:
+        context.errfp.write('[ok] %s => %s\n' % (path, dst))
+
+
+# the per-process state of a pool worker: (context, compiler)
+_worker = None
+
+
+def portableOptions(options):
+    '''
+    Returns a copy of the command line options that can be sent to a worker
+    process, i.e. without the open input/output files.
+    '''
+    return argparse.Namespace(**dict((k, v) for k, v in vars(options).items()
+                                     if not isinstance(v, io.IOBase)))
+
+
+def _initWorker(options, lib, compiler):
+    global _worker
+    context = cli.Context()
+    context.options = options
+    context.lib = lib
+    context.diskcache = cli.openDiskCache(options)
+    _worker = (context, compiler)
+    # warm up the lexer & parser once per worker, not once per source
+    cli.getMachinery(cli.ctokens, cli.cparser, 'clextab', 'cparsetab')
+    cli.getMachinery(cli.dtokens, cli.dparser, 'dlextab', 'dparsetab')
+
+
+def _compileTask(task):
+    path, dst = task
+    context, compiler = _worker
+    context.errfp = io.StringIO()
+    errcnt = compileOne(context, compiler, path, dst)
+    return errcnt, context.errfp.getvalue()
+
+
+def _compileSerial(context, compiler, tasks):
+    for path, dst in tasks:
+        yield compileOne(context, compiler, path, dst), ''
+
+
+def run(context, compiler, srcext, dstext):
+    '''
+    Compiles all sources given on the command line with ``compiler``, writing
+    each one to the output file mapped by :func:`outputPath`. With more than
+    one job, the sources are compiled by a pool of worker processes (each with
+    its own parser and import caches), but errors and the summary are still
+    reported in input order. Returns 0 if all sources compiled, otherwise 100
+    plus the total number of errors. Nothing is compiled if two sources map to
+    the same output file.
+    '''
+    tasks = [(path, outputPath(path, relpath, context.options.outdir, srcext, dstext))
+             for path, relpath in collectSources(context.options.filename, srcext)]
+    # e.g. "s1/foo.js s2/foo.js" both map to "OUTDIR/foo.esi"
+    dsts = dict()
+    clashes = 0
+    for path, dst in tasks:
+        key = os.path.normpath(dst)
+        if key in dsts:
+            context.errfp.write('%s: ERROR: output file %s is also the output of %s\n'
+                                % (path, dst, dsts[key]))
+            clashes += 1
+        else:
+            dsts[key] = path
+    if clashes > 0:
+        return 100 + clashes
+    jobs = context.options.jobs
+    if jobs == 0:
+        jobs = os.cpu_count()
+    jobs = min(jobs or 1, len(tasks))
+    errcnt = 0
+    failed = 0
+    pool = None
+    if jobs > 1:
+        pool = multiprocessing.Pool(jobs, _initWorker,
+                                    (portableOptions(context.options), context.lib, compiler))
+        results = pool.imap(_compileTask, tasks)
+    else:
+        results = _compileSerial(context, compiler, tasks)
+    try:
+        for (path, dst), (count, errors) in zip(tasks, results):
+            context.errfp.write(errors)
+            report(context, path, dst, count)
+            errcnt += count
+            failed += count > 0 and 1 or 0
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    if not context.options.quiet:
+        context.errfp.write('[  ] %d file(s): %d compiled, %d failed\n'
+                            % (len(tasks), len(tasks) - failed, failed))
+        if context.options.verbose and pool is None:
+            context.errfp.write('[  ] module cache: %(hits)d hit(s), %(misses)d miss(es)\n'
+                                % context.modules.stats())
+    if failed > 0:
+        return 100 + errcnt
+    return 0
@@ -0,0 +1,264 @@
+""" js2esi.tools.cache
+caches used to resolve ``require()``'d modules: an index of the JSLIB
+directories (:class:`LibraryIndex`), and the parsed modules, in memory for the
+lifetime of the process (:class:`ModuleCache`) and on disk, across runs
+(:class:`DiskCache`).
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def fileSignature(path):
+    '''
+    Returns the ``(mtime, size)`` signature of the file at ``path``, which
+    changes whenever the file is modified, or None if it cannot be stat'ed.
+    '''
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class LibraryIndex(object):
+    '''
+    An index of the files in the JSLIB lookup directories. Each directory is
+    listed (not recursively) the first time that an import is looked up in
+    it, so that resolving an import takes a set lookup per JSLIB directory
+    instead of an ``open()`` attempt, and only the directories that imports
+    actually use are ever read. Since the index would not notice files that
+    are created or removed afterwards, long-running callers must call
+    :meth:`refresh` before each compilation.
+    '''
+
+    def __init__(self):
+        # directory => (signature, frozenset of the names of its files)
+        self.dirs = {}
+
+    def listing(self, dirpath):
+        '''
+        Returns the names of the files in ``dirpath`` (none if it does not
+        exist), listing it on first use.
+        '''
+        entry = self.dirs.get(dirpath)
+        if entry is None:
+            # note: a non-existent directory is kept too, to watch for its creation
+            signature = fileSignature(dirpath)
+            try:
+                with os.scandir(dirpath) as it:
+                    names = frozenset(e.name for e in it if e.is_file())
+            except OSError:
+                names = frozenset()
+            entry = self.dirs[dirpath] = (signature, names)
+        return entry[1]
+
+    def find(self, libs, relpath):
+        '''
+        Returns the index of the first directory in ``libs`` that contains
+        the file ``relpath`` (which must be normalized), or None.
+        '''
+        dirname, basename = os.path.split(relpath)
+        for idx, lib in enumerate(libs):
+            if basename in self.listing(os.path.normpath(os.path.join(lib, dirname))):
+                return idx
+        return None
+
+    def refresh(self):
+        '''
+        Forgets the directories whose contents changed since they were
+        listed, and returns the list of those directories.
+        '''
+        ret = [dirpath for dirpath, (signature, names) in self.dirs.items()
+               if fileSignature(dirpath) != signature]
+        for dirpath in ret:
+            del self.dirs[dirpath]
+        return ret
+
+
+def indexable(relpath):
+    '''
+    Returns whether the import path ``relpath`` can be looked up in a
+    :class:`LibraryIndex`, i.e. whether it stays within the lookup directory.
+    '''
+    relpath = os.path.normpath(relpath)
+    return not os.path.isabs(relpath) \
+        and relpath != os.pardir and not relpath.startswith(os.pardir + os.sep)
+
+
+class ModuleCache(object):
+    '''
+    An in-process cache of parsed (but not import-resolved) module trees,
+    keyed by real path and validated against the file's modification time
+    and size. The cached trees must never be handed out directly, since
+    import resolution and optimization rewrite the tree: callers must copy
+    them (see ``js2esi.tools.main.loadModule``).
+    '''
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, realpath):
+        entry = self.entries.get(realpath)
+        if entry is not None and entry[0] == fileSignature(realpath):
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        return None
+
+    def put(self, realpath, tree, signature=None):
+        '''
+        Stores ``tree`` for ``realpath``. The ``signature`` should be the
+        file signature taken *before* the file was read (if omitted, it is
+        taken now), so that a concurrent modification invalidates the entry.
+        '''
+        if signature is None:
+            signature = fileSignature(realpath)
+        self.entries[realpath] = (signature, tree)
+
+    def __contains__(self, realpath):
+        return realpath in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        return dict(entries=len(self.entries), hits=self.hits, misses=self.misses)
+
+
+# the process-wide cache, shared by all compilations that do not provide
+# their own (see ``js2esi.tools.main.Context``)
+modules = ModuleCache()
+
+
+# the default size cap of the on-disk cache, in bytes
+DEFAULT_MAXSIZE = 64 * 1024 * 1024
+
+# the fraction of the size cap that eviction prunes the on-disk cache down
+# to, so that it does not walk the cache again on every write at the cap
+PRUNE_RATIO = 0.75
+
+
+def defaultCacheDir():
+    '''
+    Returns the default on-disk cache directory: ``$XDG_CACHE_HOME/js2esi``,
+    or ``~/.cache/js2esi`` if XDG_CACHE_HOME is not set.
+    '''
+    base = os.environ.get('XDG_CACHE_HOME', '') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'js2esi')
+
+
+class DiskCache(object):
+    '''
+    A content-addressed on-disk cache of parsed module trees. Entries are
+    keyed by a digest of the module source and of ``salt``, which must
+    identify everything else that the tree depends on (i.e. the js2esi
+    version and the grammar signature), and are stored as pickles (so the
+    cache directory must only be writable by trusted users). Once the entries
+    exceed ``maxsize`` bytes, the least recently used ones are evicted, down
+    to :data:`PRUNE_RATIO` of ``maxsize``. The cache is strictly an
+    accelerator: any failure to read or write it is treated as a miss.
+    '''
+
+    def __init__(self, path, salt, maxsize=DEFAULT_MAXSIZE):
+        self.path = path
+        self.salt = salt
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # the total size of the entries, once known (it is only computed,
+        # by walking the cache directory, by the first put())
+        self.size = None
+
+    def entryPath(self, data):
+        digest = hashlib.sha256(self.salt.encode('utf-8'))
+        digest.update(data.encode('utf-8'))
+        key = digest.hexdigest()
+        return os.path.join(self.path, key[:2], key + '.pickle')
+
+    def get(self, data):
+        path = self.entryPath(data)
+        try:
+            with open(path, 'rb') as fp:
+                tree = pickle.load(fp)
+            # "touch" the entry, which is what the LRU eviction goes by
+            os.utime(path)
+        except Exception:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return tree
+
+    def put(self, data, tree):
+        path = self.entryPath(data)
+        if self.size is None:
+            self.size = sum(e[1] for e in self.entries())
+        replaced = fileSignature(path)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmppath = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as fp:
+                    pickle.dump(tree, fp, pickle.HIGHEST_PROTOCOL)
+                os.replace(tmppath, path)
+            except BaseException:
+                os.unlink(tmppath)
+                raise
+        except (OSError, pickle.PicklingError, RecursionError):
+            return
+        signature = fileSignature(path)
+        self.size += (signature is not None and signature[1] or 0) - (replaced is not None and replaced[1] or 0)
+        if self.size > self.maxsize:
+            self.prune(int(self.maxsize * PRUNE_RATIO))
+
+    def entries(self):
+        '''
+        Returns the list of ``(mtime, size, path)`` of all cache entries.
+        '''
+        ret = []
+        for dirpath, dirnames, filenames in os.walk(self.path):
+            for fname in filenames:
+                if not fname.endswith('.pickle'):
+                    continue
+                path = os.path.join(dirpath, fname)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                ret.append((st.st_mtime_ns, st.st_size, path))
+        return ret
+
+    def prune(self, target=None):
+        '''
+        Evicts the least recently used entries until the cache fits in
+        ``target`` bytes (by default, ``maxsize``).
+        '''
+        if target is None:
+            target = self.maxsize
+        entries = self.entries()
+        total = sum(e[1] for e in entries)
+        for mtime, size, path in sorted(entries):
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        self.size = total
+
+    def stats(self):
+        return dict(hits=self.hits, misses=self.misses)
@@ -0,0 +1,58 @@
+""" js2esi.tools.deps
+dependency files (``js2esi --deps make|json``), listing all the files that a
+compilation read, so that external build systems can tell when an output is
+out of date.
+"""
+
+import io
+import json
+import os
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# format => default dependency file extension (appended to the output path)
+FORMATS = {
+    'make': '.d',
+    'json': '.deps.json',
+}
+
+
+def makeEscape(path):
+    return path.replace('\\', '\\\\').replace(' ', '\\ ').replace('#', '\\#').replace('$', '$$')
+
+
+def formatMake(target, sources):
+    '''
+    Returns a Makefile rule making ``target`` depend on ``sources``, plus an
+    empty rule for each imported module (as ``gcc -MP`` does), so that
+    removing a module does not break the build.
+    '''
+    lines = ['%s: %s' % (makeEscape(target), ' \\\n  '.join(makeEscape(e) for e in sources))]
+    for source in sources[1:]:
+        lines.append('')
+        lines.append('%s:' % (makeEscape(source),))
+    return '\n'.join(lines) + '\n'
+
+
+def formatJson(target, sources):
+    return json.dumps(dict(target=target, sources=sources), indent=2) + '\n'
+
+
+def depsPath(target, fmt):
+    return target + FORMATS[fmt]
+
+
+def write(path, fmt, target, sources):
+    '''
+    Writes the dependency file ``path`` in the format ``fmt`` (one of
+    :data:`FORMATS`), stating that ``target`` was built from ``sources``
+    (i.e. the compiled source, followed by all the modules it imported).
+    '''
+    text = {'make': formatMake, 'json': formatJson}[fmt](target, sources)
+    dirname = os.path.dirname(path)
+    if len(dirname) > 0 and not os.path.isdir(dirname):
+        os.makedirs(dirname)
+    with io.open(path, 'w') as fp:
+        fp.write(text)
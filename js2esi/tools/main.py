@@ -10,14 +10,15 @@ if sys.version_info < (3, 5):
     print("# js2esi only supports Python 3.5 and above! #", file=sys.stderr)
     print("#" * 49, file=sys.stderr)
 
+import copy  # noqa
 import errno  # noqa
 import os  # noqa
 import io  #noqa
+import json  # noqa
 
-from js2esi.tools import util  # noqa
-from ply import lex, yacc   # noqa
-from js2esi.token import ctokens, cparser, dtokens, dparser  # noqa
-from js2esi import node  # noqa
+from js2esi.tools import cache, deps, util  # noqa
+from js2esi.token import ctokens, cparser, dtokens, dparser, tables  # noqa
+from js2esi import node, version  # noqa
 
 
 __author__ = "Colin Bendell"
@@ -69,16 +70,49 @@ class Context(object):
     def __init__(self):
         self.lib = []
         self.imports = []
+        self.libindex = cache.LibraryIndex()
+        self.modules = cache.modules
+        self.diskcache = None
+
+
+# the built lexers and parsers, keyed by parse table module. building them
+# loads the token regexes and the parse tables, so it is done once per process
+# instead of once per source/import.
+_machinery = {}
+
+
+def getMachinery(tokmod, parsemod, lextab, tabmodule):
+    '''
+    Returns a ``(lexer, parser)`` pair for the specified token and grammar
+    modules. The parser is shared (ply resets all parse state on every
+    ``parse()`` call), but the lexer is a fresh clone of a pristine,
+    never-used lexer, so it is safe to attach per-source attributes to it.
+    '''
+    if tabmodule not in _machinery:
+        _machinery[tabmodule] = tables.load(tokmod, parsemod, lextab, tabmodule)
+    master, parser = _machinery[tabmodule]
+    lexer = master.clone()
+    # note: clone() is a shallow copy, so the state stack must not be shared
+    #       with the master lexer...
+    lexer.lexstatestack = []
+    lexer.begin('INITIAL')
+    lexer.lineno = 1
+    return lexer, parser
+
+
+def clearMachinery():
+    _machinery.clear()
 
 
 def js2node(context, src):
     # build the lexer
-    lexer = lex.lex(module=ctokens)
+    lexer, parser = getMachinery(ctokens, cparser, 'clextab', 'cparsetab')
 
     # pull in the script
     lexer.filename = context.filename
     lexer.data = src.read()
     lexer.errcnt = 0
+    lexer.chains = []
     lexer.errfp = context.errfp
     lexer.error = makeErrorHandler(lexer)
     lexer.getcol = lambda t: getTokenColumn(t.lexer.data, t)
@@ -98,16 +132,9 @@ def js2node(context, src):
             result.append(line)
         return result
 
-    # build the parser
-    # yacc(method='LALR', debug=1, module=None, tabmodule='parsetab',
-    #      start=None, check_recursion=1, optimize=0, write_tables=1,
-    #      debugfile='parser.out', outputdir='', debuglog=None,
-    #      errorlog=None, picklefile=None)
-    parser = yacc.yacc(module=cparser, tabmodule='cparsetab', debug=0)
-    lexer.parser = parser
-
     # yaccmode
-    result = parser.parse(lexer.data, debug=0)
+    lexer.parser = parser
+    result = parser.parse(lexer.data, lexer=lexer, debug=0)
 
     if lexer.errcnt > 0:
         raise CompilationErrors(lexer.errcnt)
@@ -115,20 +142,42 @@ def js2node(context, src):
     return result
 
 
-def node2esi(context, src, dst):
-    if context.options.warn:
-        dst.write('<esi:comment text="\n')
-        dst.write('---- WARNING: GENERATED ESI ----')
-        dst.write('\n"/>')
+def node2esi(context, src, dst, size=None, ctxt=None):
+    # size: whether to emit the shortest ESI (default: as per -Os)
+    # ctxt: the node.Context to render with (e.g. a sizereport.CountingContext)
+    if size is None:
+        size = getattr(context.options, 'size', False)
+    if ctxt is None:
+        ctxt = node.Context()
+    ctxt.size = size
+    ctxt.out = node.Writer(dst)
+    if context.options.warn and not size:
+        ctxt.write('<esi:comment text="\n')
+        ctxt.write('---- WARNING: GENERATED ESI ----')
+        ctxt.write('\n"/>')
 
-    ctxt = node.Context()
-    ctxt.out = dst
     src.esi(ctxt)
+    ctxt.out.flush()
+
+
+def reportSize(context, tree, output):
+    '''
+    Reports how many bytes the size mode (-Os) saved in ``output``, the ESI
+    of ``tree``, compared to the generic ESI.
+    '''
+    generic = io.StringIO()
+    node2esi(context, tree, generic, size=False)
+    before = len(generic.getvalue().encode('utf-8'))
+    after = len(output.encode('utf-8'))
+    if not getattr(context.options, 'quiet', False):
+        print('[  ] %s: %d bytes, %d bytes saved by -Os (%d bytes without)'
+              % (context.filename, after, before - after, before), file=context.errfp)
+    return before - after
 
 
 def esi2node(context, src):
     # build the lexer
-    lexer = lex.lex(module=dtokens)
+    lexer, parser = getMachinery(dtokens, dparser, 'dlextab', 'dparsetab')
 
     # pull in the script
     lexer.filename = context.filename
@@ -153,16 +202,9 @@ def esi2node(context, src):
             result.append(line)
         return result
 
-    # build the parser
-    # yacc(method='LALR', debug=1, module=None, tabmodule='parsetab',
-    #      start=None, check_recursion=1, optimize=0, write_tables=1,
-    #      debugfile='parser.out', outputdir='', debuglog=None,
-    #      errorlog=None, picklefile=None)
-    parser = yacc.yacc(module=dparser, tabmodule='dparsetab', debug=0)
-    lexer.parser = parser
-
     # yaccmode
-    result = parser.parse(lexer.data, debug=0)
+    lexer.parser = parser
+    result = parser.parse(lexer.data, lexer=lexer, debug=0)
 
     if lexer.errcnt > 0:
         raise DecompilationErrors(lexer.errcnt)
@@ -172,51 +214,253 @@ def esi2node(context, src):
 
 def node2js(context, src, dst):
     ctxt = node.Context()
-    ctxt.out = dst
+    ctxt.out = node.Writer(dst)
     src.js(ctxt)
+    ctxt.out.flush()
+
+
+def findImport(context, src, frompath):
+    '''
+    Returns the path of the first lookup directory (the JSLIB path, then the
+    directory of the importing file) that contains ``src``, or None. The
+    JSLIB directories are looked up in ``context.libindex``, which can be
+    shared between compilations (e.g. in batch mode).
+    '''
+    if cache.indexable(src):
+        found = context.libindex.find(context.lib, os.path.normpath(src))
+    else:
+        found = None
+        for idx, lib in enumerate(context.lib):
+            if os.path.isfile(os.path.join(lib, src)):
+                found = idx
+                break
+    if context.options.verbose >= 3:
+        for lib in context.lib[:found]:
+            context.errfp.write('[  ]   tried "%s" and failed: file not found\n'
+                                % (os.path.abspath(os.path.join(lib, src)),))
+    if found is not None:
+        path = os.path.abspath(os.path.join(context.lib[found], src))
+        if context.options.verbose >= 3:
+            context.errfp.write('[  ]   tried "%s": found\n' % (path,))
+        return path
+    path = os.path.abspath(os.path.join(os.path.dirname(frompath), src))
+    try:
+        io.open(path, 'r').close()
+    except Exception as e:
+        if context.options.verbose >= 3:
+            if hasattr(e, 'errno') and e.errno == errno.ENOENT:
+                context.errfp.write('[  ]   tried "%s" and failed: file not found\n' % (path,))
+            else:
+                context.errfp.write('[  ]   tried "%s" and failed: %s\n' % (path, e))
+        return None
+    if context.options.verbose >= 3:
+        context.errfp.write('[  ]   tried "%s": found\n' % (path,))
+    return path
+
+
+def openDiskCache(options):
+    '''
+    Returns the on-disk module cache selected by the command line options,
+    or None if it is not enabled (``--cache``).
+    '''
+    if not getattr(options, 'cache', False):
+        return None
+    salt = '%s:%d:%s' % (version.VERSION, node.LAYOUT,
+                         tables.signature(ctokens, cparser, 'clextab', 'cparsetab'))
+    return cache.DiskCache(options.cache_dir or cache.defaultCacheDir(), salt)
+
+
+def isLibraryModule(context, path):
+    '''
+    Returns whether the module at ``path`` is in one of the JSLIB lookup
+    directories (as opposed to, e.g., next to the importing file).
+    '''
+    path = os.path.abspath(path)
+    return any(path.startswith(os.path.join(os.path.abspath(lib), '')) for lib in context.lib)
+
+
+def loadModule(context, path, realpath):
+    '''
+    Returns a private copy of the (unresolved) tree of the module at ``path``.
+    Parsed modules are kept in ``context.modules`` (by default, the
+    process-wide ``cache.modules``) for as long as the file is unchanged and,
+    if enabled and the module is in a JSLIB directory, in the on-disk
+    ``context.diskcache`` across runs.
+    '''
+    tree = context.modules.get(realpath)
+    if tree is not None:
+        if context.options.verbose >= 2:
+            context.errfp.write('[  ] using cached parse of "%s"\n' % (path,))
+        return copy.deepcopy(tree)
+    signature = cache.fileSignature(realpath)
+    with io.open(path, 'r') as fp:
+        data = fp.read()
+    diskcache = context.diskcache
+    if diskcache is not None and not isLibraryModule(context, path):
+        diskcache = None
+    if diskcache is not None:
+        tree = diskcache.get(data)
+        if tree is not None and context.options.verbose >= 2:
+            context.errfp.write('[  ] using on-disk cached parse of "%s"\n' % (path,))
+    if tree is None:
+        tree = js2node(context, io.StringIO(data))
+        if diskcache is not None:
+            diskcache.put(data, tree)
+    context.modules.put(realpath, tree, signature)
+    return copy.deepcopy(tree)
+
+
+class _ImportResolver(node.Visitor):
+    def __init__(self, context):
+        self.context = context
+        self.frompath = context.filename
+
+    def visit_Import(self, imp):
+        # note: the imported module is resolved as it is loaded
+        if imp.inline is None:
+            resolveImport(self.context, imp, self.frompath)
+        return node.SKIP
 
 
 def resolveImports(context, tree):
-    frompath = context.filename
-    for imp in node.util.allchildren(tree):
-        if not isinstance(imp, node.Import):
-            continue
-        if imp.inline is not None:
-            continue
-        if context.options.verbose:
-            context.errfp.write('[  ] resolving import of "%s" from "%s"...\n' % (imp.src, frompath))
-        fp = None
-        for lib in context.lib + [os.path.dirname(frompath)]:
-            path = os.path.abspath(os.path.join(lib, imp.src))
-            try:
-                fp = io.open(path, 'r')
-            except Exception as e:
-                if context.options.verbose >= 3:
-                    if hasattr(e, 'errno') and e.errno == errno.ENOENT:
-                        context.errfp.write('[  ]   tried "%s" and failed: file not found\n' % (path,))
-                    else:
-                        context.errfp.write('[  ]   tried "%s" and failed: %s\n' % (path, e))
-                fp = None
-                continue
-            break
-        if fp is None:
-            context.errfp.write('[**] ERROR: could not find import "%s"\n' % (imp.src,))
-            raise CompilationErrors(1)
-        realpath = os.path.realpath(path)
-        if not imp.force and realpath in context.imports:
-            if context.options.verbose >= 2:
-                context.errfp.write('[  ] skipping import of "%s" (already imported)\n' % (path,))
-            # tbd: *HACKALERT*... this is really just letting the "la
-            imp.inline = node.Block()
-            continue
-        if context.options.verbose:
-            context.errfp.write('[  ] importing "%s"...\n' % (path,))
-        context.filename = path
-        subtree = js2node(context, fp)
-        fp.close()
-        context.imports.append(realpath)
-        resolveImports(context, subtree)
-        imp.inline = subtree
+    _ImportResolver(context).walk(tree)
+
+
+def resolveImport(context, imp, frompath):
+    if context.options.verbose:
+        context.errfp.write('[  ] resolving import of "%s" from "%s"...\n' % (imp.src, frompath))
+    path = findImport(context, imp.src, frompath)
+    if path is None:
+        context.errfp.write('[**] ERROR: could not find import "%s"\n' % (imp.src,))
+        raise CompilationErrors(1)
+    realpath = os.path.realpath(path)
+    if not imp.force and realpath in context.imports:
+        if context.options.verbose >= 2:
+            context.errfp.write('[  ] skipping import of "%s" (already imported)\n' % (path,))
+        # tbd: *HACKALERT*... this is really just letting the "la
+        imp.inline = node.Block()
+        return
+    if context.options.verbose:
+        context.errfp.write('[  ] importing "%s"...\n' % (path,))
+    context.filename = path
+    context.imports.append(realpath)
+    subtree = loadModule(context, path, realpath)
+    resolveImports(context, subtree)
+    imp.inline = subtree
+
+
+def readKeepList(path):
+    '''
+    Returns the names listed in the keep-list file ``path`` (whitespace
+    separated, with "#" starting a comment), i.e. the variables and
+    functions that optimization level 9 must not rename.
+    '''
+    ret = []
+    with io.open(path) as fp:
+        for line in fp:
+            ret.extend(line.split('#', 1)[0].split())
+    return ret
+
+
+def writeRenames(path, renames):
+    '''
+    Writes the renames done by optimization level 9 to ``path``, as JSON.
+    '''
+    with io.open(path, 'w') as fp:
+        fp.write(json.dumps(renames, indent=2, sort_keys=True) + '\n')
+
+
+def checkCost(context, tree):
+    '''
+    Estimates the edge-execution cost of ``tree`` (see ``node.cost``):
+    reports it (``--cost-report``), and fails the compilation if the worst
+    path of the script's top level code costs more than ``--max-cost``.
+    '''
+    from js2esi.node import cost
+    report = cost.CostModel(tree).report()
+    path = getattr(context.options, 'cost_report', None)
+    if path is not None:
+        context.errfp.write(cost.formatTable(report))
+        with io.open(path, 'w') as fp:
+            fp.write(json.dumps(report, indent=2, sort_keys=True) + '\n')
+    limit = getattr(context.options, 'max_cost', None)
+    if limit is not None and report['script']['worst'] > limit:
+        context.errfp.write('[**] ERROR: %s: worst-case cost %d exceeds the maximum (%d)\n'
+                            % (context.filename, report['script']['worst'], limit))
+        raise CompilationErrors(1)
+    return report
+
+
+def compileScript(context, src, dst):
+    tree = js2node(context, src)
+    # note: resolving the imports sets the filename to each module's
+    filename = context.filename
+    resolveImports(context, tree)
+    context.filename = filename
+    keep = getattr(context.options, 'keep', None)
+    renames = dict(variables=dict(), functions=dict())
+    report = getattr(context.options, 'size_report', None)
+    origins = None
+    if report is not None:
+        from js2esi.tools import sizereport
+        origins = sizereport.Origins().attach()
+    try:
+        tree = tree.optimize(context.options.optlevel,
+                             keep=keep is not None and readKeepList(keep) or (),
+                             renames=renames)
+    finally:
+        if origins is not None:
+            origins.detach()
+    if getattr(context.options, 'cost_report', None) is not None \
+            or getattr(context.options, 'max_cost', None) is not None:
+        checkCost(context, tree)
+    # TODO:
+    # if options.verbose:
+    #   print >>sys.stderr, '[  ] resolving inlined functions...'
+    ctxt = None
+    if report is not None:
+        ctxt = sizereport.CountingContext(origins.sites)
+    if getattr(context.options, 'size', False):
+        out = io.StringIO()
+        node2esi(context, tree, out, ctxt=ctxt)
+        reportSize(context, tree, out.getvalue())
+        dst.write(out.getvalue())
+    else:
+        node2esi(context, tree, dst, ctxt=ctxt)
+    if report is not None:
+        report = ctxt.report(context.filename)
+        context.errfp.write(sizereport.formatTable(report))
+        sizereport.write(context.options.size_report, report)
+    if getattr(context.options, 'rename_map', None) is not None:
+        writeRenames(context.options.rename_map, renames)
+
+
+def writeDeps(context, source, target, path=None):
+    '''
+    If enabled (``--deps``), writes the dependency file of the compilation
+    of ``source`` into ``target`` to ``path`` (default: next to ``target``).
+    '''
+    if context.options.deps is None:
+        return
+    if path is None:
+        path = deps.depsPath(target, context.options.deps)
+    deps.write(path, context.options.deps, target, [source] + context.imports)
+
+
+def decompileScript(context, src, dst):
+    node2js(context, esi2node(context, src), dst)
+
+
+class OptimizeAction(argparse.Action):
+    # -O LEVEL, or -Os: the size mode, which combines with the level
+    def __call__(self, parser, namespace, value, option_string=None):
+        if value == 's':
+            namespace.size = True
+            return
+        try:
+            setattr(namespace, self.dest, int(value))
+        except ValueError:
+            raise argparse.ArgumentError(self, 'invalid level: %r' % (value,))
 
 
 def common_options():
@@ -262,12 +506,96 @@ def common_options():
                         help='decompile ESI to js')
 
     parser.add_argument('-O', '--optimize', metavar='LEVEL',
-                        action='store', dest='optlevel', default=7, type=int,
+                        action=OptimizeAction, dest='optlevel', default=7,
                         help='optimization level (range: 0 to 9,'
                              ' default: 7) - note that level 9 should only'
-                             ' be used for completely independent ESI scripts')
-    parser.add_argument('filename', type=argparse.FileType('r'),
-                        help='inputfilename', default=sys.stdin)
+                             ' be used for completely independent ESI scripts;'
+                             ' "s" (-Os) also emits the shortest ESI (no comments,'
+                             ' merged string literals, shortest quoting) and'
+                             ' reports the bytes saved')
+    parser.set_defaults(size=False)
+    parser.add_argument('--keep', metavar='FILE',
+                        action='store', dest='keep', default=None,
+                        help='with -O 9: do not rename the variables and functions'
+                             ' listed in FILE (whitespace separated, "#" comments)')
+
+    parser.add_argument('--rename-map', metavar='FILE',
+                        action='store', dest='rename_map', default=None,
+                        help='with -O 9: write the renamed variables and functions'
+                             ' (old name => new name) to FILE, as JSON (single'
+                             ' input file only)')
+
+    parser.add_argument('--size-report', metavar='FILE',
+                        action='store', dest='size_report', default=None,
+                        help='report how many bytes of the ESI come from each function,'
+                             ' module, inlined call site and literal (on stderr),'
+                             ' and write the report to FILE, as JSON (single input'
+                             ' file only)')
+
+    parser.add_argument('--cost-report', metavar='FILE',
+                        action='store', dest='cost_report', default=None,
+                        help='estimate the cost of executing the script at the edge'
+                             ' (worst and typical path, of the script and of each'
+                             ' function), print it on stderr and write it to FILE,'
+                             ' as JSON (single input file only)')
+
+    parser.add_argument('--max-cost', metavar='N',
+                        action='store', dest='max_cost', default=None, type=int,
+                        help='fail if the estimated worst-case cost of the script'
+                             ' exceeds N (see --cost-report)')
+
+    parser.add_argument('filename', nargs='*', default=[],
+                        help='inputfilename (with --batch: any number of files,'
+                             ' directories or globs)')
+
+    parser.add_argument('-b', '--batch',
+                        action='store_true', dest='batch', default=False,
+                        help='compile all input files in a single process, writing'
+                             ' each one to a file of the same name with the'
+                             ' output extension (e.g. foo.js => foo.esi)')
+
+    parser.add_argument('-j', '--jobs', metavar='N',
+                        action='store', dest='jobs', default=None, type=int,
+                        help='compile the input files across N worker processes'
+                             ' (0: one per CPU) - implies --batch')
+
+    parser.add_argument('--watch',
+                        action='store_true', dest='watch', default=False,
+                        help='keep running and recompile the input files whenever'
+                             ' they, or a module that they import, change'
+                             ' - implies --batch')
+
+    parser.add_argument('--outdir', metavar='DIR',
+                        action='store', dest='outdir', default=None,
+                        help='with --batch: write the output files into DIR'
+                             ' instead of next to their source')
+
+    parser.add_argument('--deps', metavar='FORMAT',
+                        action='store', dest='deps', default=None,
+                        choices=sorted(deps.FORMATS.keys()),
+                        help='also write the list of files that each compilation'
+                             ' read, as a Makefile rule ("make") or as JSON ("json"),'
+                             ' next to the output (e.g. foo.esi.d or foo.esi.deps.json)')
+
+    parser.add_argument('--deps-file', metavar='FILE',
+                        action='store', dest='deps_file', default=None,
+                        help='write the dependency file to FILE instead (single'
+                             ' input file only, with --output)')
+
+    parser.add_argument('--cache',
+                        action='store_true', dest='cache', default=False,
+                        help='read and write the on-disk cache of parsed JSLIB'
+                             ' modules (which are stored as pickles)')
+
+    parser.add_argument('--no-cache',
+                        action='store_false', dest='cache',
+                        help='do not read or write the on-disk cache of parsed'
+                             ' JSLIB modules (the default)')
+
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        action='store', dest='cache_dir', default=None,
+                        help='keep the on-disk cache of parsed JSLIB modules in DIR'
+                             ' (default: $XDG_CACHE_HOME/js2esi)')
 
     parser.add_argument('-o', '--output', type=argparse.FileType('w'),
                         help='outputfilename', default=sys.stdout)
@@ -282,9 +610,34 @@ def process_options(args, extra=None):  # pragma: no cover
 
     context = Context()
     context.options = options
-    context.src = options.filename
-    context.filename = options.filename.name
+    context.src = None
+    context.filename = None
     context.errfp = sys.stderr
+    if options.jobs is not None or options.watch:
+        options.batch = True
+    if options.deps_file is not None:
+        if options.batch:
+            parser.error('--deps-file cannot be used with --batch')
+        if options.deps is None:
+            options.deps = 'make'
+    if options.rename_map is not None and options.batch:
+        parser.error('--rename-map cannot be used with --batch')
+    if options.size_report is not None and options.batch:
+        parser.error('--size-report cannot be used with --batch')
+    if options.cost_report is not None and options.batch:
+        parser.error('--cost-report cannot be used with --batch')
+    if not options.batch and not options.version:
+        if len(options.filename) > 1:
+            parser.error('multiple input files require --batch')
+        # i.e. the target of the rule
+        if options.deps is not None and options.output is sys.stdout:
+            parser.error(options.deps_file is None and '--deps requires --output'
+                         or '--deps-file requires --output')
+        try:
+            context.src = argparse.FileType('r')((options.filename or ['-'])[0])
+        except argparse.ArgumentTypeError as e:
+            parser.error(str(e))
+        context.filename = context.src.name
 
     context.lib = os.environ.get('JSLIB', '').split(':') + options.lib
     context.lib = [e for e in context.lib if len(e) > 0]
@@ -296,6 +649,7 @@ def process_options(args, extra=None):  # pragma: no cover
     if options.version:
         print(util.dump_system_info())
         sys.exit(0)
+    context.diskcache = openDiskCache(options)
     if options.quiet :
         options.verbosity = 0
 
@@ -304,6 +658,12 @@ def process_options(args, extra=None):  # pragma: no cover
 
 def esi2js(args=None):  # pragma: no cover
     context = process_options(args)
+    if context.options.batch:
+        if context.options.watch:
+            from js2esi.tools import watch
+            return watch.run(context, decompileScript, '.esi', '.js')
+        from js2esi.tools import batch
+        return batch.run(context, decompileScript, '.esi', '.js')
     try:
         # TODO: warn user about not supporting correct precedence rules?...
 
@@ -317,12 +677,27 @@ def esi2js(args=None):  # pragma: no cover
         elif context.options.node:
             sys.stdout.write(str(tree))
         else:
-            node2js(context, tree, sys.stdout)
+            node2js(context, tree, context.options.output)
+            writeDeps(context, context.src.name, context.options.output.name,
+                      context.options.deps_file)
     except CompilationErrors as e:
         return 100 + e.errcnt
 
 def js2esi(args=None):  # pragma: no cover
+    args = sys.argv[1:] if args is None else args
+    if len(args) > 0 and args[0] == 'serve':
+        from js2esi.tools import serve
+        return serve.main(args[1:])
+    if len(args) > 0 and args[0] == 'run':
+        from js2esi.tools import run
+        return run.main(args[1:])
     context = process_options(args)
+    if context.options.batch:
+        if context.options.watch:
+            from js2esi.tools import watch
+            return watch.run(context, compileScript, '.js', '.esi')
+        from js2esi.tools import batch
+        return batch.run(context, compileScript, '.js', '.esi')
     try:
         # TODO: warn user about not supporting correct precedence rules?...
         if context.options.verbose:
@@ -333,22 +708,23 @@ def js2esi(args=None):  # pragma: no cover
                 print('[  ] library include path (in order of precedence):', file=sys.stderr)
                 for lib in context.lib:
                     print('[  ]  ', lib, file=sys.stderr)
-        tree = js2node(context, context.src)
-        if context.options.lex:
-            for e in tree:
-                sys.stdout.write(e)
-                sys.stdout.write('\n')
-        elif context.options.node:
-            sys.stdout.write(str(tree))
+        if context.options.lex or context.options.node:
+            tree = js2node(context, context.src)
+            if context.options.lex:
+                for e in tree:
+                    sys.stdout.write(e)
+                    sys.stdout.write('\n')
+            else:
+                sys.stdout.write(str(tree))
         else:
-            resolveImports(context, tree)
-            tree.optimize(context.options.optlevel)
-            # TODO:
-            # if options.verbose:
-            #   print >>sys.stderr, '[  ] resolving inlined functions...'
-            node2esi(context, tree, sys.stdout)
+            compileScript(context, context.src, context.options.output)
+            writeDeps(context, context.src.name, context.options.output.name,
+                      context.options.deps_file)
     except CompilationErrors as e:
         return 100 + e.errcnt
 
 if __name__ == '__main__':
-    sys.exit(js2esi())
+    # note: delegating to the importable module (instead of this "__main__"
+    #       copy of it) so that helper modules share the same state & classes
+    from js2esi.tools import main
+    sys.exit(main.js2esi())
@@ -0,0 +1,166 @@
+""" js2esi.tools.run
+runs a script offline (``js2esi run``): compiles it (unless it is ESI already),
+executes the ESI with the local interpreter (see :mod:`js2esi.node.interpreter`)
+against a mock request, and prints the output. The operation counts and their
+cost are reported on stderr, and optionally as JSON (``--report FILE``).
+
+Includes and evals are served from the stub files of a directory
+(``--includes DIR``), e.g. "http://example.com/a/b.html" from "DIR/a/b.html"
+(or from "DIR/example.com/a/b.html", if that exists).
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+
+from js2esi.node import interpreter
+from js2esi.tools import main as cli
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+
+def _pair(sep):
+    # NAME<sep>VALUE
+    def parse(value):
+        if sep not in value:
+            raise argparse.ArgumentTypeError('expected NAME%sVALUE, not %r' % (sep.strip(), value))
+        name, value = value.split(sep, 1)
+        return name.strip(), value.strip()
+    return parse
+
+
+def makeRequest(options):
+    '''
+    Returns the mock :class:`interpreter.Request` of the command line
+    ``options``.
+    '''
+    return interpreter.Request(headers=dict(options.headers),
+                               cookies=len(options.cookies) > 0 and dict(options.cookies) or None,
+                               query=options.query, method=options.method, path=options.path,
+                               remoteAddr=options.remote_addr)
+
+
+def makeParser(context):
+    '''
+    Returns a function that parses ESI text (e.g. fetched by an eval) into a
+    tree, reporting errors to ``context.errfp``.
+    '''
+    def parse(text):
+        return cli.esi2node(context, io.StringIO(text))
+    return parse
+
+
+def load(context, src, esi=None):
+    '''
+    Returns the tree of the ESI of the script ``src``: as is if ``esi`` (by
+    default, if the filename ends with ".esi"), or else compiled from js at
+    ``context.options.optlevel``. Note: compiled ESI is parsed back, so that
+    what runs is what the edge would run; its errors are reported against
+    "FILENAME (compiled)".
+    '''
+    if esi is None:
+        esi = context.filename.endswith('.esi')
+    if esi:
+        return cli.esi2node(context, src)
+    out = io.StringIO()
+    cli.compileScript(context, src, out)
+    filename = context.filename
+    context.filename = '%s (compiled)' % (filename,)
+    try:
+        return cli.esi2node(context, io.StringIO(out.getvalue()))
+    finally:
+        context.filename = filename
+
+
+def formatCounts(report):
+    '''
+    Returns the operation counts of the interpreter ``report`` (see
+    :meth:`interpreter.Interpreter.report`) on one line.
+    '''
+    counts = ', '.join('%s: %d' % e for e in sorted(report['counts'].items()))
+    return '%d bytes of output, cost %d (%s)' % (report['bytes'], report['cost'], counts or 'no operations')
+
+
+def common_options():
+    parser = argparse.ArgumentParser(prog='js2esi run', usage='%(prog)s [options] <src>',
+                                     description='executes a script (js, or ESI) locally, against a'
+                                                 ' mock request, and prints its output')
+    parser.add_argument('src', metavar='SRC',
+                        help='the script to run: ".esi" files are executed as is, others'
+                             ' are compiled from js first')
+    parser.add_argument('-O', '--optimize', metavar='LEVEL',
+                        action='store', dest='optlevel', default=7, type=int,
+                        help='compile at optimization level LEVEL (default: 7)')
+    parser.add_argument('-L', '--library',
+                        action='append', dest='lib', default=[],
+                        help='add the specified directory to the JSLIB lookup path')
+    parser.add_argument('--esi',
+                        action='store_true', dest='esi', default=None,
+                        help='execute SRC as ESI, whatever its extension')
+    parser.add_argument('-H', '--header', metavar='NAME:VALUE',
+                        action='append', dest='headers', default=[], type=_pair(':'),
+                        help='add the request header NAME (e.g. "User-Agent: curl")')
+    parser.add_argument('-c', '--cookie', metavar='NAME=VALUE',
+                        action='append', dest='cookies', default=[], type=_pair('='),
+                        help='add the request cookie NAME')
+    parser.add_argument('-q', '--query', metavar='QUERY',
+                        action='store', dest='query', default='',
+                        help='the request query string (e.g. "a=1&b=2")')
+    parser.add_argument('--method', metavar='METHOD',
+                        action='store', dest='method', default='GET',
+                        help='the request method (default: GET)')
+    parser.add_argument('--path', metavar='PATH',
+                        action='store', dest='path', default='/',
+                        help='the request path (default: /)')
+    parser.add_argument('--remote-addr', metavar='ADDR',
+                        action='store', dest='remote_addr', default='127.0.0.1',
+                        help='the client address (default: 127.0.0.1)')
+    parser.add_argument('-I', '--includes', metavar='DIR',
+                        action='store', dest='includes', default=None,
+                        help='serve includes and evals from the files in DIR')
+    parser.add_argument('-o', '--output', metavar='FILENAME',
+                        action='store', dest='output', default=None,
+                        help='write the output to FILENAME (default: stdout)')
+    parser.add_argument('--report', metavar='FILE',
+                        action='store', dest='report', default=None,
+                        help='write the output, the operation counts, their cost and the'
+                             ' response headers to FILE, as JSON')
+    return parser
+
+
+def main(args=None):  # pragma: no cover
+    options = common_options().parse_args(args)
+    context = cli.Context()
+    context.filename = options.src
+    context.errfp = sys.stderr
+    context.options = argparse.Namespace(verbose=0, lex=False, node=False, deps=None, warn=False,
+                                         optlevel=options.optlevel)
+    context.lib = [e for e in os.environ.get('JSLIB', '').split(':') + options.lib if len(e) > 0]
+    machine = interpreter.Interpreter(makeRequest(options), options.includes, makeParser(context))
+    try:
+        with io.open(options.src) as src:
+            tree = load(context, src, options.esi)
+        machine.run(tree)
+    except cli.CompilationErrors as e:
+        return 100 + e.errcnt
+    except interpreter.InterpreterError as e:
+        print('[**] ERROR: %s: %s' % (options.src, e), file=sys.stderr)
+        return 1
+    report = machine.report()
+    if options.output is None:
+        sys.stdout.write(report['output'])
+    else:
+        with io.open(options.output, 'w') as fp:
+            fp.write(report['output'])
+    print('[  ] %s: %s' % (options.src, formatCounts(report)), file=sys.stderr)
+    if report['status'] is not None or len(report['headers']) > 0:
+        print('[  ] response: %s %s' % (report['status'] or 200,
+                                        ', '.join('%s: %s' % e for e in report['headers'])), file=sys.stderr)
+    if options.report is not None:
+        with io.open(options.report, 'w') as fp:
+            fp.write(json.dumps(report, indent=2, sort_keys=True) + '\n')
+    return 0
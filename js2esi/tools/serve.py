@@ -0,0 +1,267 @@
+""" js2esi.tools.serve
+a long-running local compile server (``js2esi serve``), which keeps the
+parsers, the JSLIB index and the parsed library modules resident, so that
+frequent callers (editor plugins, hooks, templating services) do not pay the
+python and ply start-up costs on every compilation.
+
+The protocol is HTTP, over a localhost TCP port or a Unix socket:
+
+  POST /compile
+    request body (JSON):
+      {"source": "...",          (required) the js (or ESI, if decompiling)
+       "filename": "foo.js",     the name used in errors and to resolve
+                                 relative imports (default: "<source>")
+       "optlevel": 7,            the optimization level (default: 7)
+       "lib": ["/path", ...],    JSLIB directories, searched before the ones
+                                 that the server was started with
+       "warn": true,             include the generated ESI warning
+       "decompile": false}       decompile ESI to js instead
+    response body (JSON):
+      {"ok": true, "output": "..."}
+    or, if the compilation failed (still with a 200 status):
+      {"ok": false, "errcnt": 1,
+       "errors": [{"filename": "foo.js", "line": 1, "column": 5,
+                   "message": "..."}, ...]}
+
+  GET /status
+    the server's version, uptime, request count and cache statistics.
+"""
+
+import argparse
+import http.server
+import io
+import json
+import os
+import re
+import socket
+import socketserver
+import sys
+import time
+
+from js2esi import version
+from js2esi.tools import cache, main as cli
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+DEFAULT_PORT = 8797
+
+# the largest accepted request body, in bytes
+MAX_REQUEST = 16 * 1024 * 1024
+
+# format: FILENAME@LINE,COLUMN: ERROR: MESSAGE (see ``cli.makeErrorHandler``)
+_located = re.compile(r'^(?P<filename>.*)@(?P<line>\d+),(?P<column>\d+): ERROR: (?P<message>.*)$')
+_unlocated = re.compile(r'^(?:\[\*\*\] )?(?:(?P<filename>.*): )?ERROR: (?P<message>.*)$')
+
+
+def parseErrors(text):
+    '''
+    Converts the error messages written by a compilation into a list of
+    ``{filename, line, column, message}`` dicts (with None for the parts
+    that the message does not specify).
+    '''
+    ret = []
+    for line in text.splitlines():
+        match = _located.match(line)
+        if match is not None:
+            ret.append(dict(filename=match.group('filename'), line=int(match.group('line')),
+                            column=int(match.group('column')), message=match.group('message')))
+            continue
+        match = _unlocated.match(line)
+        if match is not None:
+            ret.append(dict(filename=match.group('filename'), line=None, column=None,
+                            message=match.group('message')))
+    return ret
+
+
+class Server(object):
+    '''
+    The state that the server keeps across requests: the JSLIB index, the
+    in-memory and on-disk module caches and some statistics. The lexers and
+    parsers are kept by ``cli.getMachinery``.
+    '''
+
+    def __init__(self, lib=None, diskcache=None):
+        self.lib = list(lib or [])
+        self.libindex = cache.LibraryIndex()
+        self.modules = cache.modules
+        self.diskcache = diskcache
+        self.started = time.time()
+        self.requests = 0
+        self.failures = 0
+
+    def warmup(self):
+        cli.getMachinery(cli.ctokens, cli.cparser, 'clextab', 'cparsetab')
+        cli.getMachinery(cli.dtokens, cli.dparser, 'dlextab', 'dparsetab')
+
+    def compile(self, request):
+        '''
+        Compiles (or decompiles) the ``request`` dict (see the module
+        documentation), and returns the response dict.
+        '''
+        self.requests += 1
+        if not isinstance(request.get('source'), str):
+            self.failures += 1
+            return dict(ok=False, errcnt=1, errors=[dict(filename=None, line=None, column=None,
+                                                        message='missing "source"')])
+        context = cli.Context()
+        context.filename = request.get('filename') or '<source>'
+        context.errfp = io.StringIO()
+        context.libindex = self.libindex
+        context.modules = self.modules
+        context.diskcache = self.diskcache
+        # pick up library files that were added or removed since the last request
+        self.libindex.refresh()
+        out = io.StringIO()
+        src = io.StringIO(request['source'])
+        try:
+            context.options = argparse.Namespace(verbose=0, lex=False, node=False, deps=None,
+                                                 warn=bool(request.get('warn', True)),
+                                                 optlevel=int(request.get('optlevel', 7)))
+            context.lib = [str(e) for e in request.get('lib') or []] + self.lib
+            if request.get('decompile'):
+                cli.decompileScript(context, src, out)
+            else:
+                cli.compileScript(context, src, out)
+        except cli.CompilationErrors as e:
+            self.failures += 1
+            return dict(ok=False, errcnt=e.errcnt, errors=parseErrors(context.errfp.getvalue()))
+        except Exception as e:
+            # e.g. a node.StructureError raised by the optimizer
+            self.failures += 1
+            errors = parseErrors(context.errfp.getvalue())
+            errors.append(dict(filename=context.filename, line=None, column=None, message=str(e)))
+            return dict(ok=False, errcnt=len(errors), errors=errors)
+        return dict(ok=True, output=out.getvalue())
+
+    def status(self):
+        return dict(version=version.VERSION, uptime=round(time.time() - self.started, 3),
+                    requests=self.requests, failures=self.failures, lib=self.lib,
+                    modules=self.modules.stats(),
+                    diskcache=self.diskcache.stats() if self.diskcache is not None else None)
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    server_version = 'js2esi/' + version.VERSION
+
+    def sendJson(self, code, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(code)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/status':
+            return self.sendJson(200, self.server.js2esi.status())
+        self.sendJson(404, dict(error='not found'))
+
+    def do_POST(self):
+        if self.path != '/compile':
+            return self.sendJson(404, dict(error='not found'))
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            return self.sendJson(411, dict(error='missing Content-Length'))
+        if length > MAX_REQUEST:
+            return self.sendJson(413, dict(error='request too large'))
+        try:
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+            if not isinstance(request, dict):
+                raise ValueError('expected a JSON object')
+        except ValueError as e:
+            return self.sendJson(400, dict(error='invalid request: %s' % (e,)))
+        self.sendJson(200, self.server.js2esi.compile(request))
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super(Handler, self).log_message(format, *args)
+
+
+class UnixServer(socketserver.UnixStreamServer):
+
+    def get_request(self):
+        # note: the client address of a Unix socket is not a (host, port),
+        #       which the request logging expects
+        request, address = super(UnixServer, self).get_request()
+        return request, ('local', 0)
+
+
+def makeServer(state, host='127.0.0.1', port=DEFAULT_PORT, path=None, verbose=0):
+    '''
+    Returns a server for ``state`` listening on the Unix socket ``path``, or
+    (if not specified) on ``host``:``port``. Requests are handled one at a
+    time, since the parsers and the caches are shared (and compilations are
+    CPU-bound anyway).
+    '''
+    if path is not None:
+        if os.path.exists(path):
+            # remove a stale socket, but only if nothing is listening on it
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+            except OSError:
+                os.unlink(path)
+            else:
+                probe.close()
+                raise OSError('%s: a server is already listening' % (path,))
+        server = UnixServer(path, Handler)
+    else:
+        server = http.server.HTTPServer((host, port), Handler)
+    server.js2esi = state
+    server.verbose = verbose
+    return server
+
+
+def common_options():
+    parser = argparse.ArgumentParser(prog='js2esi serve', usage='%(prog)s [options]',
+                                     description='runs a local js2esi compile server')
+    parser.add_argument('--host', metavar='HOST',
+                        action='store', dest='host', default='127.0.0.1',
+                        help='listen on HOST (default: 127.0.0.1)')
+    parser.add_argument('--port', metavar='PORT',
+                        action='store', dest='port', default=DEFAULT_PORT, type=int,
+                        help='listen on PORT (default: %d)' % (DEFAULT_PORT,))
+    parser.add_argument('--socket', metavar='PATH',
+                        action='store', dest='socket', default=None,
+                        help='listen on the Unix socket PATH instead of a TCP port')
+    parser.add_argument('-L', '--library',
+                        action='append', dest='lib', default=[],
+                        help='add the specified directory to the JSLIB lookup path')
+    parser.add_argument('-v', '--verbose',
+                        action='count', dest='verbose', default=0,
+                        help='log every request')
+    parser.add_argument('--cache',
+                        action='store_true', dest='cache', default=False,
+                        help='read and write the on-disk cache of parsed JSLIB'
+                             ' modules (which are stored as pickles)')
+    parser.add_argument('--no-cache',
+                        action='store_false', dest='cache',
+                        help='do not read or write the on-disk cache of parsed'
+                             ' JSLIB modules (the default)')
+    parser.add_argument('--cache-dir', metavar='DIR',
+                        action='store', dest='cache_dir', default=None,
+                        help='keep the on-disk cache of parsed JSLIB modules in DIR'
+                             ' (default: $XDG_CACHE_HOME/js2esi)')
+    return parser
+
+
+def main(args=None):  # pragma: no cover
+    options = common_options().parse_args(args)
+    lib = [e for e in os.environ.get('JSLIB', '').split(':') + options.lib if len(e) > 0]
+    state = Server(lib, cli.openDiskCache(options))
+    state.warmup()
+    server = makeServer(state, options.host, options.port, options.socket, options.verbose)
+    where = options.socket or 'http://%s:%d/' % server.server_address[:2]
+    print('[  ] js2esi %s serving on %s' % (version.VERSION, where), file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if options.socket is not None and os.path.exists(options.socket):
+            os.unlink(options.socket)
+    return 0
@@ -0,0 +1,233 @@
+""" js2esi.tools.sizereport
+output size attribution (``js2esi --size-report FILE``): how many bytes of the
+generated ESI come from each function, each imported module, each inlined call
+site and each literal.
+
+The optimizer is followed with an :class:`Origins` observer (which notes the
+expressions that replace inlined calls), and the ESI is rendered with a
+:class:`CountingContext`, which attributes every write to the nodes being
+rendered at the time.
+"""
+
+import io
+import json
+
+from js2esi import node
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# the labels of the bytes that are not in a function, or not in a module
+TOPLEVEL = '(top level)'
+
+# the number of rows of each table (the JSON report has them all)
+ROWS = 20
+
+
+class Origins(object):
+    '''
+    Follows the replacements done by the optimizer (see
+    :meth:`node.Item.replace`), and maps the expressions that inlined calls
+    were replaced with (or their own replacements, e.g. once folded) to the
+    original :class:`node.FunctionCall`. Must be attached (see
+    :meth:`attach`, or use it as a context manager) while optimizing.
+    '''
+
+    def __init__(self):
+        self.sites = dict()
+
+    def __enter__(self):
+        return self.attach()
+
+    def __exit__(self, *args):
+        self.detach()
+
+    def attach(self):
+        node.base._observers.append(self)
+        return self
+
+    def detach(self):
+        if self in node.base._observers:
+            node.base._observers.remove(self)
+
+    def replaced(self, old, new):
+        # note: only inlining replaces function calls
+        site = self.sites.pop(old, None)
+        if site is None and isinstance(old, node.FunctionCall):
+            site = old
+        if site is not None:
+            self.sites[new] = site
+
+    def removed(self, old):
+        self.sites.pop(old, None)
+
+
+class _Hierarchy(list):
+    # the stack of the nodes being rendered (``Context.nodehier``), which
+    # keeps the attribution of the innermost one alongside: (function,
+    # module, inlined call site, literal).
+
+    def __init__(self, sites):
+        super(_Hierarchy, self).__init__()
+        self.sites = sites
+        self.origins = [(None, None, None, None)]
+
+    def append(self, item):
+        function, module, site, literal = self.origins[-1]
+        if isinstance(item, node.FunctionDefinition):
+            function = item.name
+        elif isinstance(item, node.Import):
+            module = item.src
+        elif isinstance(item, node.Literal):
+            literal = item
+        site = self.sites.get(item, site)
+        self.origins.append((function, module, site, literal))
+        super(_Hierarchy, self).append(item)
+
+    def pop(self):
+        self.origins.pop()
+        return super(_Hierarchy, self).pop()
+
+
+class _Buffered(str):
+    # text rendered into a buffer (see CountingContext.pop_buffered), which
+    # carries its records along until it is written out. note: it is a
+    # distinct object even if its text is not (e.g. an interned string), and
+    # the text derived from it (e.g. by concatenation) is a plain str.
+    pass
+
+
+class CountingContext(node.Context):
+    '''
+    A :class:`node.Context` that records, for every write, the attribution of
+    the node being rendered (see :meth:`report`). Text rendered into a buffer
+    (see :meth:`push_buffered`) is attributed when it is written out, to the
+    nodes that rendered it.
+    '''
+
+    def __init__(self, sites=None):
+        super(CountingContext, self).__init__()
+        self.nodehier = _Hierarchy(sites or dict())
+        # one list of (attribution, text) per buffer level
+        self.records = [[]]
+
+    def record(self, text):
+        if isinstance(text, _Buffered):
+            self.records[-1].extend(text.records)
+        elif len(text) > 0:
+            self.records[-1].append((self.nodehier.origins[-1], text))
+
+    def write(self, msg):
+        self.record(msg)
+        self.out.write(msg)
+
+    def fill(self, idx, text):
+        self.record(text)
+        super(CountingContext, self).fill(idx, text)
+
+    def push_buffered(self):
+        super(CountingContext, self).push_buffered()
+        self.records.append([])
+
+    def pop_buffered(self):
+        ret = _Buffered(super(CountingContext, self).pop_buffered())
+        ret.records = self.records.pop()
+        return ret
+
+    def report(self, filename=None):
+        '''
+        Returns the size report of what was written, as a dict (see
+        :func:`formatTable`): the bytes by function, by module (``filename``
+        for the compiled script itself), by inlined call site (numbered in
+        document order, per function) and by literal.
+        '''
+        total = 0
+        functions = dict()
+        modules = dict()
+        sites = dict()
+        literals = dict()
+        for (function, module, site, literal), text in self.records[0]:
+            size = len(text.encode('utf-8'))
+            total += size
+            function = function or TOPLEVEL
+            module = module or filename or TOPLEVEL
+            functions[function] = functions.get(function, 0) + size
+            modules[module] = modules.get(module, 0) + size
+            if site is not None:
+                entry = sites.get(site)
+                if entry is None:
+                    entry = sites[site] = dict(function=site.name, caller=function, module=module, bytes=0)
+                entry['bytes'] += size
+            if literal is not None:
+                entry = literals.get(literal)
+                if entry is None:
+                    entry = literals[literal] = ['', 0]
+                entry[0] += text
+                entry[1] += size
+        numbers = dict()
+        inlined = []
+        for entry in sites.values():
+            entry['site'] = numbers[entry['function']] = numbers.get(entry['function'], 0) + 1
+            inlined.append(entry)
+        # the same literal may be rendered in many places
+        bytext = dict()
+        for text, size in literals.values():
+            entry = bytext.get(text)
+            if entry is None:
+                entry = bytext[text] = dict(literal=text, count=0, bytes=0)
+            entry['count'] += 1
+            entry['bytes'] += size
+        return dict(
+            total=total,
+            functions=_sorted([dict(function=k, bytes=v) for k, v in functions.items()]),
+            modules=_sorted([dict(module=k, bytes=v) for k, v in modules.items()]),
+            inlined=_sorted(inlined),
+            literals=_sorted(list(bytext.values())),
+        )
+
+
+def _sorted(rows):
+    # largest first (the sort is stable: ties stay in document order)
+    return sorted(rows, key=lambda row: -row['bytes'])
+
+
+def _short(text, width=60):
+    # a literal, on a single line
+    text = text.replace('\\', '\\\\').replace('\n', '\\n').replace('\t', '\\t')
+    return len(text) > width and text[:width - 3] + '...' or text
+
+
+def _table(title, rows, label, total, rows_max=ROWS):
+    lines = ['%s:' % (title,)]
+    for row in rows[:rows_max]:
+        lines.append('  %8d %5.1f%%  %s' % (row['bytes'], total and 100.0 * row['bytes'] / total or 0, label(row)))
+    if len(rows) > rows_max:
+        lines.append('  ... and %d more' % (len(rows) - rows_max,))
+    if len(rows) == 0:
+        lines.append('  (none)')
+    return lines
+
+
+def formatTable(report):
+    '''
+    Returns the size ``report`` (see :meth:`CountingContext.report`) as a
+    text table, the largest contributions first.
+    '''
+    total = report['total']
+    lines = ['total: %d bytes' % (total,)]
+    lines += _table('by function', report['functions'], lambda row: row['function'], total)
+    lines += _table('by module', report['modules'], lambda row: row['module'], total)
+    lines += _table('by inlined call site', report['inlined'],
+                    lambda row: '%s() #%d in %s' % (row['function'], row['site'], row['caller']), total)
+    lines += _table('by literal', report['literals'],
+                    lambda row: '%s (x%d)' % (_short(row['literal']), row['count']), total)
+    return '\n'.join(lines) + '\n'
+
+
+def write(path, report):
+    '''
+    Writes the size ``report`` to ``path``, as JSON.
+    '''
+    with io.open(path, 'w') as fp:
+        fp.write(json.dumps(report, indent=2, sort_keys=True) + '\n')
@@ -51,10 +51,12 @@ def dump_system_info():
         "Python version: {}".format(platform.python_version()),
         "Platform: {}".format(platform.platform()),
     ]
-    d = platform.linux_distribution()
-    t = "Linux distro: %s %s %s" % d
-    if d[0]:  # pragma: no cover
-        data.append(t)
+    # note: platform.linux_distribution() was removed in python 3.8
+    if hasattr(platform, 'linux_distribution'):
+        d = platform.linux_distribution()
+        t = "Linux distro: %s %s %s" % d
+        if d[0]:  # pragma: no cover
+            data.append(t)
 
     d = platform.mac_ver()
     t = "Mac version: %s %s %s" % d
@@ -0,0 +1,129 @@
+""" js2esi.tools.watch
+watches the input sources and the modules that they import, and recompiles
+only the sources affected by a change (``js2esi --watch``).
+"""
+
+import os
+import time
+
+from js2esi.tools import batch, cache
+
+__author__ = "Colin Bendell"
+__copyright__ = "Copyright 2017, Akamai Technologies"
+__license__ = "Apache2"
+
+# the delay between two checks for changes, in seconds
+INTERVAL = 0.5
+
+
+class Watcher(object):
+    '''
+    Tracks the dependency graph of the sources given on the command line:
+    for each source, the real paths of the source itself and of all the
+    modules that it (transitively) imports. Each :meth:`poll` recompiles the
+    sources that are new, that failed to compile last time, or that depend
+    on a file that changed since. Unchanged modules are not parsed again,
+    since their parse trees stay in ``context.modules``.
+    '''
+
+    def __init__(self, context, compiler, srcext, dstext):
+        self.context = context
+        self.compiler = compiler
+        self.srcext = srcext
+        self.dstext = dstext
+        # source path => set of the real paths that it depends on
+        self.graph = {}
+        # real path => file signature when last compiled
+        self.signatures = {}
+        self.failed = set()
+
+    def tasks(self):
+        return [(path, batch.outputPath(path, relpath, self.context.options.outdir,
+                                        self.srcext, self.dstext))
+                for path, relpath in batch.collectSources(self.context.options.filename,
+                                                          self.srcext)]
+
+    def changed(self):
+        '''
+        Returns the set of the real paths that changed since they were last
+        compiled.
+        '''
+        return set(path for path, signature in self.signatures.items()
+                   if cache.fileSignature(path) != signature)
+
+    def affected(self, path, changed, rescanned):
+        if path not in self.graph:
+            return True
+        if path in self.failed:
+            return len(changed) > 0 or rescanned
+        # note: a file that is added to (or removed from) a library directory
+        #       may change the resolution of any import...
+        if rescanned and len(self.graph[path]) > 1:
+            return True
+        return len(self.graph[path] & changed) > 0
+
+    def poll(self):
+        '''
+        Recompiles the affected sources, and returns the list of
+        ``(path, dst, errcnt)`` of the sources that were recompiled.
+        '''
+        tasks = self.tasks()
+        rescanned = len(self.context.libindex.refresh()) > 0
+        changed = self.changed()
+        current = set(path for path, dst in tasks)
+        for path in list(self.graph.keys()):
+            if path not in current:
+                del self.graph[path]
+                self.failed.discard(path)
+        ret = []
+        for path, dst in tasks:
+            if not self.affected(path, changed, rescanned):
+                continue
+            signature = cache.fileSignature(path)
+            deps = []
+            errcnt = batch.compileOne(self.context, self.compiler, path, dst, deps)
+            self.graph[path] = set([os.path.realpath(path)] + deps)
+            self.signatures[os.path.realpath(path)] = signature
+            for dep in deps:
+                if dep not in self.signatures or dep in changed:
+                    self.signatures[dep] = cache.fileSignature(dep)
+            if errcnt > 0:
+                self.failed.add(path)
+            else:
+                self.failed.discard(path)
+            ret.append((path, dst, errcnt))
+        # forget the files that no source depends on anymore
+        needed = set()
+        for deps in self.graph.values():
+            needed |= deps
+        for path in list(self.signatures.keys()):
+            if path not in needed:
+                del self.signatures[path]
+        return ret
+
+
+def run(context, compiler, srcext, dstext, interval=INTERVAL):  # pragma: no cover
+    '''
+    Compiles all sources given on the command line, then recompiles the
+    affected sources whenever a source or an imported module changes, until
+    interrupted.
+    '''
+    watcher = Watcher(context, compiler, srcext, dstext)
+    first = True
+    try:
+        while True:
+            results = watcher.poll()
+            if len(results) > 0 or first:
+                for path, dst, errcnt in results:
+                    batch.report(context, path, dst, errcnt)
+                if not context.options.quiet:
+                    failed = len([e for e in results if e[2] > 0])
+                    context.errfp.write('[  ] %d file(s): %d compiled, %d failed;'
+                                        ' watching %d file(s) for changes...\n'
+                                        % (len(results), len(results) - failed, failed,
+                                           len(watcher.signatures)))
+                context.errfp.flush()
+            first = False
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        return 0
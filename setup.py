@@ -18,6 +18,7 @@ with open(os.path.join(here, 'README.md'), encoding='utf-8') as f:
 
 VERSION = runpy.run_path(os.path.join(here, "js2esi", "version.py"))["VERSION"]
 
+
 setup(
     name="js2esi",
     version=VERSION,